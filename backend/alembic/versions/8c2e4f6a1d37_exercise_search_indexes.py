@@ -0,0 +1,41 @@
+"""exercise full-text and trigram search indexes
+
+Revision ID: 8c2e4f6a1d37
+Revises: 3f1d2c9a7b41
+Create Date: 2026-10-18 14:02:47.518230
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8c2e4f6a1d37'
+down_revision: Union[str, None] = '3f1d2c9a7b41'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    # must stay identical to app.models.exercise.EXERCISE_SEARCH_VECTOR to be used by queries
+    op.create_index(
+        'ix_exercise_search',
+        'exercise',
+        [sa.text("(setweight(to_tsvector('english', name), 'A') || setweight(to_tsvector('english', description), 'B'))")],
+        postgresql_using='gin',
+    )
+    op.create_index(
+        'ix_exercise_name_trgm',
+        'exercise',
+        ['name'],
+        postgresql_using='gin',
+        postgresql_ops={'name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_exercise_name_trgm', table_name='exercise')
+    op.drop_index('ix_exercise_search', table_name='exercise')
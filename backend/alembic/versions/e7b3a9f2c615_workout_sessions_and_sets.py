@@ -0,0 +1,79 @@
+"""workout sessions and sets partitioned by month
+
+Revision ID: e7b3a9f2c615
+Revises: d41a7e95c0b2
+Create Date: 2026-10-18 17:41:12.904518
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b3a9f2c615'
+down_revision: Union[str, None] = 'd41a7e95c0b2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# partitions of the current and next months, later ones are created by create_partitions.py
+INITIAL_PARTITIONS = 4
+
+
+def _add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def upgrade() -> None:
+    op.create_table('workoutsession',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('started_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.Column('ended_at', sa.DateTime(), nullable=True),
+    sa.Column('notes', sa.String(), server_default='', nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_workoutsession_id'), 'workoutsession', ['id'], unique=False)
+    op.create_index(op.f('ix_workoutsession_user_id'), 'workoutsession', ['user_id'], unique=False)
+    # partitioned tables need the partition key in their primary key
+    op.create_table('setentry',
+    sa.Column('id', sa.BigInteger(), sa.Identity(), nullable=False),
+    sa.Column('session_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('exercise_id', sa.Integer(), nullable=False),
+    sa.Column('reps', sa.Integer(), nullable=False),
+    sa.Column('weight', sa.Float(), server_default='0', nullable=False),
+    sa.Column('performed_at', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['exercise_id'], ['exercise.id'], ),
+    sa.ForeignKeyConstraint(['session_id'], ['workoutsession.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['user.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', 'performed_at'),
+    postgresql_partition_by='RANGE (performed_at)'
+    )
+    op.create_index(op.f('ix_setentry_session_id'), 'setentry', ['session_id'], unique=False)
+    op.create_index('ix_setentry_user_exercise_performed_at', 'setentry', ['user_id', 'exercise_id', 'performed_at'], unique=False)
+    op.create_index('ix_setentry_performed_at_brin', 'setentry', ['performed_at'], unique=False, postgresql_using='brin')
+
+    op.execute('CREATE TABLE setentry_default PARTITION OF setentry DEFAULT')
+    month = date.today().replace(day=1)
+    for offset in range(INITIAL_PARTITIONS):
+        start = _add_months(month, offset)
+        op.execute(
+            f"CREATE TABLE setentry_{start:%Y_%m} PARTITION OF setentry "
+            f"FOR VALUES FROM ('{start}') TO ('{_add_months(start, 1)}')"
+        )
+
+
+def downgrade() -> None:
+    # dropping the partitioned table drops its partitions
+    op.drop_index('ix_setentry_performed_at_brin', table_name='setentry')
+    op.drop_index('ix_setentry_user_exercise_performed_at', table_name='setentry')
+    op.drop_index(op.f('ix_setentry_session_id'), table_name='setentry')
+    op.drop_table('setentry')
+    op.drop_index(op.f('ix_workoutsession_user_id'), table_name='workoutsession')
+    op.drop_index(op.f('ix_workoutsession_id'), table_name='workoutsession')
+    op.drop_table('workoutsession')
@@ -1,4 +1,13 @@
 # Import all the models, so that Base has them before being
 # imported by Alembic
 from app.core.database import Base
-from app.models import User, Exercise, Category
+from app.models import (
+    User,
+    Exercise,
+    Category,
+    WorkoutSession,
+    SetEntry,
+    WeeklyRollup,
+    WeeklyExerciseRollup,
+    PersonalRecord,
+)
@@ -1,7 +1,26 @@
 from fastapi import APIRouter
 
-from app.endpoints import users, login
+from app.endpoints import (
+    batch,
+    categories,
+    exercises,
+    leaderboards,
+    login,
+    metrics,
+    training,
+    users,
+    workouts,
+)
 
 api_router = APIRouter()
 api_router.include_router(login.router, tags=["login"])
 api_router.include_router(users.router, prefix="/users", tags=["users"])
+api_router.include_router(training.router, prefix="/users/me", tags=["training"])
+api_router.include_router(categories.router, prefix="/categories", tags=["categories"])
+api_router.include_router(exercises.router, prefix="/exercises", tags=["exercises"])
+api_router.include_router(metrics.router, prefix="/metrics", tags=["metrics"])
+api_router.include_router(workouts.router, prefix="/workouts", tags=["workouts"])
+api_router.include_router(
+    leaderboards.router, prefix="/leaderboards", tags=["leaderboards"]
+)
+api_router.include_router(batch.router, prefix="/batch", tags=["batch"])
@@ -0,0 +1,211 @@
+import asyncio
+import logging
+from typing import Any, Iterator, NamedTuple, Sequence
+
+import orjson
+from fastapi import FastAPI, Request
+from fastapi.middleware.asyncexitstack import AsyncExitStackMiddleware
+from starlette.middleware.exceptions import ExceptionMiddleware
+from starlette.types import ASGIApp, Message, Scope
+
+from app.core import settings
+from app.core.replicas import WROTE_KEY
+from app.schemas import BatchMethod, BatchRequest
+
+logger = logging.getLogger(__name__)
+
+# request state key of the principal authenticated once by the batch request
+PRINCIPAL_KEY = "batch_principal"
+
+# scope keys of the batch request shared by its sub-requests
+_INHERITED_SCOPE = (
+    "type",
+    "asgi",
+    "http_version",
+    "scheme",
+    "server",
+    "client",
+    "root_path",
+    "app",
+)
+# request headers of the batch copied to every sub-request
+_FORWARDED_HEADERS = {b"authorization", b"user-agent", b"accept-language"}
+# sub-request headers only set by the batch, bodies must not be compressed to be
+# embedded in the batch response
+_RESERVED_HEADERS = _FORWARDED_HEADERS | {
+    b"accept-encoding",
+    b"content-length",
+    b"content-type",
+    b"host",
+    b"transfer-encoding",
+}
+_SERVER_ERROR = b'{"detail":"Internal Server Error"}'
+
+
+class SubResponse(NamedTuple):
+    status: int
+    headers: list[tuple[bytes, bytes]]
+    body: bytes
+
+
+def _router_stack(app: FastAPI) -> ASGIApp:
+    # the routes behind the exception handlers and the exit stack of the yield
+    # dependencies, like FastAPI.build_middleware_stack without the user middleware
+    # (CORS and compression apply to the batch response as a whole)
+    stack = getattr(app.state, "batch_router_stack", None)
+    if stack is None:
+        handlers = {
+            key: handler
+            for key, handler in app.exception_handlers.items()
+            if key not in (500, Exception)
+        }
+        stack = ExceptionMiddleware(
+            AsyncExitStackMiddleware(app.router), handlers=handlers, debug=app.debug
+        )
+        app.state.batch_router_stack = stack
+    return stack
+
+
+def _sub_scope(parent: Scope, item: BatchRequest, body: bytes, state: dict) -> Scope:
+    path, _, query = item.url.partition("?")
+    headers = [
+        (name.lower().encode("latin-1"), value.encode("latin-1"))
+        for name, value in item.headers.items()
+    ]
+    headers = [header for header in headers if header[0] not in _RESERVED_HEADERS]
+    headers += [
+        header for header in parent["headers"] if header[0] in _FORWARDED_HEADERS
+    ]
+    if body:
+        headers.append((b"content-type", b"application/json"))
+        headers.append((b"content-length", str(len(body)).encode("latin-1")))
+    return {
+        **{key: parent[key] for key in _INHERITED_SCOPE if key in parent},
+        "method": item.method.value,
+        "path": path,
+        "raw_path": path.encode("utf-8"),
+        "query_string": query.encode("latin-1"),
+        "headers": headers,
+        "state": state,
+    }
+
+
+async def _dispatch(
+    app: ASGIApp, parent: Scope, item: BatchRequest, state: dict
+) -> SubResponse:
+    body = b"" if item.body is None else orjson.dumps(item.body)
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    response: dict[str, Any] = {"status": 500, "headers": [], "body": []}
+
+    async def receive() -> Message:
+        if messages:
+            return messages.pop()
+        # the client of a sub-request never disconnects, streaming responses
+        # wait for it until they are complete
+        await asyncio.Event().wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            response["status"] = message["status"]
+            response["headers"] = list(message.get("headers", []))
+        elif message["type"] == "http.response.body":
+            response["body"].append(message.get("body", b""))
+
+    try:
+        await app(_sub_scope(parent, item, body, state), receive, send)
+    except Exception:  # pylint: disable=broad-exception-caught
+        # one failing item must not fail the whole batch
+        logger.exception("Batch sub-request %s %s failed", item.method.value, item.url)
+        return SubResponse(500, [(b"content-type", b"application/json")], _SERVER_ERROR)
+    return SubResponse(
+        response["status"], response["headers"], b"".join(response["body"])
+    )
+
+
+def _steps(items: Sequence[BatchRequest]) -> Iterator[list[int]]:
+    # consecutive reads run together, every write runs alone in the batch order
+    reads: list[int] = []
+    for index, item in enumerate(items):
+        if item.method == BatchMethod.GET:
+            reads.append(index)
+            continue
+        if reads:
+            yield reads
+            reads = []
+        yield [index]
+    if reads:
+        yield reads
+
+
+async def run_batch(
+    request: Request, items: Sequence[BatchRequest], principal: Any
+) -> list[SubResponse]:
+    """
+    Execute the sub-requests of a batch against the routes of the application.
+
+    Consecutive GET requests run concurrently (at most ``BATCH_CONCURRENCY`` at a
+    time), any other request runs alone once the previous ones completed, so that
+    the items observe the writes of the items before them. Once an item wrote,
+    the following items read from the primary database. The items after any other
+    request than GET authenticate again instead of reusing ``principal``.
+
+    :param request: Batch request, its credentials are forwarded to every item.
+    :param items: Sub-requests in their batch order.
+    :param principal: User authenticated by the batch request, reused by the items
+        until one of them is not a GET request.
+    :return: Response of every item, in the batch order.
+    """
+    app = _router_stack(request.app)
+    semaphore = asyncio.Semaphore(settings.BATCH_CONCURRENCY)
+    responses: list[SubResponse | None] = [None] * len(items)
+    wrote = getattr(request.state, WROTE_KEY, False)
+
+    async def run(index: int) -> dict:
+        state = {}
+        if principal is not None:
+            state[PRINCIPAL_KEY] = principal
+        if wrote:
+            state[WROTE_KEY] = True
+        async with semaphore:
+            responses[index] = await _dispatch(app, request.scope, items[index], state)
+        return state
+
+    for step in _steps(items):
+        states = await asyncio.gather(*(run(index) for index in step))
+        wrote = wrote or any(state.get(WROTE_KEY) for state in states)
+        if items[step[0]].method != BatchMethod.GET:
+            # the write may have changed the user, the next items authenticate again
+            # from the forwarded credentials
+            principal = None
+    return responses
+
+
+def render_batch(responses: Sequence[SubResponse]) -> bytes:
+    """
+    Serialize the responses of a batch.
+
+    JSON bodies are embedded as they were rendered by their endpoint, without being
+    parsed again.
+
+    :param responses: Response of every item.
+    :return: JSON array of objects with ``status``, ``headers`` and ``body``.
+    """
+    parts = []
+    for response in responses:
+        headers = {
+            name.decode("latin-1"): value.decode("latin-1")
+            for name, value in response.headers
+            if name != b"content-length"
+        }
+        if not response.body:
+            body = b"null"
+        elif headers.get("content-type", "").startswith("application/json"):
+            body = response.body
+        else:
+            body = orjson.dumps(response.body.decode("utf-8", "replace"))
+        parts.append(
+            b'{"status":%d,"headers":%b,"body":%b}'
+            % (response.status, orjson.dumps(headers), body)
+        )
+    return b"[" + b",".join(parts) + b"]"
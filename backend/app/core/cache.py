@@ -0,0 +1,236 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import NamedTuple
+
+from app.core import settings
+
+
+type KeyType = object
+type ValueType = object
+
+
+class TTLCache[KeyType, ValueType]:
+    """
+    Thread-safe, per-process LRU cache whose entries expire after a fixed time to live.
+
+    :param maxsize: Maximum number of entries, the least recently used entry is evicted first.
+    :param ttl: Number of seconds an entry stays valid.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict[KeyType, tuple[float, ValueType]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: KeyType) -> ValueType | None:
+        """
+        Retrieve a valid entry and mark it as recently used.
+
+        :param key: Key of the entry.
+        :return: Cached value or None if missing or expired.
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: KeyType, value: ValueType, ttl: float | None = None) -> None:
+        """
+        Store an entry, evicting the least recently used one when the cache is full.
+
+        :param key: Key of the entry.
+        :param value: Value to cache.
+        :param ttl: Optional time to live overriding the cache default.
+        """
+        if self.maxsize <= 0:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def invalidate(self, key: KeyType) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict[str, float | int]:
+        """
+        Return the cache counters.
+
+        :return: Dictionary with hits, misses, hit ratio and the current size.
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+            }
+
+
+class TokenCache(TTLCache[bytes, object]):
+    """
+    Cache of verified access token digests and their parsed claims.
+
+    Entries are only valid for the signing key they were verified with, so the
+    cache flushes itself whenever the key or algorithm changes.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._signing_key: tuple[str, str] | None = None
+
+    def bind_signing_key(self, secret_key: str, algorithm: str) -> None:
+        """
+        Flush the cache if it was filled using a different signing key.
+
+        :param secret_key: Current signing secret.
+        :param algorithm: Current signing algorithm.
+        """
+        signing_key = (secret_key, algorithm)
+        if signing_key != self._signing_key:
+            self.clear()
+            self._signing_key = signing_key
+
+
+class CachedBody(NamedTuple):
+    body: bytes
+    etag: str
+    headers: dict[str, str]
+    # precompressed bodies by content coding
+    encoded: dict[str, bytes]
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(body) for body in self.encoded.values())
+
+
+class CatalogCache(TTLCache[str, CachedBody]):
+    """
+    Cache of serialized catalog responses tied to a catalog version.
+
+    Bumping the version drops every entry. Entries are only stored for the version
+    they were loaded under, so a read racing a write cannot cache stale data.
+
+    :param maxsize: Maximum number of entries.
+    :param ttl: Number of seconds an entry stays valid.
+    :param max_bytes: Maximum total size of the cached bodies and their compressed variants.
+    """
+
+    def __init__(self, maxsize: int, ttl: float, max_bytes: int):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self.max_bytes = max_bytes
+        self.version = 0
+        self.evictions = 0
+        self._bytes = 0
+
+    def get(self, key: str) -> CachedBody | None:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._bytes -= entry[1].size
+                del self._data[key]
+        return super().get(key)
+
+    def set(
+        self,
+        key: str,
+        value: CachedBody,
+        ttl: float | None = None,
+        version: int | None = None,
+    ) -> None:
+        """
+        Store a response, evicting the least recently used ones beyond the caps.
+
+        :param key: Key of the entry.
+        :param value: Serialized response.
+        :param ttl: Optional time to live overriding the cache default.
+        :param version: Catalog version the response was loaded under, the current one by default.
+        """
+        size = value.size
+        if self.maxsize <= 0 or size > self.max_bytes:
+            return
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            if version is not None and version != self.version:
+                return
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1].size
+            self._data[key] = (expires_at, value)
+            self._bytes += size
+            while len(self._data) > self.maxsize or self._bytes > self.max_bytes:
+                _, (_, evicted) = self._data.popitem(last=False)
+                self._bytes -= evicted.size
+                self.evictions += 1
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            previous = self._data.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1].size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def bump_version(self) -> None:
+        """Move to a new catalog version, dropping every cached response."""
+        with self._lock:
+            self.version += 1
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict[str, float | int]:
+        stats = super().stats()
+        with self._lock:
+            stats.update(
+                bytes=self._bytes,
+                max_bytes=self.max_bytes,
+                evictions=self.evictions,
+                version=self.version,
+            )
+        return stats
+
+
+# authenticated user id -> schemas.UserPrincipal
+principal_cache = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL
+)
+
+# sha256 digest of an access token -> schemas.TokenPayload
+token_cache = TokenCache(
+    maxsize=settings.TOKEN_CACHE_SIZE, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+)
+
+# request path and query -> serialized category/exercise response
+catalog_cache = CatalogCache(
+    maxsize=settings.CATALOG_CACHE_SIZE,
+    ttl=settings.CATALOG_CACHE_TTL,
+    max_bytes=settings.CATALOG_CACHE_MAX_BYTES,
+)
+
+# (user id, exercise id, metric, points, history version) -> serialized progress series,
+# writes move the history to a new version so stale entries are never read again
+progress_cache = TTLCache(
+    maxsize=settings.PROGRESS_CACHE_SIZE, ttl=settings.PROGRESS_CACHE_TTL
+)
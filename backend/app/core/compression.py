@@ -0,0 +1,179 @@
+import gzip
+import zlib
+from typing import Any, Callable
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core import settings
+
+try:
+    import brotli
+except ImportError:  # optional dependency
+    brotli = None
+
+
+# preferred first
+ENCODINGS = ("br", "gzip") if brotli is not None else ("gzip",)
+
+
+def choose_encoding(accept_encoding: str | None) -> str | None:
+    """
+    Pick the preferred supported encoding accepted by the client.
+
+    :param accept_encoding: Value of the ``Accept-Encoding`` request header.
+    :return: Content coding or None to send the identity.
+    """
+    if not accept_encoding:
+        return None
+    accepted = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            if quality and float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(coding.strip().lower())
+    for encoding in ENCODINGS:
+        if encoding in accepted:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """
+    Compress a whole body.
+
+    :param body: Body to compress.
+    :param encoding: ``gzip`` or ``br``.
+    :return: Compressed body.
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+
+
+def compressed_variants(body: bytes) -> dict[str, bytes]:
+    """
+    Compress a body with every supported encoding, to be cached alongside it.
+
+    :param body: Body to compress.
+    :return: Compressed bodies by content coding, empty below the size threshold.
+    """
+    if len(body) < settings.COMPRESSION_MINIMUM_SIZE:
+        return {}
+    return {encoding: compress(body, encoding) for encoding in ENCODINGS}
+
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    """
+    Derive the strong entity tag of a compressed representation.
+
+    :param etag: Entity tag of the identity representation.
+    :param encoding: Content coding.
+    :return: Entity tag with the coding appended inside the quotes.
+    """
+    if etag.startswith('"') and etag.endswith('"'):
+        return f'{etag[:-1]}-{encoding}"'
+    return etag
+
+
+def _stream_compressor(encoding: str) -> tuple[Callable, Callable]:
+    if encoding == "br":
+        compressor = brotli.Compressor(quality=settings.COMPRESSION_BROTLI_QUALITY)
+        return compressor.process, compressor.finish
+    compressor = zlib.compressobj(settings.COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+    return compressor.compress, compressor.flush
+
+
+class CompressionMiddleware:
+    """
+    Compress responses with brotli or gzip according to ``Accept-Encoding``.
+
+    Responses below the size threshold, of a media type outside the allow-list or
+    already encoded (e.g. served precompressed from a cache) are sent unchanged.
+
+    :param app: ASGI application.
+    :param minimum_size: Smallest body in bytes worth compressing.
+    :param media_types: Media types that are compressed.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = settings.COMPRESSION_MINIMUM_SIZE,
+        media_types: tuple[str, ...] = settings.COMPRESSION_MEDIA_TYPES,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.media_types = media_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http":
+            encoding = choose_encoding(Headers(scope=scope).get("accept-encoding"))
+            if encoding is not None:
+                responder = _CompressionResponder(self, encoding, send)
+                await self.app(scope, receive, responder.send)
+                return
+        await self.app(scope, receive, send)
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.downstream = send
+        self.start: Message | None = None
+        self.compressor: tuple[Callable, Callable] | None = None
+        self.passthrough = False
+
+    def _compressible(self, headers: MutableHeaders) -> bool:
+        media_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return (
+            "content-encoding" not in headers
+            and media_type in self.middleware.media_types
+        )
+
+    def _encode_headers(self, headers: MutableHeaders) -> None:
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        if "etag" in headers:
+            headers["ETag"] = encoded_etag(headers["etag"], self.encoding)
+
+    async def send(self, message: Message) -> Any:
+        if message["type"] == "http.response.start":
+            # held back until the first body chunk tells whether to compress
+            self.start = message
+            return
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.downstream(message)
+            return
+        body, more_body = message.get("body", b""), message.get("more_body", False)
+        if self.compressor is not None:
+            process, finish = self.compressor
+            chunk = process(body) + (b"" if more_body else finish())
+            await self.downstream({**message, "body": chunk})
+            return
+
+        headers = MutableHeaders(raw=self.start["headers"])
+        if not self._compressible(headers) or (
+            not more_body and len(body) < self.middleware.minimum_size
+        ):
+            self.passthrough = True
+            await self.downstream(self.start)
+            await self.downstream(message)
+            return
+        self._encode_headers(headers)
+        if not more_body:
+            body = compress(body, self.encoding)
+            headers["Content-Length"] = str(len(body))
+            await self.downstream(self.start)
+            await self.downstream({**message, "body": body})
+            return
+        # streamed response of unknown length
+        del headers["Content-Length"]
+        self.compressor = _stream_compressor(self.encoding)
+        await self.downstream(self.start)
+        await self.send(message)
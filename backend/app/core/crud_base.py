@@ -1,40 +1,185 @@
-from typing import Any
+from itertools import islice
+from typing import Any, AsyncIterator, Iterable, Iterator, Sequence
 
-from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import ColumnElement, Insert, delete, insert, inspect, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy.sql.expression import select
+from sqlalchemy.sql.base import ExecutableOption
+from sqlalchemy.sql.expression import Select, select
 
 from app.core.database import Base
+from app.core.pagination import keyset_select, split_page
+from app.core.unit_of_work import is_unit_of_work
 
 
 type ModelType = Base
 type CreateSchemaType = BaseModel
 type UpdateSchemaType = BaseModel
 
+BULK_CHUNK_SIZE = 1000
+
+
+def _chunked(
+    objs_in: Iterable[BaseModel | dict[str, Any]], chunk_size: int
+) -> Iterator[list[dict[str, Any]]]:
+    rows = (
+        obj_in if isinstance(obj_in, dict) else obj_in.model_dump()
+        for obj_in in objs_in
+    )
+    while chunk := list(islice(rows, chunk_size)):
+        yield chunk
+
+
+def _filter_clauses(model: Base, filters: dict[str, Any]) -> list[ColumnElement]:
+    """
+    Translate ``filter_by`` style keyword filters into where clauses.
+
+    List, tuple and set values are matched with ``IN``.
+    """
+    clauses = []
+    for field, value in filters.items():
+        column = getattr(model, field)
+        if isinstance(value, (list, tuple, set, frozenset)):
+            clauses.append(column.in_(value))
+        else:
+            clauses.append(column == value)
+    return clauses
+
+
+def primary_key_filters(
+    primary_key: frozenset[str], filters: dict[str, Any]
+) -> dict[str, Any]:
+    """
+    Check that the filters select a single record by its primary key.
+
+    :raises ValueError: If the filters are not exactly the primary key columns or a
+        value is a collection, which would delete more than one record.
+    """
+    if filters.keys() != primary_key or any(
+        isinstance(value, (list, tuple, set, frozenset)) for value in filters.values()
+    ):
+        raise ValueError(f"Expected a single value for each of {sorted(primary_key)}")
+    return filters
+
+
+def _select(
+    model: Base,
+    filters: dict[str, Any] | None,
+    options: Sequence[ExecutableOption],
+) -> Select:
+    return select(model).where(*_filter_clauses(model, filters or {})).options(*options)
+
+
+def _apply_changes(
+    db_obj: Base, columns: frozenset[str], obj_in: BaseModel | dict[str, Any]
+) -> bool:
+    """
+    Assign the updated values that differ from the current ones.
+
+    :return: True if any attribute has changed.
+    """
+    if isinstance(obj_in, dict):
+        update_data = obj_in
+    else:
+        update_data = obj_in.model_dump(exclude_unset=True)
+    changed = False
+    for field, value in update_data.items():
+        if field in columns and getattr(db_obj, field) != value:
+            setattr(db_obj, field, value)
+            changed = True
+    return changed
+
+
+def dialect_insert(model: Base, dialect_name: str) -> Insert:
+    """
+    Build the insert statement of a dialect supporting ``ON CONFLICT`` clauses.
+
+    :param model: SQLAlchemy model to insert into.
+    :param dialect_name: Name of the database dialect.
+    :raises ValueError: If the dialect has no ``ON CONFLICT`` support.
+    :return: Dialect specific insert statement.
+    """
+    if dialect_name == "postgresql":
+        return postgresql.insert(model)
+    if dialect_name == "sqlite":
+        return sqlite.insert(model)
+    raise ValueError(f"The {dialect_name} dialect does not support upserts")
+
+
+def _upsert_statement(
+    model: Base,
+    dialect_name: str,
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str] | None,
+    row: dict[str, Any],
+) -> Insert:
+    statement = dialect_insert(model, dialect_name)
+    if update_columns is None:
+        update_columns = [key for key in row if key not in conflict_columns]
+    # a no-op update still returns the existing row, unlike DO NOTHING
+    update_columns = update_columns or conflict_columns
+    return statement.on_conflict_do_update(
+        index_elements=conflict_columns,
+        set_={column: statement.excluded[column] for column in update_columns},
+    )
+
 
 class CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]:
     """
     Base class for CRUD operations with SQLAlchemy models.
 
     :param model: SQLAlchemy model to perform CRUD operations on.
+    :param cursor_columns: Indexed columns defining the page order, the primary key by default.
     """
 
-    def __init__(self, model: ModelType):
+    def __init__(self, model: ModelType, cursor_columns: tuple | None = None):
         self.model = model
+        self.cursor_columns = cursor_columns or (model.id,)
+        self.columns = frozenset(inspect(model).column_attrs.keys())
+        mapper = inspect(model)
+        self.primary_key = frozenset(
+            mapper.get_property_by_column(column).key for column in mapper.primary_key
+        )
+
+    @staticmethod
+    def _save(db: Session, db_obj: ModelType | None = None) -> None:
+        """
+        Flush inside a unit of work, otherwise commit and reload the expired record.
 
-    def get(self, db: Session, **kwargs) -> ModelType | None:
+        :param db: SQLAlchemy database session.
+        :param db_obj: Record to reload after the commit.
+        """
+        if is_unit_of_work(db):
+            db.flush()
+            return
+        db.commit()
+        if db_obj is not None:
+            db.refresh(db_obj)
+
+    def get(
+        self, db: Session, *, options: Sequence[ExecutableOption] = (), **kwargs
+    ) -> ModelType | None:
         """
         Retrieve a single record from the database by filtering with the given keyword arguments.
 
         :param db: SQLAlchemy database session.
+        :param options: Loader options, e.g. the eager loading of relationships.
         :param kwargs: Keyword arguments to filter the record.
         :return: Retrieved record or None if not found.
         """
-        return db.execute(select(self.model).filter_by(**kwargs)).scalar_one_or_none()
+        statement = select(self.model).filter_by(**kwargs).options(*options)
+        return db.execute(statement).scalar_one_or_none()
 
-    def get_multi(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+    def get_multi(  # pylint: disable=too-many-arguments
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: dict[str, Any] | None = None,
+        options: Sequence[ExecutableOption] = (),
     ) -> list[ModelType]:
         """
         Retrieve multiple records from the database with optional pagination.
@@ -42,9 +187,67 @@ class CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]:
         :param db: SQLAlchemy database session.
         :param skip: Number of records to skip.
         :param limit: Maximum number of records to retrieve.
+        :param filters: Keyword filters, list values are matched with ``IN``.
+        :param options: Loader options, e.g. the eager loading of relationships.
         :return: List of retrieved records.
         """
-        return db.execute(select(self.model).offset(skip).limit(limit)).scalars().all()
+        statement = _select(self.model, filters, options).order_by(*self.cursor_columns)
+        return db.execute(statement.offset(skip).limit(limit)).scalars().all()
+
+    def get_page(  # pylint: disable=too-many-arguments
+        self,
+        db: Session,
+        *,
+        cursor: str | None = None,
+        limit: int = 100,
+        filters: dict[str, Any] | None = None,
+        options: Sequence[ExecutableOption] = (),
+    ) -> tuple[list[ModelType], str | None]:
+        """
+        Retrieve the page of records following the given cursor (keyset pagination).
+
+        :param db: SQLAlchemy database session.
+        :param cursor: Cursor returned with the previous page or None for the first page.
+        :param limit: Maximum number of records to retrieve.
+        :param filters: Keyword filters, list values are matched with ``IN``.
+        :param options: Loader options, e.g. the eager loading of relationships.
+        :raises InvalidCursor: If the cursor cannot be decoded.
+        :return: Tuple of retrieved records and the cursor of the next page, None on the last page.
+        """
+        statement = keyset_select(
+            _select(self.model, filters, options),
+            self.cursor_columns,
+            cursor=cursor,
+            limit=limit,
+        )
+        rows = db.execute(statement).scalars().all()
+        return split_page(rows, self.cursor_columns, limit)
+
+    def stream(
+        self,
+        db: Session,
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        options: Sequence[ExecutableOption] = (),
+    ) -> Iterator[list[ModelType]]:
+        """
+        Iterate over all records in key order, fetched in chunks from a server-side cursor.
+
+        Memory use is bounded by the chunk size whatever the size of the table.
+
+        :param db: SQLAlchemy database session.
+        :param chunk_size: Number of records fetched per round trip.
+        :param options: Loader options, e.g. the eager loading of relationships.
+        :return: Iterator of record chunks.
+        """
+        statement = (
+            select(self.model)
+            .options(*options)
+            .order_by(*self.cursor_columns)
+            .execution_options(yield_per=chunk_size)
+        )
+        for partition in db.scalars(statement).partitions():
+            yield list(partition)
 
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """
@@ -54,13 +257,68 @@ class CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]:
         :param obj_in: Pydantic model representing the record to create.
         :return: Created record.
         """
-        obj_in_data = jsonable_encoder(obj_in)
+        obj_in_data = obj_in.model_dump()
         db_obj = self.model(**obj_in_data)
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._save(db, db_obj)
         return db_obj
 
+    def create_many(
+        self,
+        db: Session,
+        *,
+        objs_in: Iterable[CreateSchemaType | dict[str, Any]],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[ModelType]:
+        """
+        Create many records with multi-row ``INSERT ... RETURNING`` statements and a single commit.
+
+        :param db: SQLAlchemy database session.
+        :param objs_in: Pydantic models or dictionaries representing the records to create.
+        :param chunk_size: Maximum number of rows per statement.
+        :return: Created records in input order.
+        """
+        statement = insert(self.model).returning(
+            self.model, sort_by_parameter_order=True
+        )
+        created = []
+        for chunk in _chunked(objs_in, chunk_size):
+            created.extend(db.scalars(statement, chunk).all())
+        self._save(db)
+        return created
+
+    def upsert_many(  # pylint: disable=too-many-arguments
+        self,
+        db: Session,
+        *,
+        objs_in: Iterable[CreateSchemaType | dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[ModelType]:
+        """
+        Insert or update many records with ``INSERT ... ON CONFLICT`` and a single commit.
+
+        :param db: SQLAlchemy database session.
+        :param objs_in: Pydantic models or dictionaries representing the records.
+        :param conflict_columns: Columns of the unique constraint identifying existing records.
+        :param update_columns: Columns overwritten on conflict, all provided columns by default.
+        :param chunk_size: Maximum number of rows per statement.
+        :return: Inserted or updated records in input order.
+        """
+        dialect_name = db.get_bind().dialect.name
+        upserted = []
+        for chunk in _chunked(objs_in, chunk_size):
+            statement = _upsert_statement(
+                self.model, dialect_name, conflict_columns, update_columns, chunk[0]
+            )
+            statement = statement.returning(
+                self.model, sort_by_parameter_order=True
+            ).execution_options(populate_existing=True)
+            upserted.extend(db.scalars(statement, chunk).all())
+        self._save(db)
+        return upserted
+
     def update(
         self,
         db: Session,
@@ -76,28 +334,342 @@ class CRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]:
         :param obj_in: Pydantic model or dictionary representing the updated values.
         :return: Updated record.
         """
-        obj_data = jsonable_encoder(db_obj)
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.model_dump(exclude_unset=True)
-        for field in obj_data:
-            if field in update_data:
-                setattr(db_obj, field, update_data[field])
+        if not _apply_changes(db_obj, self.columns, obj_in):
+            return db_obj
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._save(db, db_obj)
         return db_obj
 
-    def remove(self, db: Session, **kwargs) -> ModelType:
+    def update_where(
+        self, db: Session, *, filters: dict[str, Any], values: dict[str, Any]
+    ) -> list[ModelType]:
+        """
+        Update all records matching the filters with a single ``UPDATE ... RETURNING`` statement.
+
+        :param db: SQLAlchemy database session.
+        :param filters: Keyword filters, list values are matched with ``IN``.
+        :param values: Column values to set.
+        :return: Updated records.
+        """
+        statement = (
+            update(self.model)
+            .where(*_filter_clauses(self.model, filters))
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session="fetch")
+        )
+        updated = db.scalars(statement).all()
+        self._save(db)
+        return updated
+
+    def delete_where(self, db: Session, *, filters: dict[str, Any]) -> list[ModelType]:
         """
-        Delete a record from the database by ID or other attributes.
+        Delete all records matching the filters with a single ``DELETE ... RETURNING`` statement.
 
         :param db: SQLAlchemy database session.
-        :param kwargs: Keyword arguments representing attributes of the record to delete.
-        :return: The deleted record.
+        :param filters: Keyword filters, list values are matched with ``IN``.
+        :return: Deleted records.
         """
-        obj = self.get(db, **kwargs)
-        db.delete(obj)
-        db.commit()
-        return obj
+        statement = (
+            delete(self.model)
+            .where(*_filter_clauses(self.model, filters))
+            .returning(self.model)
+            .execution_options(synchronize_session="fetch")
+        )
+        deleted = db.scalars(statement).all()
+        for db_obj in deleted:
+            # keep the returned state readable once the rows are gone
+            db.expunge(db_obj)
+        self._save(db)
+        return deleted
+
+    def remove(self, db: Session, **kwargs) -> ModelType | None:
+        """
+        Delete a record from the database by its primary key.
+
+        :param db: SQLAlchemy database session.
+        :param kwargs: Value of every primary key column of the record to delete.
+        :raises ValueError: If the keyword arguments are not the primary key.
+        :return: The deleted record or None if not found.
+        """
+        filters = primary_key_filters(self.primary_key, kwargs)
+        deleted = self.delete_where(db, filters=filters)
+        return deleted[0] if deleted else None
+
+
+class AsyncCRUDBase[ModelType, CreateSchemaType, UpdateSchemaType]:
+    """
+    Base class for CRUD operations with SQLAlchemy models on an async session.
+
+    Mirrors :class:`CRUDBase` so that ``async def`` endpoints do not occupy a threadpool worker.
+
+    :param model: SQLAlchemy model to perform CRUD operations on.
+    :param cursor_columns: Indexed columns defining the page order, the primary key by default.
+    """
+
+    def __init__(self, model: ModelType, cursor_columns: tuple | None = None):
+        self.model = model
+        self.cursor_columns = cursor_columns or (model.id,)
+        self.columns = frozenset(inspect(model).column_attrs.keys())
+        mapper = inspect(model)
+        self.primary_key = frozenset(
+            mapper.get_property_by_column(column).key for column in mapper.primary_key
+        )
+
+    @staticmethod
+    async def _save(db: AsyncSession) -> None:
+        """
+        Flush inside a unit of work, otherwise commit.
+
+        Records stay loaded after the commit and server defaults are fetched on
+        flush, so no refresh is needed.
+
+        :param db: SQLAlchemy async database session.
+        """
+        if is_unit_of_work(db):
+            await db.flush()
+            return
+        await db.commit()
+
+    async def get(
+        self, db: AsyncSession, *, options: Sequence[ExecutableOption] = (), **kwargs
+    ) -> ModelType | None:
+        """
+        Retrieve a single record from the database by filtering with the given keyword arguments.
+
+        :param db: SQLAlchemy async database session.
+        :param options: Loader options, e.g. the eager loading of relationships.
+        :param kwargs: Keyword arguments to filter the record.
+        :return: Retrieved record or None if not found.
+        """
+        statement = select(self.model).filter_by(**kwargs).options(*options)
+        result = await db.execute(statement)
+        return result.scalar_one_or_none()
+
+    async def get_multi(  # pylint: disable=too-many-arguments
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        filters: dict[str, Any] | None = None,
+        options: Sequence[ExecutableOption] = (),
+    ) -> list[ModelType]:
+        """
+        Retrieve multiple records from the database with optional pagination.
+
+        :param db: SQLAlchemy async database session.
+        :param skip: Number of records to skip.
+        :param limit: Maximum number of records to retrieve.
+        :param filters: Keyword filters, list values are matched with ``IN``.
+        :param options: Loader options, e.g. the eager loading of relationships.
+        :return: List of retrieved records.
+        """
+        statement = _select(self.model, filters, options).order_by(*self.cursor_columns)
+        result = await db.execute(statement.offset(skip).limit(limit))
+        return result.scalars().all()
+
+    async def get_page(  # pylint: disable=too-many-arguments
+        self,
+        db: AsyncSession,
+        *,
+        cursor: str | None = None,
+        limit: int = 100,
+        filters: dict[str, Any] | None = None,
+        options: Sequence[ExecutableOption] = (),
+    ) -> tuple[list[ModelType], str | None]:
+        """
+        Retrieve the page of records following the given cursor (keyset pagination).
+
+        :param db: SQLAlchemy async database session.
+        :param cursor: Cursor returned with the previous page or None for the first page.
+        :param limit: Maximum number of records to retrieve.
+        :param filters: Keyword filters, list values are matched with ``IN``.
+        :param options: Loader options, e.g. the eager loading of relationships.
+        :raises InvalidCursor: If the cursor cannot be decoded.
+        :return: Tuple of retrieved records and the cursor of the next page, None on the last page.
+        """
+        statement = keyset_select(
+            _select(self.model, filters, options),
+            self.cursor_columns,
+            cursor=cursor,
+            limit=limit,
+        )
+        result = await db.execute(statement)
+        return split_page(result.scalars().all(), self.cursor_columns, limit)
+
+    async def stream(
+        self,
+        db: AsyncSession,
+        *,
+        chunk_size: int = BULK_CHUNK_SIZE,
+        options: Sequence[ExecutableOption] = (),
+    ) -> AsyncIterator[list[ModelType]]:
+        """
+        Iterate over all records in key order, fetched in chunks from a server-side cursor.
+
+        Memory use is bounded by the chunk size whatever the size of the table.
+
+        :param db: SQLAlchemy async database session.
+        :param chunk_size: Number of records fetched per round trip.
+        :param options: Loader options, e.g. the eager loading of relationships.
+        :return: Async iterator of record chunks.
+        """
+        statement = (
+            select(self.model)
+            .options(*options)
+            .order_by(*self.cursor_columns)
+            .execution_options(yield_per=chunk_size)
+        )
+        result = await db.stream_scalars(statement)
+        async for partition in result.partitions():
+            yield list(partition)
+
+    async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
+        """
+        Create a new record in the database.
+
+        :param db: SQLAlchemy async database session.
+        :param obj_in: Pydantic model representing the record to create.
+        :return: Created record.
+        """
+        obj_in_data = obj_in.model_dump()
+        db_obj = self.model(**obj_in_data)
+        db.add(db_obj)
+        await self._save(db)
+        return db_obj
+
+    async def create_many(
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Iterable[CreateSchemaType | dict[str, Any]],
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[ModelType]:
+        """
+        Create many records with multi-row ``INSERT ... RETURNING`` statements and a single commit.
+
+        :param db: SQLAlchemy async database session.
+        :param objs_in: Pydantic models or dictionaries representing the records to create.
+        :param chunk_size: Maximum number of rows per statement.
+        :return: Created records in input order.
+        """
+        statement = insert(self.model).returning(
+            self.model, sort_by_parameter_order=True
+        )
+        created = []
+        for chunk in _chunked(objs_in, chunk_size):
+            created.extend((await db.scalars(statement, chunk)).all())
+        await self._save(db)
+        return created
+
+    async def upsert_many(  # pylint: disable=too-many-arguments
+        self,
+        db: AsyncSession,
+        *,
+        objs_in: Iterable[CreateSchemaType | dict[str, Any]],
+        conflict_columns: Sequence[str],
+        update_columns: Sequence[str] | None = None,
+        chunk_size: int = BULK_CHUNK_SIZE,
+    ) -> list[ModelType]:
+        """
+        Insert or update many records with ``INSERT ... ON CONFLICT`` and a single commit.
+
+        :param db: SQLAlchemy async database session.
+        :param objs_in: Pydantic models or dictionaries representing the records.
+        :param conflict_columns: Columns of the unique constraint identifying existing records.
+        :param update_columns: Columns overwritten on conflict, all provided columns by default.
+        :param chunk_size: Maximum number of rows per statement.
+        :return: Inserted or updated records in input order.
+        """
+        dialect_name = db.get_bind().dialect.name
+        upserted = []
+        for chunk in _chunked(objs_in, chunk_size):
+            statement = _upsert_statement(
+                self.model, dialect_name, conflict_columns, update_columns, chunk[0]
+            )
+            statement = statement.returning(
+                self.model, sort_by_parameter_order=True
+            ).execution_options(populate_existing=True)
+            upserted.extend((await db.scalars(statement, chunk)).all())
+        await self._save(db)
+        return upserted
+
+    async def update(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: ModelType,
+        obj_in: UpdateSchemaType | dict[str, Any],
+    ) -> ModelType:
+        """
+        Update an existing record in the database.
+
+        :param db: SQLAlchemy async database session.
+        :param db_obj: Record to update.
+        :param obj_in: Pydantic model or dictionary representing the updated values.
+        :return: Updated record.
+        """
+        if not _apply_changes(db_obj, self.columns, obj_in):
+            return db_obj
+        db.add(db_obj)
+        await self._save(db)
+        return db_obj
+
+    async def update_where(
+        self, db: AsyncSession, *, filters: dict[str, Any], values: dict[str, Any]
+    ) -> list[ModelType]:
+        """
+        Update all records matching the filters with a single ``UPDATE ... RETURNING`` statement.
+
+        :param db: SQLAlchemy async database session.
+        :param filters: Keyword filters, list values are matched with ``IN``.
+        :param values: Column values to set.
+        :return: Updated records.
+        """
+        statement = (
+            update(self.model)
+            .where(*_filter_clauses(self.model, filters))
+            .values(**values)
+            .returning(self.model)
+            .execution_options(synchronize_session="fetch")
+        )
+        updated = (await db.scalars(statement)).all()
+        await self._save(db)
+        return updated
+
+    async def delete_where(
+        self, db: AsyncSession, *, filters: dict[str, Any]
+    ) -> list[ModelType]:
+        """
+        Delete all records matching the filters with a single ``DELETE ... RETURNING`` statement.
+
+        :param db: SQLAlchemy async database session.
+        :param filters: Keyword filters, list values are matched with ``IN``.
+        :return: Deleted records.
+        """
+        statement = (
+            delete(self.model)
+            .where(*_filter_clauses(self.model, filters))
+            .returning(self.model)
+            .execution_options(synchronize_session="fetch")
+        )
+        deleted = (await db.scalars(statement)).all()
+        for db_obj in deleted:
+            # keep the returned state readable once the rows are gone
+            db.expunge(db_obj)
+        await self._save(db)
+        return deleted
+
+    async def remove(self, db: AsyncSession, **kwargs) -> ModelType | None:
+        """
+        Delete a record from the database by its primary key.
+
+        :param db: SQLAlchemy async database session.
+        :param kwargs: Value of every primary key column of the record to delete.
+        :raises ValueError: If the keyword arguments are not the primary key.
+        :return: The deleted record or None if not found.
+        """
+        filters = primary_key_filters(self.primary_key, kwargs)
+        deleted = await self.delete_where(db, filters=filters)
+        return deleted[0] if deleted else None
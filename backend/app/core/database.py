@@ -1,10 +1,13 @@
 from typing import Any
 
 from sqlalchemy import create_engine, URL
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import sessionmaker, DeclarativeBase
 
 from app.core import settings
+from app.core.pool import instrument, pool_options
+from app.core.replicas import ReplicaSet, RoutingSession
 
 
 DB_URL = URL.create(
@@ -16,13 +19,83 @@ DB_URL = URL.create(
     database=settings.DB_NAME,
 )
 
-engine = create_engine(DB_URL, pool_pre_ping=True)
+engine = instrument(create_engine(DB_URL, **pool_options("primary")))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# async counterpart used by the `async def` endpoints, objects stay loaded after
+# commit because lazy loading is not available outside of the event loop
+ASYNC_DB_URL = DB_URL.set(drivername=settings.ASYNC_DB_DRIVERNAME)
+async_engine = instrument(
+    create_async_engine(ASYNC_DB_URL, **pool_options("primary-async", is_async=True))
+)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+def replica_url(host: str, drivername: str) -> URL:
+    """
+    Build the URL of a replica sharing the primary's credentials and database name.
+
+    :param host: Replica host, optionally followed by ``:port``.
+    :param drivername: SQLAlchemy driver name.
+    :return: Replica URL.
+    """
+    hostname, _, port = host.partition(":")
+    return DB_URL.set(
+        drivername=drivername, host=hostname, port=port or settings.DB_PORT
+    )
+
+
+replica_engines = [
+    instrument(
+        create_engine(
+            replica_url(host, settings.DB_DRIVERNAME), **pool_options(f"replica-{i}")
+        )
+    )
+    for i, host in enumerate(settings.DB_REPLICA_HOSTS)
+]
+async_replica_engines = [
+    instrument(
+        create_async_engine(
+            replica_url(host, settings.ASYNC_DB_DRIVERNAME),
+            **pool_options(f"replica-{i}-async", is_async=True),
+        )
+    )
+    for i, host in enumerate(settings.DB_REPLICA_HOSTS)
+]
+# every engine by its pool name, for pool metrics and liveness checks
+engines = {
+    "primary": engine,
+    "primary-async": async_engine,
+    **{f"replica-{i}": replica for i, replica in enumerate(replica_engines)},
+    **{
+        f"replica-{i}-async": replica for i, replica in enumerate(async_replica_engines)
+    },
+}
+ReadSessionLocal = sessionmaker(
+    class_=RoutingSession,
+    autoflush=False,
+    primary=engine,
+    replicas=ReplicaSet(replica_engines, settings.DB_REPLICA_RETRY_SECONDS),
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    sync_session_class=RoutingSession,
+    autoflush=False,
+    expire_on_commit=False,
+    primary=async_engine.sync_engine,
+    replicas=ReplicaSet(
+        [replica.sync_engine for replica in async_replica_engines],
+        settings.DB_REPLICA_RETRY_SECONDS,
+    ),
+)
+
 
 class Base(DeclarativeBase):
     id: Any
     __name__: str
+    # fetch server defaults with RETURNING on flush instead of refreshing afterwards
+    __mapper_args__ = {"eager_defaults": True}
 
     # Generate __tablename__ automatically
     @declared_attr
@@ -1,16 +1,27 @@
-from typing import Generator
+from typing import Any, AsyncGenerator, Generator
 
 from fastapi.security import OAuth2PasswordBearer
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, Request, Response, status
 from jose import jwt
 from pydantic import ValidationError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models import User
-from app.core.database import SessionLocal
+from app.core.batch import PRINCIPAL_KEY
+from app.core.cache import principal_cache
+from app.core.crud_base import AsyncCRUDBase
+from app.core.database import (
+    AsyncReadSessionLocal,
+    AsyncSessionLocal,
+    ReadSessionLocal,
+    SessionLocal,
+)
 from app.core import settings
-from app.crud import user as user_crud
-from app.schemas import TokenPayload
+from app.core.pagination import NEXT_CURSOR_HEADER, InvalidCursor
+from app.core.security import decode_access_token
+from app.core.replicas import track_writes
+from app.core.unit_of_work import register_session
+from app.crud import async_user as user_crud
+from app.schemas import UserPrincipal
 
 
 reusable_oauth2 = OAuth2PasswordBearer(
@@ -18,46 +29,130 @@ reusable_oauth2 = OAuth2PasswordBearer(
 )
 
 
-def get_db() -> Generator:
+def get_db(request: Request) -> Generator:
     try:
         db = SessionLocal()
+        register_session(request, db)
+        if settings.DB_REPLICA_HOSTS:
+            track_writes(request, db)
         yield db
     finally:
         db.close()
 
 
-def get_current_user(
-    db: Session = Depends(get_db), token: str = Depends(reusable_oauth2)
-) -> User:
+async def get_async_db(request: Request) -> AsyncGenerator:
+    async with AsyncSessionLocal() as db:
+        register_session(request, db)
+        if settings.DB_REPLICA_HOSTS:
+            track_writes(request, db)
+        yield db
+
+
+def get_read_db(request: Request) -> Generator:
+    """Session for read-only work, served by a replica until the request writes."""
     try:
-        payload = jwt.decode(
-            token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
-        )
-        token_data = TokenPayload(**payload)
+        db = ReadSessionLocal(request_state=request.state)
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator:
+    """Async session for read-only work, served by a replica until the request writes."""
+    async with AsyncReadSessionLocal(request_state=request.state) as db:
+        yield db
+
+
+async def get_current_user(
+    request: Request,
+    db: AsyncSession = Depends(get_async_read_db),
+    token: str = Depends(reusable_oauth2),
+) -> UserPrincipal:
+    # the items of a batch reuse the user authenticated by the batch request
+    principal = getattr(request.state, PRINCIPAL_KEY, None)
+    if principal is not None:
+        return principal
+    try:
+        token_data = decode_access_token(token)
     except (jwt.JWTError, ValidationError) as exc:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Could not validate credentials",
         ) from exc
-    user = user_crud.get(db, id=token_data.sub)
+    principal = principal_cache.get(token_data.sub)
+    if principal is not None:
+        return principal
+    user = await user_crud.get(db, id=token_data.sub)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
-    return user
+    principal = UserPrincipal.model_validate(user)
+    principal_cache.set(principal.id, principal)
+    return principal
 
 
-def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+async def get_current_active_user(
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> UserPrincipal:
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
     return current_user
 
 
-def get_current_active_superuser(
-    current_user: User = Depends(get_current_user),
-) -> User:
+async def get_current_active_superuser(
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> UserPrincipal:
     if not current_user.is_superuser:
         raise HTTPException(
             status_code=400, detail="The user doesn't have enough privileges"
         )
     return current_user
+
+
+class PageParams:
+    """
+    Pagination query parameters.
+
+    Offset pagination (``skip``/``limit``) is kept for compatibility, any request
+    without a positive ``skip`` is served with keyset pagination from ``cursor``.
+    """
+
+    def __init__(
+        self,
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=1000),
+        cursor: str | None = None,
+    ):
+        self.skip = skip
+        self.limit = limit
+        self.cursor = cursor
+
+    @property
+    def use_keyset(self) -> bool:
+        return self.cursor is not None or self.skip == 0
+
+    async def fetch(
+        self, crud_obj: AsyncCRUDBase, db: AsyncSession, response: Response, **kwargs
+    ) -> list[Any]:
+        """
+        Retrieve the requested page and set the `X-Next-Cursor` header.
+
+        :param crud_obj: Async CRUD object of the listed model.
+        :param db: SQLAlchemy async database session.
+        :param response: Response of the endpoint.
+        :param kwargs: Additional keyword arguments of the CRUD methods, e.g. loader options.
+        :raises HTTPException: If the cursor cannot be decoded.
+        :return: Records of the page.
+        """
+        if not self.use_keyset:
+            return await crud_obj.get_multi(
+                db, skip=self.skip, limit=self.limit, **kwargs
+            )
+        try:
+            records, next_cursor = await crud_obj.get_page(
+                db, cursor=self.cursor, limit=self.limit, **kwargs
+            )
+        except InvalidCursor as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        if next_cursor is not None:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
+        return records
@@ -0,0 +1,61 @@
+import csv
+import io
+from enum import Enum
+from typing import AsyncIterator
+
+from pydantic import BaseModel, TypeAdapter
+
+
+class ExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
+EXPORT_MEDIA_TYPES = {
+    ExportFormat.NDJSON: "application/x-ndjson",
+    ExportFormat.CSV: "text/csv",
+}
+
+
+async def ndjson_lines(
+    chunks: AsyncIterator[list], schema: type[BaseModel]
+) -> AsyncIterator[bytes]:
+    """
+    Serialize record chunks into newline delimited JSON, one body chunk per record chunk.
+
+    :param chunks: Async iterator of ORM record chunks.
+    :param schema: Pydantic model of a line.
+    :return: Async iterator of encoded body chunks.
+    """
+    adapter = TypeAdapter(schema)
+    async for chunk in chunks:
+        yield b"".join(
+            adapter.dump_json(adapter.validate_python(record, from_attributes=True))
+            + b"\n"
+            for record in chunk
+        )
+
+
+async def csv_rows(
+    chunks: AsyncIterator[list], schema: type[BaseModel]
+) -> AsyncIterator[bytes]:
+    """
+    Serialize record chunks into CSV with a header row, one body chunk per record chunk.
+
+    :param chunks: Async iterator of ORM record chunks.
+    :param schema: Pydantic model whose fields are the columns.
+    :return: Async iterator of encoded body chunks.
+    """
+    fields = list(schema.model_fields)
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, lineterminator="\n")
+    writer.writeheader()
+    yield buffer.getvalue().encode()
+    async for chunk in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            schema.model_validate(record, from_attributes=True).model_dump(mode="json")
+            for record in chunk
+        )
+        yield buffer.getvalue().encode()
@@ -0,0 +1,209 @@
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Any, Callable
+
+from starlette.concurrency import run_in_threadpool
+
+from app.core import settings
+
+
+class HashingUnavailable(Exception):
+    """Raised when the hashing executor cannot serve a request in time."""
+
+
+class HashingQueueFull(HashingUnavailable):
+    pass
+
+
+class HashingTimeout(HashingUnavailable):
+    pass
+
+
+def _timed_call(func: Callable, *args) -> tuple[Any, float, float]:
+    """
+    Run ``func`` inside a worker process and report when it started and how long it took.
+
+    :param func: Picklable module-level callable to run.
+    :param args: Positional arguments for ``func``.
+    :return: Tuple of the result, the wall-clock start time and the elapsed time in seconds.
+    """
+    started = time.time()
+    result = func(*args)
+    return result, started, time.time() - started
+
+
+class HashingMetrics:
+    """
+    Thread-safe counters describing the hashing executor workload.
+
+    Queue wait is the time between submitting a job and a worker picking it up,
+    hash time is the time spent inside the worker.
+    """
+
+    COUNTERS = ("submitted", "completed", "rejected", "timeouts")
+    TIMERS = ("queue_wait", "hash_time")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values: dict[str, float] = {}
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._values = {name: 0 for name in self.COUNTERS}
+            for name in self.TIMERS:
+                self._values[f"{name}_total"] = 0.0
+                self._values[f"{name}_max"] = 0.0
+
+    def increment(self, name: str) -> None:
+        with self._lock:
+            self._values[name] += 1
+
+    def record_completed(self, queue_wait: float, hash_time: float) -> None:
+        timings = {"queue_wait": max(queue_wait, 0.0), "hash_time": hash_time}
+        with self._lock:
+            self._values["completed"] += 1
+            for name, value in timings.items():
+                self._values[f"{name}_total"] += value
+                self._values[f"{name}_max"] = max(self._values[f"{name}_max"], value)
+
+    def snapshot(self) -> dict[str, float | int]:
+        """
+        Return a consistent copy of the counters together with derived averages.
+
+        :return: Dictionary with the current metric values.
+        """
+        with self._lock:
+            values = dict(self._values)
+        completed = values["completed"] or 1
+        for name in self.TIMERS:
+            values[f"{name}_avg"] = values.pop(f"{name}_total") / completed
+        return values
+
+
+class HashingExecutor:
+    """
+    Bounded process pool for CPU heavy password hashing.
+
+    Jobs beyond ``pool_size + queue_depth`` in flight are rejected with
+    :class:`HashingQueueFull` instead of piling up, and every job is bounded by
+    ``timeout`` seconds. With ``pool_size=0`` jobs run in the calling thread
+    (or in the default threadpool for the async entry point).
+
+    :param pool_size: Number of worker processes.
+    :param queue_depth: Number of jobs allowed to wait for a free worker.
+    :param timeout: Maximum number of seconds to wait for a single job.
+    """
+
+    def __init__(self, pool_size: int, queue_depth: int, timeout: float):
+        self.pool_size = pool_size
+        self.queue_depth = queue_depth
+        self.timeout = timeout
+        self.metrics = HashingMetrics()
+        self._slots = threading.BoundedSemaphore(max(pool_size, 1) + queue_depth)
+        self._pool: ProcessPoolExecutor | None = None
+        self._pool_lock = threading.Lock()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    max_workers=self.pool_size,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._pool
+
+    def _acquire_slot(self) -> None:
+        # the slot is released by the job itself, so a context manager does not fit
+        if not self._slots.acquire(  # pylint: disable=consider-using-with
+            blocking=False
+        ):
+            self.metrics.increment("rejected")
+            raise HashingQueueFull("Password hashing queue is full")
+        self.metrics.increment("submitted")
+
+    def _submit(self, func: Callable, *args) -> Future:
+        self._acquire_slot()
+        submitted = time.time()
+        try:
+            future = self._get_pool().submit(_timed_call, func, *args)
+        except Exception:
+            self._slots.release()
+            raise
+
+        def _done(done: Future) -> None:
+            self._slots.release()
+            if done.cancelled() or done.exception() is not None:
+                return
+            _, started, hash_time = done.result()
+            self.metrics.record_completed(started - submitted, hash_time)
+
+        future.add_done_callback(_done)
+        return future
+
+    def _run_inline(self, func: Callable, *args) -> Any:
+        self._acquire_slot()
+        try:
+            result, _, hash_time = _timed_call(func, *args)
+        finally:
+            self._slots.release()
+        self.metrics.record_completed(0.0, hash_time)
+        return result
+
+    def run(self, func: Callable, *args) -> Any:
+        """
+        Run ``func`` on the pool and block the calling thread until it finishes.
+
+        :param func: Picklable module-level callable to run.
+        :param args: Positional arguments for ``func``.
+        :return: The value returned by ``func``.
+        """
+        if self.pool_size <= 0:
+            return self._run_inline(func, *args)
+        future = self._submit(func, *args)
+        try:
+            result, _, _ = future.result(timeout=self.timeout)
+        except FutureTimeoutError as exc:
+            future.cancel()
+            self.metrics.increment("timeouts")
+            raise HashingTimeout("Password hashing timed out") from exc
+        return result
+
+    async def run_async(self, func: Callable, *args) -> Any:
+        """
+        Run ``func`` on the pool without blocking the event loop or a threadpool worker.
+
+        :param func: Picklable module-level callable to run.
+        :param args: Positional arguments for ``func``.
+        :return: The value returned by ``func``.
+        """
+        if self.pool_size <= 0:
+            return await run_in_threadpool(self._run_inline, func, *args)
+        future = self._submit(func, *args)
+        try:
+            result, _, _ = await asyncio.wait_for(
+                asyncio.wrap_future(future), timeout=self.timeout
+            )
+        except asyncio.TimeoutError as exc:
+            future.cancel()
+            self.metrics.increment("timeouts")
+            raise HashingTimeout("Password hashing timed out") from exc
+        return result
+
+    def shutdown(self) -> None:
+        """Stop the worker processes; the pool is recreated lazily on next use."""
+        with self._pool_lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=True, cancel_futures=True)
+                self._pool = None
+
+
+hash_executor = HashingExecutor(
+    pool_size=settings.HASH_POOL_SIZE,
+    queue_depth=settings.HASH_QUEUE_DEPTH,
+    timeout=settings.HASH_TIMEOUT,
+)
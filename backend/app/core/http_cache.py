@@ -0,0 +1,178 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Awaitable, Callable
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app.core.cache import CachedBody, CatalogCache
+from app.core.compression import (
+    ENCODINGS,
+    choose_encoding,
+    compressed_variants,
+    encoded_etag,
+)
+
+# responses depend on the caller being authenticated, clients must revalidate them
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(body: bytes) -> str:
+    """
+    Build a strong entity tag from the response body.
+
+    :param body: Serialized response body.
+    :return: Quoted entity tag.
+    """
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """
+    Tell whether the ``If-None-Match`` header of the request matches the entity tag.
+
+    :param request: Current request.
+    :param etag: Entity tag of the current representation.
+    :return: True if the client's copy is still current.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    # weak comparison as required for If-None-Match, any content coding of the
+    # representation matches as well
+    candidates = {
+        candidate.strip().removeprefix("W/") for candidate in header.split(",")
+    }
+    return etag in candidates or any(
+        encoded_etag(etag, encoding) in candidates for encoding in ENCODINGS
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # naive database timestamps are stored in UTC
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value
+
+
+def validator_headers(etag: str, last_modified: datetime | None) -> dict[str, str]:
+    """
+    Build the validator headers of a representation.
+
+    :param etag: Quoted entity tag.
+    :param last_modified: Modification time of the representation.
+    :return: ETag, Last-Modified and Cache-Control headers.
+    """
+    headers = {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+    return headers
+
+
+def not_modified(
+    request: Request, etag: str, last_modified: datetime | None = None
+) -> bool:
+    """
+    Evaluate the request preconditions against the current validators.
+
+    ``If-Modified-Since`` is only considered without ``If-None-Match``.
+
+    :param request: Current request.
+    :param etag: Entity tag of the current representation.
+    :param last_modified: Modification time of the current representation.
+    :return: True if a 304 response can be sent.
+    """
+    if "if-none-match" in request.headers:
+        return etag_matches(request, etag)
+    header = request.headers.get("if-modified-since")
+    if not header or last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    # Last-Modified has a one second resolution
+    return _as_utc(last_modified).replace(microsecond=0) <= _as_utc(since)
+
+
+def cached_body(body: bytes, headers: dict[str, str] | None = None) -> CachedBody:
+    """
+    Prepare a serialized body for caching, with its entity tag and compressed variants.
+
+    :param body: Serialized response body.
+    :param headers: Response headers to send with the body.
+    :return: Cacheable body.
+    """
+    return CachedBody(
+        body=body,
+        etag=make_etag(body),
+        headers=headers or {},
+        encoded=compressed_variants(body),
+    )
+
+
+def json_response(
+    request: Request, cached: CachedBody, headers: dict[str, str] | None = None
+) -> Response:
+    """
+    Respond with a serialized body or with 304 if the client already has it.
+
+    A precompressed variant is sent when the client accepts its content coding.
+
+    :param request: Current request.
+    :param cached: Serialized body, its entity tag, headers and compressed variants.
+    :param headers: Additional response headers.
+    :return: Response.
+    """
+    headers = {
+        **cached.headers,
+        **(headers or {}),
+        "ETag": cached.etag,
+        "Cache-Control": CACHE_CONTROL,
+    }
+    if cached.encoded:
+        headers["Vary"] = "Accept-Encoding"
+    if etag_matches(request, cached.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    if encoding in cached.encoded:
+        headers["Content-Encoding"] = encoding
+        headers["ETag"] = encoded_etag(cached.etag, encoding)
+        body = cached.encoded[encoding]
+    else:
+        body = cached.body
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def cached_json(
+    request: Request,
+    cache: CatalogCache,
+    adapter: TypeAdapter,
+    load: Callable[[Response], Awaitable[Any]],
+) -> Response:
+    """
+    Serve a JSON response from the cache, loading and serializing it on a miss.
+
+    :param request: Current request, its path and query string are the cache key.
+    :param cache: Versioned response cache.
+    :param adapter: Type adapter of the response model.
+    :param load: Coroutine function loading the response data, headers it sets on
+        the given response are cached with the body.
+    :return: Response, 304 if the client's copy is current.
+    """
+    key = f"{request.url.path}?{request.url.query}"
+    cached = cache.get(key)
+    if cached is None:
+        version = cache.version
+        scratch = Response()
+        data = await load(scratch)
+        body = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+        headers = {
+            name: value
+            for name, value in scratch.headers.items()
+            if name != "content-length"
+        }
+        cached = cached_body(body, headers)
+        cache.set(key, cached, version=version)
+    return json_response(request, cached)
@@ -0,0 +1,323 @@
+import bisect
+import threading
+import time
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, Iterable, NamedTuple
+
+from app.core import settings
+
+
+class Standing(NamedTuple):
+    rank: int
+    member: int
+    score: float
+
+
+class BoardScore(NamedTuple):
+    board: str
+    user_id: int
+    score: float
+    # Monday of the week of a weekly board, None for all-time boards
+    week: date | None
+
+
+def lift_board(exercise_id: int) -> str:
+    return f"lift:exercise:{exercise_id}"
+
+
+def volume_board(kind: str, target_id: int, week: date) -> str:
+    return f"volume:{kind}:{target_id}:{week.isoformat()}"
+
+
+class RankedIndex:
+    """
+    Scores of the members of one leaderboard, kept sorted for rank lookups.
+
+    Members are ordered by descending score, ties by ascending member. The sorted
+    keys are split into chunks of about ``chunk_size`` keys, like
+    ``sortedcontainers.SortedList``: a lookup bisects the last keys of the chunks
+    and then one chunk, an update only moves the tail of one chunk. A Fenwick tree
+    over the chunk lengths (the positional index of ``sortedcontainers``) gives the
+    number of keys before a chunk and the chunk holding a position in O(log n).
+    Updates within a chunk adjust it, it is rebuilt in linear time on the next
+    lookup once a chunk was split or emptied, which only happens every
+    ``chunk_size`` updates of a chunk.
+
+    :param chunk_size: Target number of keys per chunk.
+    """
+
+    def __init__(self, chunk_size: int = 1000):
+        self.chunk_size = chunk_size
+        self._scores: dict[int, float] = {}
+        self._chunks: list[list[tuple[float, int]]] = []
+        # last key of every chunk
+        self._maxes: list[tuple[float, int]] = []
+        # 1-based Fenwick tree of the chunk lengths, None when out of date
+        self._index: list[int] | None = None
+
+    def __len__(self) -> int:
+        return len(self._scores)
+
+    def load(self, scores: dict[int, float]) -> None:
+        """
+        Replace the content of the index with a single sort.
+
+        :param scores: Score of every member, members without a positive score are skipped.
+        """
+        self._scores = {member: score for member, score in scores.items() if score > 0}
+        keys = sorted((-score, member) for member, score in self._scores.items())
+        self._chunks = [
+            keys[start : start + self.chunk_size]
+            for start in range(0, len(keys), self.chunk_size)
+        ]
+        self._maxes = [chunk[-1] for chunk in self._chunks]
+        self._index = None
+
+    def _build_index(self) -> list[int]:
+        index = [0] + [len(chunk) for chunk in self._chunks]
+        for position in range(1, len(index)):
+            parent = position + (position & -position)
+            if parent < len(index):
+                index[parent] += index[position]
+        self._index = index
+        return index
+
+    def _resize(self, position: int, delta: int) -> None:
+        if self._index is None:
+            return
+        position += 1
+        while position < len(self._index):
+            self._index[position] += delta
+            position += position & -position
+
+    def _preceding(self, position: int) -> int:
+        # number of keys in the chunks before the one at position
+        index = self._index if self._index is not None else self._build_index()
+        total = 0
+        while position:
+            total += index[position]
+            position -= position & -position
+        return total
+
+    def _seek(self, offset: int) -> tuple[int, int]:
+        # chunk holding the key at offset and the position of the key in it
+        index = self._index if self._index is not None else self._build_index()
+        position = 0
+        step = 1 << (len(index) - 1).bit_length()
+        while step:
+            child = position + step
+            if child < len(index) and index[child] <= offset:
+                offset -= index[child]
+                position = child
+            step >>= 1
+        return position, offset
+
+    def _locate(self, key: tuple[float, int]) -> int:
+        return min(bisect.bisect_left(self._maxes, key), len(self._chunks) - 1)
+
+    def _insert(self, key: tuple[float, int]) -> None:
+        if not self._chunks:
+            self._chunks.append([key])
+            self._maxes.append(key)
+            self._index = None
+            return
+        position = self._locate(key)
+        chunk = self._chunks[position]
+        bisect.insort(chunk, key)
+        self._maxes[position] = chunk[-1]
+        self._resize(position, 1)
+        if len(chunk) > 2 * self.chunk_size:
+            self._chunks[position : position + 1] = [
+                chunk[: self.chunk_size],
+                chunk[self.chunk_size :],
+            ]
+            self._maxes[position : position + 1] = [
+                chunk[self.chunk_size - 1],
+                chunk[-1],
+            ]
+            self._index = None
+
+    def _remove(self, key: tuple[float, int]) -> None:
+        position = self._locate(key)
+        chunk = self._chunks[position]
+        del chunk[bisect.bisect_left(chunk, key)]
+        if chunk:
+            self._maxes[position] = chunk[-1]
+            self._resize(position, -1)
+        else:
+            del self._chunks[position]
+            del self._maxes[position]
+            self._index = None
+
+    def set(self, member: int, score: float) -> None:
+        """
+        Set the score of a member, a score that is not positive removes it.
+
+        :param member: ID of the member.
+        :param score: New score.
+        """
+        previous = self._scores.pop(member, None)
+        if previous is not None:
+            self._remove((-previous, member))
+        if score > 0:
+            self._scores[member] = score
+            self._insert((-score, member))
+
+    def rank(self, member: int) -> Standing | None:
+        """
+        Find the position of a member.
+
+        :param member: ID of the member.
+        :return: 1-based standing or None if the member is not ranked.
+        """
+        score = self._scores.get(member)
+        if score is None:
+            return None
+        key = (-score, member)
+        position = self._locate(key)
+        rank = (
+            self._preceding(position)
+            + bisect.bisect_left(self._chunks[position], key)
+            + 1
+        )
+        return Standing(rank, member, score)
+
+    def top(self, skip: int, limit: int) -> list[Standing]:
+        """
+        Retrieve a page of the ranking.
+
+        :param skip: Number of leading members to skip.
+        :param limit: Maximum number of members.
+        :return: Standings in rank order.
+        """
+        page: list[tuple[float, int]] = []
+        if skip >= len(self._scores):
+            return page
+        position, start = self._seek(skip)
+        for chunk in islice(self._chunks, position, None):
+            page.extend(chunk[start : start + limit - len(page)])
+            if len(page) >= limit:
+                break
+            start = 0
+        return [
+            Standing(skip + position, member, -score)
+            for position, (score, member) in enumerate(page, start=1)
+        ]
+
+
+class Leaderboards:
+    """
+    Per-process ranked indexes of every leaderboard.
+
+    The ``leaderboardentry`` table is the store shared by the workers: writes
+    checkpoint their new scores to it in their transaction and apply them to the
+    indexes of their own process once committed, every other process reads the
+    changed rows back at most every ``sync_interval`` seconds. Weekly boards older
+    than the retention are dropped.
+
+    :param sync_interval: Minimum number of seconds between two reads of the table.
+    """
+
+    def __init__(self, sync_interval: float):
+        self.sync_interval = sync_interval
+        # newest update time read from the table, None until the first full load
+        self.watermark: datetime | None = None
+        self._boards: dict[str, RankedIndex] = {}
+        self._weeks: dict[str, date] = {}
+        self._synced_at = float("-inf")
+        self._lock = threading.Lock()
+
+    def sync_due(self) -> bool:
+        return time.monotonic() - self._synced_at >= self.sync_interval
+
+    def apply(self, scores: Iterable[Any], since: date) -> None:
+        """
+        Apply absolute scores to the indexes.
+
+        :param scores: Rows with ``board``, ``user_id``, ``score`` and ``week``.
+        :param since: First retained week, older weekly scores are ignored.
+        """
+        boards: dict[str, list[Any]] = {}
+        for item in scores:
+            if item.week is None or item.week >= since:
+                boards.setdefault(item.board, []).append(item)
+        with self._lock:
+            for board, items in boards.items():
+                index = self._boards.get(board)
+                if index is None:
+                    # a new board, e.g. on the first read of the table, is sorted once
+                    index = RankedIndex()
+                    index.load({item.user_id: item.score for item in items})
+                    if len(index):
+                        self._boards[board] = index
+                        if items[0].week is not None:
+                            self._weeks[board] = items[0].week
+                    continue
+                for item in items:
+                    index.set(item.user_id, item.score)
+
+    def mark_synced(self, watermark: datetime | None, since: date) -> None:
+        """
+        Record a read of the table and drop the weekly boards beyond the retention.
+
+        :param watermark: Newest update time of the rows read.
+        :param since: First retained week.
+        """
+        with self._lock:
+            self._synced_at = time.monotonic()
+            if watermark is not None and (
+                self.watermark is None or watermark > self.watermark
+            ):
+                self.watermark = watermark
+            for board in [board for board, week in self._weeks.items() if week < since]:
+                del self._weeks[board]
+                del self._boards[board]
+
+    def rank(self, board: str, member: int) -> tuple[Standing | None, int]:
+        """
+        Find the position of a member on a board.
+
+        :param board: Name of the board.
+        :param member: ID of the member.
+        :return: Standing of the member (None if not ranked) and number of ranked members.
+        """
+        with self._lock:
+            index = self._boards.get(board)
+            if index is None:
+                return None, 0
+            return index.rank(member), len(index)
+
+    def top(self, board: str, skip: int, limit: int) -> tuple[list[Standing], int]:
+        """
+        Retrieve a page of a board.
+
+        :param board: Name of the board.
+        :param skip: Number of leading members to skip.
+        :param limit: Maximum number of members.
+        :return: Standings in rank order and number of ranked members.
+        """
+        with self._lock:
+            index = self._boards.get(board)
+            if index is None:
+                return [], 0
+            return index.top(skip, limit), len(index)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._boards.clear()
+            self._weeks.clear()
+            self.watermark = None
+            self._synced_at = float("-inf")
+
+    def stats(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "boards": len(self._boards),
+                "entries": sum(len(index) for index in self._boards.values()),
+                "watermark": self.watermark.isoformat() if self.watermark else None,
+            }
+
+
+# leaderboards of this process, synchronized through the checkpoint table
+leaderboards = Leaderboards(sync_interval=settings.LEADERBOARD_SYNC_INTERVAL)
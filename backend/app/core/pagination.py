@@ -0,0 +1,101 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Sequence
+
+from sqlalchemy import Select, tuple_
+from sqlalchemy.orm import InstrumentedAttribute
+
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded."""
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Encode the key values of the last row of a page into an opaque cursor.
+
+    :param values: Values of the ordering columns.
+    :return: URL safe cursor string.
+    """
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[InstrumentedAttribute]) -> tuple:
+    """
+    Decode an opaque cursor back into key values typed after the ordering columns.
+
+    :param cursor: Cursor returned by :func:`encode_cursor`.
+    :param columns: Ordering columns the cursor was created for.
+    :raises InvalidCursor: If the cursor is malformed or does not match the columns.
+    :return: Tuple of key values.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidCursor("Invalid pagination cursor") from exc
+    if not isinstance(values, list) or len(values) != len(columns):
+        raise InvalidCursor("Invalid pagination cursor")
+    try:
+        return tuple(
+            datetime.fromisoformat(value)
+            if column.type.python_type is datetime
+            else column.type.python_type(value)
+            for column, value in zip(columns, values)
+        )
+    except (TypeError, ValueError) as exc:
+        raise InvalidCursor("Invalid pagination cursor") from exc
+
+
+def keyset_select(
+    statement: Select,
+    columns: Sequence[InstrumentedAttribute],
+    *,
+    cursor: str | None,
+    limit: int,
+) -> Select:
+    """
+    Restrict a statement to the page following ``cursor`` in ascending key order.
+
+    One row more than ``limit`` is selected so that the caller can tell whether a next page exists.
+
+    :param statement: Select statement to paginate.
+    :param columns: Indexed, unique (together) ordering columns.
+    :param cursor: Cursor of the previous page or None for the first page.
+    :param limit: Page size.
+    :return: Paginated statement.
+    """
+    if cursor is not None:
+        values = decode_cursor(cursor, columns)
+        if len(columns) == 1:
+            statement = statement.where(columns[0] > values[0])
+        else:
+            statement = statement.where(tuple_(*columns) > tuple_(*values))
+    return statement.order_by(*columns).limit(limit + 1)
+
+
+def split_page(
+    rows: Sequence[Any], columns: Sequence[InstrumentedAttribute], limit: int
+) -> tuple[list[Any], str | None]:
+    """
+    Trim the extra row fetched by :func:`keyset_select` and build the next cursor.
+
+    :param rows: Rows returned by the paginated statement.
+    :param columns: Ordering columns used for the statement.
+    :param limit: Page size.
+    :return: Tuple of the page rows and the next cursor, or None on the last page.
+    """
+    page = list(rows[:limit])
+    if len(rows) <= limit or not page:
+        return page, None
+    last = page[-1]
+    return page, encode_cursor([getattr(last, column.key) for column in columns])
@@ -0,0 +1,66 @@
+import logging
+from datetime import date
+
+from sqlalchemy import Connection, text
+
+
+LOG = logging.getLogger(__name__)
+
+
+def add_months(month: date, months: int) -> date:
+    """
+    Move the first day of a month by a number of months.
+
+    :param month: Any day of the starting month.
+    :param months: Number of months to add, may be negative.
+    :return: First day of the resulting month.
+    """
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_partition_name(table: str, month: date) -> str:
+    return f"{table}_{month:%Y_%m}"
+
+
+def create_month_partitions(
+    connection: Connection, table: str, start: date, months: int
+) -> list[str]:
+    """
+    Create the missing monthly range partitions of a Postgres partitioned table.
+
+    Does nothing on other databases or when the table is not partitioned.
+
+    :param connection: SQLAlchemy connection, committed by the caller.
+    :param table: Name of the table partitioned by range on a timestamp.
+    :param start: Any day of the first month to create.
+    :param months: Number of consecutive months to create.
+    :return: Names of the partitions that did not exist before.
+    """
+    if connection.dialect.name != "postgresql":
+        return []
+    partitioned = connection.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table WHERE partrelid = to_regclass(:table)"
+        ),
+        {"table": table},
+    ).scalar()
+    if not partitioned:
+        return []
+    created = []
+    for offset in range(months):
+        month = add_months(start, offset)
+        name = month_partition_name(table, month)
+        if connection.execute(
+            text("SELECT to_regclass(:name)"), {"name": name}
+        ).scalar():
+            continue
+        connection.execute(
+            text(
+                f"CREATE TABLE {name} PARTITION OF {table} FOR VALUES "
+                f"FROM ('{month}') TO ('{add_months(month, 1)}')"
+            )
+        )
+        LOG.info("Created partition %s", name)
+        created.append(name)
+    return created
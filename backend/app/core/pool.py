@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import threading
+import time
+from typing import Any
+
+from sqlalchemy import event, exc, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry, Pool, QueuePool
+from starlette.concurrency import run_in_threadpool
+
+from app.core import settings
+
+
+LOG = logging.getLogger(__name__)
+
+
+class PoolMetrics:
+    """Thread-safe checkout wait statistics of one connection pool."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._values = {
+            "checkouts": 0,
+            "timeouts": 0,
+            "invalidations": 0,
+            "liveness_failures": 0,
+            "wait_total": 0.0,
+            "wait_max": 0.0,
+            # result of the last liveness check
+            "healthy": True,
+        }
+
+    def record_wait(self, wait: float, timed_out: bool) -> None:
+        with self._lock:
+            if timed_out:
+                self._values["timeouts"] += 1
+            else:
+                self._values["checkouts"] += 1
+            self._values["wait_total"] += wait
+            self._values["wait_max"] = max(self._values["wait_max"], wait)
+
+    def record_invalidation(self) -> None:
+        with self._lock:
+            self._values["invalidations"] += 1
+
+    def record_liveness(self, healthy: bool) -> None:
+        with self._lock:
+            self._values["healthy"] = healthy
+            if not healthy:
+                self._values["liveness_failures"] += 1
+
+    def snapshot(self) -> dict[str, float | int | bool]:
+        with self._lock:
+            values = dict(self._values)
+        attempts = (values["checkouts"] + values["timeouts"]) or 1
+        values["wait_avg"] = values.pop("wait_total") / attempts
+        return values
+
+
+# pool logging name -> metrics, kept outside of the pool so that they survive `dispose()`
+POOL_METRICS: dict[str, PoolMetrics] = {}
+
+
+def _metrics_for(pool: Pool) -> PoolMetrics:
+    # pylint: disable=protected-access
+    return POOL_METRICS.setdefault(pool._orig_logging_name, PoolMetrics())
+
+
+class _CheckoutTimingMixin:
+    """Measure how long a checkout waits for a free connection."""
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        started = time.perf_counter()
+        try:
+            entry = super()._do_get()
+        except exc.TimeoutError:
+            _metrics_for(self).record_wait(time.perf_counter() - started, True)
+            raise
+        _metrics_for(self).record_wait(time.perf_counter() - started, False)
+        return entry
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+def pool_options(name: str, *, is_async: bool = False) -> dict[str, Any]:
+    """
+    Build the ``create_engine`` pool keyword arguments from the settings.
+
+    :param name: Unique pool name used to report its metrics.
+    :param is_async: Whether the options are for ``create_async_engine``.
+    :return: Keyword arguments for the engine factory.
+    """
+    return {
+        "poolclass": InstrumentedAsyncQueuePool if is_async else InstrumentedQueuePool,
+        "pool_logging_name": name,
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_POOL_MAX_OVERFLOW,
+        "pool_timeout": settings.DB_POOL_TIMEOUT,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+        "pool_pre_ping": settings.DB_POOL_PRE_PING,
+    }
+
+
+def instrument(engine: Engine | AsyncEngine) -> Engine | AsyncEngine:
+    """
+    Count connection invalidations of an engine created with :func:`pool_options`.
+
+    :param engine: Engine to instrument.
+    :return: The same engine.
+    """
+    sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _on_invalidate(dbapi_connection, connection_record, exception):
+        _metrics_for(sync_engine.pool).record_invalidation()
+
+    return engine
+
+
+def pool_status(engine: Engine | AsyncEngine) -> dict[str, Any]:
+    """
+    Report the live state of an engine's pool together with its checkout metrics.
+
+    :param engine: Engine created with :func:`pool_options`.
+    :return: Dictionary with pool size, checked out, idle and overflow counts and wait metrics.
+    """
+    pool = engine.pool
+    status: dict[str, Any] = {"status": pool.status()}
+    if isinstance(pool, QueuePool):
+        status.update(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            idle=pool.checkedin(),
+            overflow=max(pool.overflow(), 0),
+        )
+    status.update(_metrics_for(pool).snapshot())
+    return status
+
+
+async def check_liveness(engines: dict[str, Engine | AsyncEngine]) -> None:
+    """
+    Ping every engine once and drop the pooled connections of the ones that fail.
+
+    Replaces per-checkout pre-ping: stale connections are discarded in bulk
+    instead of adding a round trip to every checkout.
+
+    :param engines: Engines to check by name.
+    """
+    for name, engine in engines.items():
+        sync_engine = engine.sync_engine if isinstance(engine, AsyncEngine) else engine
+        try:
+            if isinstance(engine, AsyncEngine):
+                async with engine.connect() as connection:
+                    await connection.execute(text("SELECT 1"))
+            else:
+                await run_in_threadpool(_ping, engine)
+        # drivers also raise OSError, TimeoutError..., none may end the check loop
+        except Exception:  # pylint: disable=broad-exception-caught
+            LOG.warning(
+                "Liveness check of pool %s failed, disposing it.", name, exc_info=True
+            )
+            _metrics_for(sync_engine.pool).record_liveness(False)
+            if isinstance(engine, AsyncEngine):
+                await engine.dispose()
+            else:
+                await run_in_threadpool(engine.dispose)
+        else:
+            _metrics_for(sync_engine.pool).record_liveness(True)
+
+
+def _ping(engine: Engine) -> None:
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+
+async def run_liveness_checks(
+    engines: dict[str, Engine | AsyncEngine], interval: float
+) -> None:
+    """
+    Run :func:`check_liveness` every ``interval`` seconds until cancelled.
+
+    :param engines: Engines to check by name.
+    :param interval: Number of seconds between checks.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await check_liveness(engines)
+        except Exception:  # pylint: disable=broad-exception-caught
+            # e.g. a failing dispose, the next round checks again
+            LOG.exception("Liveness check failed.")
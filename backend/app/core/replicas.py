@@ -0,0 +1,122 @@
+import itertools
+import threading
+import time
+from typing import Any
+
+from fastapi import Request
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, ExceptionContext
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, ORMExecuteState
+
+
+WROTE_KEY = "db_wrote"
+
+
+class ReplicaSet:
+    """
+    Round-robin selection over read replica engines.
+
+    A replica whose connection fails is skipped for ``retry_after`` seconds, when
+    every replica is down the caller falls back to the primary.
+
+    :param engines: Sync engines of the replicas (``AsyncEngine.sync_engine`` for async engines).
+    :param retry_after: Number of seconds a failed replica is skipped.
+    """
+
+    def __init__(self, engines: list[Engine], retry_after: float):
+        self.engines = engines
+        self.retry_after = retry_after
+        self._down_until: dict[Engine, float] = {}
+        self._cycle = itertools.cycle(engines)
+        self._lock = threading.Lock()
+        for engine in engines:
+            event.listen(engine, "handle_error", self._on_error)
+
+    def _on_error(self, context: ExceptionContext) -> None:
+        if context.is_disconnect or context.connection is None:
+            self.mark_down(context.engine)
+
+    def mark_down(self, engine: Engine) -> None:
+        with self._lock:
+            self._down_until[engine] = time.monotonic() + self.retry_after
+
+    def choose(self) -> Engine | None:
+        """
+        Pick the next healthy replica.
+
+        :return: Replica engine or None if no replica is available.
+        """
+        with self._lock:
+            now = time.monotonic()
+            for _ in range(len(self.engines)):
+                engine = next(self._cycle)
+                if self._down_until.get(engine, 0) <= now:
+                    return engine
+        return None
+
+
+class RoutingSession(Session):
+    """
+    Session sending reads to a replica and anything else to the primary.
+
+    Once the request wrote through another session (or this one flushes), every
+    following statement goes to the primary so that the request reads its own writes.
+    The replica is chosen once per session to keep its reads consistent.
+
+    :param primary: Engine of the primary database.
+    :param replicas: Replica set to read from.
+    :param request_state: State of the request the session belongs to.
+    """
+
+    def __init__(
+        self,
+        *args,
+        primary: Engine,
+        replicas: ReplicaSet,
+        request_state: Any = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.primary = primary
+        self.replicas = replicas
+        self.request_state = request_state
+        self.replica: Engine | None = None
+        event.listen(self, "after_flush", self._mark_written)
+
+    def _mark_written(self, *args) -> None:
+        self.info[WROTE_KEY] = True
+
+    def _use_primary(self, clause: Any) -> bool:
+        if self._flushing or self.info.get(WROTE_KEY):
+            return True
+        if getattr(self.request_state, WROTE_KEY, False):
+            return True
+        return clause is not None and getattr(clause, "is_dml", False)
+
+    def get_bind(self, mapper=None, clause=None, **kwargs) -> Engine:
+        if self._use_primary(clause):
+            return self.primary
+        if self.replica is None:
+            self.replica = self.replicas.choose()
+        return self.replica or self.primary
+
+
+def track_writes(request: Request, db: Session | AsyncSession) -> None:
+    """
+    Flag the request as having written once the given primary session writes.
+
+    :param request: Current request.
+    :param db: SQLAlchemy sync or async primary session opened for the request.
+    """
+    sync_session = db.sync_session if isinstance(db, AsyncSession) else db
+
+    def _mark_written(*args) -> None:
+        setattr(request.state, WROTE_KEY, True)
+
+    def _on_execute(orm_execute_state: ORMExecuteState) -> None:
+        if not orm_execute_state.is_select:
+            _mark_written()
+
+    event.listen(sync_session, "after_flush", _mark_written)
+    event.listen(sync_session, "do_orm_execute", _on_execute)
@@ -0,0 +1,26 @@
+from typing import Any
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+
+def _default(value: Any) -> Any:
+    # types orjson does not serialize natively (e.g. Decimal, pydantic models)
+    return jsonable_encoder(value)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    Datetimes are written in ISO 8601 like pydantic does, with ``Z`` for UTC, and
+    anything orjson does not know falls back to ``jsonable_encoder``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
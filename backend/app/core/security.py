@@ -1,3 +1,5 @@
+import hashlib
+import time
 from datetime import datetime, timedelta, UTC
 from typing import Any
 
@@ -5,6 +7,9 @@ from jose import jwt
 from passlib.context import CryptContext
 
 from app.core import settings
+from app.core.cache import token_cache
+from app.core.hashing import hash_executor
+from app.schemas import TokenPayload
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -23,9 +28,42 @@ def create_access_token(subject: str | Any, expires_delta: timedelta = None) ->
     return encoded_jwt
 
 
+def decode_access_token(token: str) -> TokenPayload:
+    """
+    Verify an access token and parse its claims, reusing the result for repeated tokens.
+
+    :param token: Encoded JWT.
+    :raises jwt.JWTError: If the token is invalid or expired.
+    :raises ValidationError: If the claims do not match the token payload schema.
+    :return: Parsed token payload.
+    """
+    token_cache.bind_signing_key(settings.SECRET_KEY, settings.ALGORITHM)
+    digest = hashlib.sha256(token.encode()).digest()
+    token_data = token_cache.get(digest)
+    if token_data is not None:
+        return token_data
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+    token_data = TokenPayload(**payload)
+    if "exp" in payload:
+        ttl = min(payload["exp"] - time.time(), token_cache.ttl)
+        if ttl > 0:
+            token_cache.set(digest, token_data, ttl=ttl)
+    return token_data
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    return await hash_executor.run_async(
+        verify_password, plain_password, hashed_password
+    )
+
+
+async def get_password_hash_async(password: str) -> str:
+    return await hash_executor.run_async(get_password_hash, password)
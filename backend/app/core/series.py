@@ -0,0 +1,58 @@
+import numpy as np
+
+
+def daily(
+    days: np.ndarray, values: np.ndarray, reduce: np.ufunc
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Reduce a time ordered series to one value per day.
+
+    :param days: Day numbers of the values, in ascending order.
+    :param values: Values of the series.
+    :param reduce: Binary ufunc folding the values of a day, e.g. ``np.maximum``.
+    :return: Distinct days and their reduced values.
+    """
+    if days.size == 0:
+        return days, values
+    new_day = np.empty(days.size, dtype=bool)
+    new_day[0] = True
+    new_day[1:] = days[1:] != days[:-1]
+    starts = np.flatnonzero(new_day)
+    return days[starts], reduce.reduceat(values, starts)
+
+
+def lttb(x: np.ndarray, y: np.ndarray, points: int) -> np.ndarray:
+    """
+    Downsample a series with the Largest-Triangle-Three-Buckets algorithm.
+
+    The first and last points are kept, every bucket in between keeps the point
+    forming the largest triangle with the previously kept point and the average
+    of the next bucket, which preserves peaks and trends of the series.
+
+    :param x: Ascending x coordinates.
+    :param y: Y coordinates.
+    :param points: Number of points to keep, at least 3.
+    :return: Indices of the kept points in ascending order.
+    """
+    size = x.size
+    if points >= size or points < 3:
+        return np.arange(size)
+    x, y = x.astype(np.float64), y.astype(np.float64)
+    # bucket boundaries over the points between the first and the last one
+    edges = (np.arange(points - 1) * (size - 2) / (points - 2)).astype(np.int64) + 1
+    edges[-1] = size - 1
+    selected = np.empty(points, dtype=np.int64)
+    selected[0], selected[-1] = 0, size - 1
+    previous = 0
+    for bucket in range(points - 2):
+        start, end = edges[bucket], edges[bucket + 1]
+        next_end = edges[bucket + 2] if bucket + 2 < points - 1 else size
+        average_x = x[end:next_end].mean()
+        average_y = y[end:next_end].mean()
+        areas = np.abs(
+            (x[previous] - average_x) * (y[start:end] - y[previous])
+            - (x[previous] - x[start:end]) * (average_y - y[previous])
+        )
+        previous = start + int(areas.argmax())
+        selected[bucket + 1] = previous
+    return selected
@@ -8,18 +8,95 @@ API_STR = "/api"
 
 # database related constants
 DB_DRIVERNAME = "postgresql+psycopg2"
+ASYNC_DB_DRIVERNAME = "postgresql+asyncpg"
+# commit once per request instead of once per CRUD call
+DB_UNIT_OF_WORK = os.getenv("DB_UNIT_OF_WORK", "false").lower() == "true"
 DB_USER = os.getenv("POSTGRES_USER")
 DB_PASSWORD = os.getenv("POSTGRES_PASSWORD")
 DB_NAME = os.getenv("POSTGRES_DB")
 DB_HOST = os.getenv("POSTGRES_HOST")
 DB_PORT = os.getenv("POSTGRES_PORT")
+# comma separated `host[:port]` list of read replicas, reads use the primary when empty
+DB_REPLICA_HOSTS = [
+    host.strip()
+    for host in os.getenv("POSTGRES_REPLICA_HOSTS", "").split(",")
+    if host.strip()
+]
+DB_REPLICA_RETRY_SECONDS = float(os.getenv("POSTGRES_REPLICA_RETRY_SECONDS", "30"))
+# connection pool of every engine (primary and replicas, sync and async)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_POOL_MAX_OVERFLOW = int(os.getenv("DB_POOL_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "-1"))  # seconds, -1 never recycles
+# a positive interval pings every pool in the background instead of on each checkout
+DB_POOL_LIVENESS_INTERVAL = float(os.getenv("DB_POOL_LIVENESS_INTERVAL", "0"))
+DB_POOL_PRE_PING = (
+    os.getenv("DB_POOL_PRE_PING", "true").lower() == "true"
+    and DB_POOL_LIVENESS_INTERVAL <= 0
+)
 
+# monthly partitions of the set table created ahead of the current month
+DB_PARTITION_MONTHS_AHEAD = int(os.getenv("DB_PARTITION_MONTHS_AHEAD", "3"))
 
 # security
 SECRET_KEY = os.getenv("SECRET_KEY", "secret")
 ACCESS_TOKEN_EXPIRE_MINUTES = 60 * 24 * 7  # 7 days
 ALGORITHM = "HS256"
 
+# password hashing executor (0 workers hashes in the request thread)
+HASH_POOL_SIZE = int(os.getenv("HASH_POOL_SIZE", "2"))
+HASH_QUEUE_DEPTH = int(os.getenv("HASH_QUEUE_DEPTH", "32"))
+HASH_TIMEOUT = float(os.getenv("HASH_TIMEOUT", "5"))
+
+# authenticated user cache, kept per process so the TTL bounds staleness across workers
+PRINCIPAL_CACHE_SIZE = int(os.getenv("PRINCIPAL_CACHE_SIZE", "10000"))
+PRINCIPAL_CACHE_TTL = float(os.getenv("PRINCIPAL_CACHE_TTL", "60"))
+
+# verified access tokens, evicted at their expiry
+TOKEN_CACHE_SIZE = int(os.getenv("TOKEN_CACHE_SIZE", "10000"))
+
+# serialized catalog responses, flushed on catalog writes in this process and bounded
+# by the TTL in the other workers
+CATALOG_CACHE_SIZE = int(os.getenv("CATALOG_CACHE_SIZE", "1000"))
+CATALOG_CACHE_MAX_BYTES = int(os.getenv("CATALOG_CACHE_MAX_BYTES", str(64 * 2**20)))
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "300"))
+
+# response compression, brotli is used when the `brotli` package is installed
+COMPRESSION_MINIMUM_SIZE = int(os.getenv("COMPRESSION_MINIMUM_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.getenv("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.getenv("COMPRESSION_BROTLI_QUALITY", "4"))
+COMPRESSION_MEDIA_TYPES = (
+    "application/json",
+    "text/html",
+    "text/plain",
+    "text/csv",
+    "application/x-ndjson",
+)
+# workout logging, sets accepted by one request
+WORKOUT_MAX_SETS = int(os.getenv("WORKOUT_MAX_SETS", "500"))
+
+# downsampled progress series, cached per user, exercise and history version
+PROGRESS_DEFAULT_POINTS = int(os.getenv("PROGRESS_DEFAULT_POINTS", "200"))
+PROGRESS_MAX_POINTS = int(os.getenv("PROGRESS_MAX_POINTS", "2000"))
+PROGRESS_CACHE_SIZE = int(os.getenv("PROGRESS_CACHE_SIZE", "5000"))
+PROGRESS_CACHE_TTL = float(os.getenv("PROGRESS_CACHE_TTL", "3600"))
+
+# leaderboards ranked in every process and synchronized through the checkpoint table,
+# the overlap re-reads recent rows whose transactions committed late
+LEADERBOARD_SYNC_INTERVAL = float(os.getenv("LEADERBOARD_SYNC_INTERVAL", "5"))
+LEADERBOARD_SYNC_OVERLAP = float(os.getenv("LEADERBOARD_SYNC_OVERLAP", "60"))
+# weekly boards kept in memory, including the current week
+LEADERBOARD_WEEKS = int(os.getenv("LEADERBOARD_WEEKS", "8"))
+
+# exercise recommendations, neighbors kept per exercise by the offline job and weeks
+# of history whose exercises seed the recommendations of a user
+RECOMMENDATION_NEIGHBORS = int(os.getenv("RECOMMENDATION_NEIGHBORS", "20"))
+RECOMMENDATION_HISTORY_WEEKS = int(os.getenv("RECOMMENDATION_HISTORY_WEEKS", "12"))
+
+# batch requests, sub-requests accepted by one batch and reads run at the same time
+BATCH_MAX_REQUESTS = int(os.getenv("BATCH_MAX_REQUESTS", "20"))
+BATCH_CONCURRENCY = int(os.getenv("BATCH_CONCURRENCY", "4"))
+
 CORS_ORIGINS = [
     "http://localhost:3000",
     "http://localhost:8000",
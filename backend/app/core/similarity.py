@@ -0,0 +1,113 @@
+from typing import Iterator
+
+import numpy as np
+
+
+def _group_bounds(keys: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    # starts and sizes of the runs of equal keys of a sorted array
+    new_group = np.empty(keys.size, dtype=bool)
+    new_group[:1] = True
+    new_group[1:] = keys[1:] != keys[:-1]
+    starts = np.flatnonzero(new_group)
+    return starts, np.diff(np.append(starts, keys.size))
+
+
+def cooccurrence(  # pylint: disable=too-many-locals
+    groups: np.ndarray, items: np.ndarray, size: int, max_pairs: int = 10_000_000
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Count the groups containing each pair of items, the product of the sparse
+    group-item incidence matrix with its transpose without its diagonal.
+
+    The rows of the product are computed by blocks of consecutive left items whose
+    groups hold at most ``max_pairs`` items in total (a larger item is a block of
+    its own), so that the memory use does not depend on the number of pairs.
+
+    :param groups: Group of every incidence, sorted, each item at most once per group.
+    :param items: Dense item index (``0 <= item < size``) of every incidence.
+    :param size: Number of items.
+    :param max_pairs: Number of pairs expanded at once, bounds the memory use.
+    :return: Blocks of left items, right items and their counts, sorted by left
+        then right item.
+    """
+    items = items.astype(np.int64)
+    starts, sizes = _group_bounds(groups)
+    group_index = np.repeat(np.arange(starts.size), sizes)
+    # incidences by item: the groups of every item and their bounds
+    by_item = np.argsort(items, kind="stable")
+    item_groups = group_index[by_item]
+    item_bounds = np.searchsorted(items[by_item], np.arange(size + 1))
+    pairs = np.bincount(items, weights=sizes[group_index], minlength=size)
+    cumulative_pairs = np.cumsum(pairs.astype(np.int64))
+
+    first = 0
+    while first < size:
+        done = cumulative_pairs[first - 1] if first else 0
+        last = max(
+            int(np.searchsorted(cumulative_pairs, done + max_pairs, "right")), first + 1
+        )
+        block_groups = item_groups[item_bounds[first] : item_bounds[last]]
+        block_sizes = sizes[block_groups]
+        left = np.repeat(
+            items[by_item[item_bounds[first] : item_bounds[last]]], block_sizes
+        )
+        offsets = np.arange(left.size) - np.repeat(
+            np.cumsum(block_sizes) - block_sizes, block_sizes
+        )
+        right = items[np.repeat(starts[block_groups], block_sizes) + offsets]
+        distinct = left != right
+        code, counts = np.unique(
+            left[distinct] * size + right[distinct], return_counts=True
+        )
+        if code.size:
+            yield code // size, code % size, counts
+        first = last
+
+
+def top_k(  # pylint: disable=too-many-locals
+    source: np.ndarray,
+    target: np.ndarray,
+    score: np.ndarray,
+    k: int,
+    tie_breaker: np.ndarray | None = None,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Keep the ``k`` best scored targets of every source.
+
+    Duplicate pairs keep their best score. Equal scores are ordered by descending
+    ``tie_breaker`` of the target, then by target.
+
+    :param source: Source of every candidate pair.
+    :param target: Target of every candidate pair.
+    :param score: Score of every candidate pair.
+    :param k: Number of targets kept per source.
+    :param tie_breaker: Optional value per target, e.g. its popularity.
+    :return: Sources, 0-based ranks, targets and scores sorted by source and rank.
+    """
+    # single key sorts are much faster than lexsort: deduplicate on the pair code,
+    # then rank on one key made of the source, the score and the tie order
+    targets = int(target.max(initial=0)) + 1
+    code = source.astype(np.int64) * targets + target
+    order = np.argsort(code, kind="stable")
+    code, score = code[order], score[order]
+    bounds, _ = _group_bounds(code)
+    code, score = code[bounds], np.maximum.reduceat(score, bounds)
+    source, target = code // targets, code % targets
+
+    # position of every target once ordered by descending tie breaker, then by ID
+    position = np.arange(targets)
+    if tie_breaker is not None:
+        position[np.argsort(-tie_breaker[:targets], kind="stable")] = position.copy()
+    scores, score_rank = np.unique(-score, return_inverse=True)
+    span = scores.size * targets
+    if (int(source.max(initial=0)) + 1) * span < 2**63:
+        order = np.argsort(
+            source * span + score_rank * targets + position[target], kind="stable"
+        )
+    else:
+        order = np.lexsort((position[target], score_rank, source))
+    source, target, score = source[order], target[order], score[order]
+    starts, sizes = _group_bounds(source)
+    rank = np.arange(source.size) - np.repeat(starts, sizes)
+    kept = rank < k
+    return source[kept], rank[kept], target[kept], score[kept]
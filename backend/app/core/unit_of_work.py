@@ -0,0 +1,69 @@
+from typing import Callable, Coroutine, Any
+
+from fastapi import Request, Response
+from fastapi.routing import APIRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core import settings
+
+
+UNIT_OF_WORK_KEY = "unit_of_work"
+
+
+def is_unit_of_work(db: Session | AsyncSession) -> bool:
+    """
+    Tell whether the session is committed by its request instead of by each CRUD call.
+
+    :param db: SQLAlchemy sync or async database session.
+    :return: True if CRUD methods should only flush.
+    """
+    return db.info.get(UNIT_OF_WORK_KEY, False)
+
+
+def register_session(request: Request, db: Session | AsyncSession) -> None:
+    """
+    Enrol a request scoped session in the unit of work when it is enabled.
+
+    :param request: Current request.
+    :param db: SQLAlchemy sync or async database session opened for the request.
+    """
+    if not settings.DB_UNIT_OF_WORK:
+        return
+    db.info[UNIT_OF_WORK_KEY] = True
+    if not hasattr(request.state, "db_sessions"):
+        request.state.db_sessions = []
+    request.state.db_sessions.append(db)
+
+
+async def _finish(sessions: list[Session | AsyncSession], commit: bool) -> None:
+    for db in sessions:
+        if isinstance(db, AsyncSession):
+            await (db.commit() if commit else db.rollback())
+        else:
+            await run_in_threadpool(db.commit if commit else db.rollback)
+
+
+class UnitOfWorkRoute(APIRoute):
+    """
+    Route committing the request's sessions once the endpoint succeeded.
+
+    The commit happens before the response is returned to the server, so a
+    failing commit still turns into an error response. Any exception rolls the
+    sessions back.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def unit_of_work_handler(request: Request) -> Response:
+            try:
+                response = await handler(request)
+            except Exception:
+                await _finish(getattr(request.state, "db_sessions", []), commit=False)
+                raise
+            await _finish(getattr(request.state, "db_sessions", []), commit=True)
+            return response
+
+        return unit_of_work_handler
@@ -1,2 +1,6 @@
-from app.crud.user import user
-from app.crud.category import category
+from app.crud.user import user, async_user
+from app.crud.category import category, async_category
+from app.crud.exercise import exercise, async_exercise
+from app.crud.workout import workout_session, async_workout_session, async_set_entry
+from app.crud.training import async_weekly_rollup, async_weekly_exercise_rollup
+from app.crud.records import async_personal_record
@@ -0,0 +1,39 @@
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.cache import catalog_cache
+
+
+def _bump_catalog_version(session: Session) -> None:
+    catalog_cache.bump_version()
+
+
+def invalidate_on_commit(db: Session | AsyncSession) -> None:
+    """
+    Bump the catalog version once the session's transaction commits.
+
+    Bumping after the commit rather than on flush keeps other requests from
+    caching the old rows again under the new version.
+
+    :param db: SQLAlchemy sync or async database session writing to the catalog.
+    """
+    sync_session = db.sync_session if isinstance(db, AsyncSession) else db
+    if not event.contains(sync_session, "after_commit", _bump_catalog_version):
+        event.listen(sync_session, "after_commit", _bump_catalog_version)
+
+
+class CatalogCRUDMixin:
+    """Invalidate the catalog cache on every write of a sync catalog CRUD."""
+
+    def _save(self, db: Session, db_obj=None) -> None:
+        invalidate_on_commit(db)
+        super()._save(db, db_obj)
+
+
+class AsyncCatalogCRUDMixin:
+    """Invalidate the catalog cache on every write of an async catalog CRUD."""
+
+    async def _save(self, db: AsyncSession) -> None:
+        invalidate_on_commit(db)
+        await super()._save(db)
@@ -0,0 +1,203 @@
+import csv
+import io
+import time
+from itertools import islice
+from typing import Any, Iterable, Iterator, TextIO
+
+from pydantic import ValidationError
+from sqlalchemy import insert, select, text
+from sqlalchemy.orm import Session
+
+from app.core.crud_base import dialect_insert
+from app.core.export import ExportFormat
+from app.core.unit_of_work import is_unit_of_work
+from app.crud.catalog import invalidate_on_commit
+from app.models import Category, Exercise
+from app.schemas import ExerciseImport, ImportReport, ImportRowError
+
+
+IMPORT_CHUNK_SIZE = 10_000
+MAX_REPORTED_ERRORS = 100
+
+_STAGING_TABLE = "exercise_import"
+
+
+def read_rows(stream: TextIO, import_format: ExportFormat) -> Iterator[tuple[int, Any]]:
+    """
+    Read the rows of a catalog file without loading it whole.
+
+    :param stream: Text stream of the file, opened with ``newline=""`` for CSV.
+    :param import_format: CSV with a ``name,description,category`` header or NDJSON.
+    :return: Iterator of line numbers and raw rows (dictionaries or JSON strings).
+    """
+    if import_format is ExportFormat.CSV:
+        reader = csv.DictReader(stream)
+        for row in reader:
+            yield reader.line_num, row
+        return
+    for line_number, line in enumerate(stream, start=1):
+        if line.strip():
+            yield line_number, line
+
+
+class CatalogImporter:
+    """
+    Import exercises and their categories in a single transaction.
+
+    Categories are resolved by name and created in bulk. On Postgres exercises
+    are copied into a temporary staging table with ``COPY`` and merged into the
+    exercise table with one ``INSERT ... ON CONFLICT``; other databases fall
+    back to an executemany upsert per chunk. Exercises are matched by name.
+
+    :param db: SQLAlchemy database session.
+    :param chunk_size: Number of rows validated and loaded at once.
+    """
+
+    def __init__(self, db: Session, chunk_size: int = IMPORT_CHUNK_SIZE):
+        self.db = db
+        self.chunk_size = chunk_size
+        self.dialect_name = db.get_bind().dialect.name
+        self.use_copy = self.dialect_name == "postgresql"
+        self.report = ImportReport()
+        self._categories: dict[str, int] = {}
+        self._names: set[str] = set()
+
+    def _error(self, line: int, error: str) -> None:
+        self.report.failed += 1
+        if len(self.report.errors) < MAX_REPORTED_ERRORS:
+            self.report.errors.append(ImportRowError(line=line, error=error))
+
+    def _validate(
+        self, chunk: list[tuple[int, Any]]
+    ) -> list[tuple[int, ExerciseImport]]:
+        valid = []
+        for line, raw in chunk:
+            try:
+                if isinstance(raw, str):
+                    row = ExerciseImport.model_validate_json(raw)
+                else:
+                    row = ExerciseImport.model_validate(raw)
+            except ValidationError as exc:
+                self._error(line, "; ".join(error["msg"] for error in exc.errors()))
+                continue
+            if row.name in self._names:
+                self._error(line, f"Duplicate exercise name {row.name!r}")
+                continue
+            self._names.add(row.name)
+            valid.append((line, row))
+        return valid
+
+    def _resolve_categories(self, names: set[str]) -> None:
+        missing = names - self._categories.keys()
+        if not missing:
+            return
+        existing = self.db.execute(
+            select(Category.name, Category.id).where(Category.name.in_(missing))
+        ).all()
+        self._categories.update(existing)
+        missing -= {name for name, _ in existing}
+        if missing:
+            created = self.db.execute(
+                insert(Category).returning(Category.name, Category.id),
+                [{"name": name} for name in sorted(missing)],
+            ).all()
+            self._categories.update(created)
+
+    def _copy(self, rows: list[dict[str, Any]]) -> None:
+        buffer = io.StringIO()
+        # COPY reads unquoted empty fields as NULL, empty descriptions must be quoted
+        writer = csv.writer(buffer, quoting=csv.QUOTE_ALL)
+        writer.writerows(
+            (row["name"], row["description"], row["category_id"]) for row in rows
+        )
+        buffer.seek(0)
+        cursor = self.db.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {_STAGING_TABLE} (name, description, category_id) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer,
+            )
+        finally:
+            cursor.close()
+
+    def _upsert(self, rows: list[dict[str, Any]]) -> None:
+        statement = dialect_insert(Exercise, self.dialect_name)
+        statement = statement.on_conflict_do_update(
+            index_elements=[Exercise.name],
+            set_={
+                "description": statement.excluded["description"],
+                "category_id": statement.excluded["category_id"],
+            },
+        )
+        self.db.execute(statement, rows)
+        self.report.imported += len(rows)
+
+    def _merge(self) -> None:
+        result = self.db.execute(
+            text(
+                f"INSERT INTO exercise (name, description, category_id) "
+                f"SELECT name, description, category_id FROM {_STAGING_TABLE} "
+                "ON CONFLICT (name) DO UPDATE SET description = excluded.description, "
+                "category_id = excluded.category_id"
+            )
+        )
+        self.report.imported = result.rowcount
+        self.db.execute(text(f"DROP TABLE {_STAGING_TABLE}"))
+
+    def run(self, rows: Iterable[tuple[int, Any]]) -> ImportReport:
+        """
+        Import the rows, invalid rows are reported and skipped.
+
+        :param rows: Line numbers and raw rows, e.g. from :func:`read_rows`.
+        :return: Import report with row counts, errors and throughput.
+        """
+        started = time.perf_counter()
+        if self.use_copy:
+            self.db.execute(
+                text(
+                    f"CREATE TEMP TABLE {_STAGING_TABLE} (name varchar NOT NULL, "
+                    "description varchar NOT NULL, category_id integer NOT NULL)"
+                )
+            )
+        rows = iter(rows)
+        while chunk := list(islice(rows, self.chunk_size)):
+            self.report.rows += len(chunk)
+            valid = self._validate(chunk)
+            self._resolve_categories({row.category for _, row in valid})
+            values = [
+                {
+                    "name": row.name,
+                    "description": row.description,
+                    "category_id": self._categories[row.category],
+                }
+                for _, row in valid
+            ]
+            if values:
+                (self._copy if self.use_copy else self._upsert)(values)
+        if self.use_copy:
+            self._merge()
+
+        invalidate_on_commit(self.db)
+        if is_unit_of_work(self.db):
+            self.db.flush()
+        else:
+            self.db.commit()
+        self.report.seconds = time.perf_counter() - started
+        if self.report.seconds > 0:
+            self.report.rows_per_second = self.report.rows / self.report.seconds
+        return self.report
+
+
+def import_catalog(
+    db: Session, stream: TextIO, import_format: ExportFormat
+) -> ImportReport:
+    """
+    Import a catalog file.
+
+    :param db: SQLAlchemy database session.
+    :param stream: Text stream of the file, opened with ``newline=""`` for CSV.
+    :param import_format: Format of the file.
+    :return: Import report.
+    """
+    return CatalogImporter(db).run(read_rows(stream, import_format))
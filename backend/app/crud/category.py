@@ -1,10 +1,23 @@
-from app.core.crud_base import CRUDBase
+from sqlalchemy.orm import selectinload
+
+from app.core.crud_base import AsyncCRUDBase, CRUDBase
+from app.crud.catalog import AsyncCatalogCRUDMixin, CatalogCRUDMixin
 from app.models import Category
 from app.schemas import CategoryCreate, CategoryUpdate
 
 
-class CRUDCategory(CRUDBase[Category, CategoryCreate, CategoryUpdate]):
+class CRUDCategory(
+    CatalogCRUDMixin, CRUDBase[Category, CategoryCreate, CategoryUpdate]
+):
     pass
 
 
+class AsyncCRUDCategory(
+    AsyncCatalogCRUDMixin, AsyncCRUDBase[Category, CategoryCreate, CategoryUpdate]
+):
+    # one-to-many: a second `SELECT ... WHERE category_id IN (...)` keeps LIMIT on categories
+    with_exercises = (selectinload(Category.exercises),)
+
+
 category = CRUDCategory(Category)
+async_category = AsyncCRUDCategory(Category)
@@ -0,0 +1,145 @@
+import re
+from typing import Sequence
+
+from sqlalchemy import (
+    Select,
+    and_,
+    case,
+    column,
+    func,
+    literal_column,
+    or_,
+    select,
+    table,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.sql.base import ExecutableOption
+
+from app.core.crud_base import AsyncCRUDBase, CRUDBase
+from app.crud.catalog import AsyncCatalogCRUDMixin, CatalogCRUDMixin
+from app.models import Exercise
+from app.models.exercise import EXERCISE_FTS_TABLE, EXERCISE_SEARCH_VECTOR
+from app.schemas import ExerciseCreate, ExerciseUpdate
+
+
+_fts = table(
+    EXERCISE_FTS_TABLE, column("rowid"), column("rank"), column(EXERCISE_FTS_TABLE)
+)
+
+
+def _search_statement(dialect_name: str, query: str, limit: int) -> Select | None:
+    """
+    Build the ranked search statement of the given dialect.
+
+    Postgres matches the weighted ``tsvector`` of name and description or a name
+    similar enough (``pg_trgm``) to tolerate typos. SQLite matches prefixes of the
+    query terms in the FTS5 index. Other dialects scan the names and descriptions
+    for every term, names matching first.
+
+    :return: Search statement or None if the query has no searchable term.
+    """
+    if dialect_name == "postgresql":
+        ts_query = func.websearch_to_tsquery(literal_column("'english'"), query)
+        rank = func.ts_rank_cd(EXERCISE_SEARCH_VECTOR, ts_query) + func.similarity(
+            Exercise.name, query
+        )
+        return (
+            select(Exercise)
+            .where(
+                or_(
+                    EXERCISE_SEARCH_VECTOR.op("@@")(ts_query),
+                    Exercise.name.op("%")(query),
+                )
+            )
+            .order_by(rank.desc(), Exercise.id)
+            .limit(limit)
+        )
+    terms = re.findall(r"\w+", query.lower())
+    if not terms:
+        return None
+    if dialect_name == "sqlite":
+        match = " ".join(f'"{term}"*' for term in terms)
+        return (
+            select(Exercise)
+            .join(_fts, _fts.c.rowid == Exercise.id)
+            .where(_fts.c[EXERCISE_FTS_TABLE].op("MATCH")(match))
+            .order_by(_fts.c.rank, Exercise.id)
+            .limit(limit)
+        )
+    name, description = func.lower(Exercise.name), func.lower(Exercise.description)
+    in_name = and_(*(name.contains(term, autoescape=True) for term in terms))
+    return (
+        select(Exercise)
+        .where(
+            *(
+                or_(
+                    name.contains(term, autoescape=True),
+                    description.contains(term, autoescape=True),
+                )
+                for term in terms
+            )
+        )
+        .order_by(case((in_name, 0), else_=1), Exercise.id)
+        .limit(limit)
+    )
+
+
+class CRUDExercise(
+    CatalogCRUDMixin, CRUDBase[Exercise, ExerciseCreate, ExerciseUpdate]
+):
+    def search(
+        self,
+        db: Session,
+        *,
+        query: str,
+        limit: int = 20,
+        options: Sequence[ExecutableOption] = (),
+    ) -> list[Exercise]:
+        """
+        Search exercises by name and description, best matches first.
+
+        :param db: SQLAlchemy database session.
+        :param query: Search text.
+        :param limit: Maximum number of exercises to retrieve.
+        :param options: Loader options, e.g. the eager loading of relationships.
+        :return: Matching exercises.
+        """
+        statement = _search_statement(db.get_bind().dialect.name, query, limit)
+        if statement is None:
+            return []
+        return db.execute(statement.options(*options)).scalars().all()
+
+
+class AsyncCRUDExercise(
+    AsyncCatalogCRUDMixin, AsyncCRUDBase[Exercise, ExerciseCreate, ExerciseUpdate]
+):
+    # many-to-one: joining adds a single row per exercise, no extra round trip
+    with_category = (joinedload(Exercise.category, innerjoin=True),)
+
+    async def search(
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        limit: int = 20,
+        options: Sequence[ExecutableOption] = (),
+    ) -> list[Exercise]:
+        """
+        Search exercises by name and description, best matches first.
+
+        :param db: SQLAlchemy async database session.
+        :param query: Search text.
+        :param limit: Maximum number of exercises to retrieve.
+        :param options: Loader options, e.g. the eager loading of relationships.
+        :return: Matching exercises.
+        """
+        statement = _search_statement(db.get_bind().dialect.name, query, limit)
+        if statement is None:
+            return []
+        result = await db.execute(statement.options(*options))
+        return result.scalars().all()
+
+
+exercise = CRUDExercise(Exercise)
+async_exercise = AsyncCRUDExercise(Exercise)
@@ -0,0 +1,330 @@
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Iterable, Sequence
+
+from sqlalchemy import (
+    ColumnElement,
+    Insert,
+    Select,
+    event,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core import settings
+from app.core.crud_base import dialect_insert
+from app.core.leaderboard import (
+    BoardScore,
+    Leaderboards,
+    Standing,
+    leaderboards,
+    lift_board,
+    volume_board,
+)
+from app.crud.training import user_batches, week_start
+from app.models import (
+    Exercise,
+    LeaderboardEntry,
+    PersonalRecord,
+    User,
+    WeeklyExerciseRollup,
+)
+
+
+LEADERBOARD_BATCH_SIZE = 1000
+
+_PENDING_KEY = "leaderboard_scores"
+
+
+def retained_since() -> date:
+    """
+    First week whose boards are kept in memory.
+
+    :return: Monday of the oldest retained week.
+    """
+    return week_start(date.today()) - timedelta(weeks=settings.LEADERBOARD_WEEKS - 1)
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def _lift_rows(condition: ColumnElement[bool]) -> Select:
+    return select(
+        PersonalRecord.user_id, PersonalRecord.exercise_id, PersonalRecord.best_weight
+    ).where(condition)
+
+
+def _week_rows(condition: ColumnElement[bool]) -> Select:
+    return (
+        select(
+            WeeklyExerciseRollup.user_id,
+            WeeklyExerciseRollup.week,
+            WeeklyExerciseRollup.exercise_id,
+            Exercise.category_id,
+            WeeklyExerciseRollup.volume,
+        )
+        .join(Exercise, Exercise.id == WeeklyExerciseRollup.exercise_id)
+        .where(condition)
+    )
+
+
+def _scores(
+    lift_rows: Iterable[Any], week_rows: Iterable[Any]
+) -> dict[tuple[str, int], BoardScore]:
+    # best weight per exercise, weekly volume per exercise and summed per category
+    scores = {}
+    for user_id, exercise_id, best_weight in lift_rows:
+        board = lift_board(exercise_id)
+        scores[board, user_id] = BoardScore(board, user_id, best_weight, None)
+    for user_id, week, exercise_id, category_id, volume in week_rows:
+        board = volume_board("exercise", exercise_id, week)
+        scores[board, user_id] = BoardScore(board, user_id, volume, week)
+        board = volume_board("category", category_id, week)
+        previous = scores.get((board, user_id))
+        total = volume + (previous.score if previous else 0)
+        scores[board, user_id] = BoardScore(board, user_id, total, week)
+    return scores
+
+
+def _touched_boards(
+    sets: Iterable[Any], categories: dict[int, int]
+) -> dict[tuple[str, int], BoardScore]:
+    # every board of the written sets starts at 0, so that emptied boards are reset
+    touched = {}
+    for item in sets:
+        week = week_start(item.performed_at)
+        boards = [(lift_board(item.exercise_id), None)]
+        boards.append((volume_board("exercise", item.exercise_id, week), week))
+        if item.exercise_id in categories:
+            category_id = categories[item.exercise_id]
+            boards.append((volume_board("category", category_id, week), week))
+        for board, board_week in boards:
+            touched[board, item.user_id] = BoardScore(
+                board, item.user_id, 0.0, board_week
+            )
+    return touched
+
+
+def _score_queries(sets: Sequence[Any]) -> tuple[Select, Select, Select]:
+    exercise_ids = sorted({item.exercise_id for item in sets})
+    lift_keys = sorted({(item.user_id, item.exercise_id) for item in sets})
+    week_keys = sorted({(item.user_id, week_start(item.performed_at)) for item in sets})
+    return (
+        select(Exercise.id, Exercise.category_id).where(Exercise.id.in_(exercise_ids)),
+        _lift_rows(
+            tuple_(PersonalRecord.user_id, PersonalRecord.exercise_id).in_(lift_keys)
+        ),
+        _week_rows(
+            tuple_(WeeklyExerciseRollup.user_id, WeeklyExerciseRollup.week).in_(
+                week_keys
+            )
+        ),
+    )
+
+
+def _entries(
+    sets: Sequence[Any], categories: Iterable[Any], *rows: Iterable[Any]
+) -> list[BoardScore]:
+    scores = _scores(*rows)
+    touched = _touched_boards(sets, dict(categories))
+    # sorted by key so that concurrent writers lock the rows in the same order
+    return [scores.get(key, zero) for key, zero in sorted(touched.items())]
+
+
+def _checkpoint(dialect_name: str) -> Insert:
+    statement = dialect_insert(LeaderboardEntry, dialect_name)
+    return statement.on_conflict_do_update(
+        index_elements=["board", "user_id"],
+        set_={
+            "score": statement.excluded.score,
+            "week": statement.excluded.week,
+            "updated_at": statement.excluded.updated_at,
+        },
+    )
+
+
+def _checkpoint_rows(entries: Iterable[BoardScore]) -> list[dict[str, Any]]:
+    now = _now()
+    return [{**entry._asdict(), "updated_at": now} for entry in entries]
+
+
+def _apply_pending(session: Session) -> None:
+    if pending := session.info.pop(_PENDING_KEY, None):
+        leaderboards.apply(pending, retained_since())
+
+
+def _drop_pending(session: Session, *args) -> None:
+    session.info.pop(_PENDING_KEY, None)
+
+
+def _apply_on_commit(db: Session | AsyncSession, entries: list[BoardScore]) -> None:
+    sync_session = db.sync_session if isinstance(db, AsyncSession) else db
+    sync_session.info.setdefault(_PENDING_KEY, []).extend(entries)
+    if not event.contains(sync_session, "after_commit", _apply_pending):
+        event.listen(sync_session, "after_commit", _apply_pending)
+        event.listen(sync_session, "after_soft_rollback", _drop_pending)
+
+
+def update_leaderboards(db: Session, *, sets: Sequence[Any]) -> None:
+    """
+    Checkpoint the scores of the boards touched by written sets.
+
+    Runs after the rollups and records were updated, the new scores are applied
+    to the ranked indexes of this process once the transaction commits.
+
+    :param db: SQLAlchemy database session.
+    :param sets: Inserted or removed sets with ``user_id``, ``exercise_id`` and ``performed_at``.
+    """
+    if not sets:
+        return
+    entries = _entries(
+        sets, *(db.execute(query).all() for query in _score_queries(sets))
+    )
+    db.execute(_checkpoint(db.get_bind().dialect.name), _checkpoint_rows(entries))
+    _apply_on_commit(db, entries)
+
+
+async def update_leaderboards_async(db: AsyncSession, *, sets: Sequence[Any]) -> None:
+    """
+    Checkpoint the scores of the boards touched by written sets.
+
+    Runs after the rollups and records were updated, the new scores are applied
+    to the ranked indexes of this process once the transaction commits.
+
+    :param db: SQLAlchemy async database session.
+    :param sets: Inserted or removed sets with ``user_id``, ``exercise_id`` and ``performed_at``.
+    """
+    if not sets:
+        return
+    rows = [(await db.execute(query)).all() for query in _score_queries(sets)]
+    entries = _entries(sets, *rows)
+    dialect_name = db.get_bind().dialect.name
+    await db.execute(_checkpoint(dialect_name), _checkpoint_rows(entries))
+    _apply_on_commit(db, entries)
+
+
+def _changed_entries(store: Leaderboards, since: date) -> Select:
+    statement = select(
+        LeaderboardEntry.board,
+        LeaderboardEntry.user_id,
+        LeaderboardEntry.score,
+        LeaderboardEntry.week,
+        LeaderboardEntry.updated_at,
+    ).where(or_(LeaderboardEntry.week.is_(None), LeaderboardEntry.week >= since))
+    if store.watermark is not None:
+        overlap = timedelta(seconds=settings.LEADERBOARD_SYNC_OVERLAP)
+        statement = statement.where(
+            LeaderboardEntry.updated_at > store.watermark - overlap
+        )
+    return statement
+
+
+def _load(store: Leaderboards, rows: Sequence[Any], since: date) -> None:
+    store.apply(rows, since)
+    store.mark_synced(max((row.updated_at for row in rows), default=None), since)
+
+
+def sync_leaderboards(
+    db: Session, *, store: Leaderboards = leaderboards, force: bool = False
+) -> None:
+    """
+    Read the scores checkpointed by any process since the last read.
+
+    The first read loads every retained board.
+
+    :param db: SQLAlchemy database session.
+    :param store: Ranked indexes to update.
+    :param force: Whether to read even if the sync interval has not elapsed.
+    """
+    if not (force or store.sync_due()):
+        return
+    since = retained_since()
+    _load(store, db.execute(_changed_entries(store, since)).all(), since)
+
+
+async def sync_leaderboards_async(
+    db: AsyncSession, *, store: Leaderboards = leaderboards, force: bool = False
+) -> None:
+    """
+    Read the scores checkpointed by any process since the last read.
+
+    The first read loads every retained board.
+
+    :param db: SQLAlchemy async database session.
+    :param store: Ranked indexes to update.
+    :param force: Whether to read even if the sync interval has not elapsed.
+    """
+    if not (force or store.sync_due()):
+        return
+    since = retained_since()
+    _load(store, (await db.execute(_changed_entries(store, since))).all(), since)
+
+
+async def get_standings(
+    db: AsyncSession, *, standings: list[Standing]
+) -> list[dict[str, Any]]:
+    """
+    Attach the names of the ranked users to a page of standings.
+
+    :param db: SQLAlchemy async database session.
+    :param standings: Page of a board.
+    :return: Standings with ``rank``, ``user_id``, names and ``score``.
+    """
+    if not standings:
+        return []
+    statement = select(User.id, User.first_name, User.last_name).where(
+        User.id.in_([standing.member for standing in standings])
+    )
+    names = {row.id: row for row in (await db.execute(statement)).all()}
+    return [
+        {
+            "rank": standing.rank,
+            "user_id": standing.member,
+            "first_name": names[standing.member].first_name,
+            "last_name": names[standing.member].last_name,
+            "score": standing.score,
+        }
+        for standing in standings
+        if standing.member in names
+    ]
+
+
+def rebuild_leaderboards(
+    db: Session,
+    *,
+    user_ids: Iterable[int] | None = None,
+    batch_size: int = LEADERBOARD_BATCH_SIZE,
+) -> int:
+    """
+    Recompute the checkpointed scores from the records and weekly rollups.
+
+    The previous scores of each batch of users are reset to 0 rather than deleted,
+    so that the running processes drop them on their next read.
+
+    :param db: SQLAlchemy database session.
+    :param user_ids: Users to rebuild, all users by default.
+    :param batch_size: Number of users per transaction.
+    :return: Number of checkpointed scores.
+    """
+    rebuilt = 0
+    dialect_name = db.get_bind().dialect.name
+    for batch in user_batches(db, user_ids, batch_size):
+        scores = _scores(
+            db.execute(_lift_rows(PersonalRecord.user_id.in_(batch))).all(),
+            db.execute(_week_rows(WeeklyExerciseRollup.user_id.in_(batch))).all(),
+        )
+        db.execute(
+            update(LeaderboardEntry)
+            .where(LeaderboardEntry.user_id.in_(batch))
+            .values(score=0, updated_at=_now())
+        )
+        if scores:
+            entries = [scores[key] for key in sorted(scores)]
+            db.execute(_checkpoint(dialect_name), _checkpoint_rows(entries))
+        db.commit()
+        rebuilt += len(scores)
+    return rebuilt
@@ -0,0 +1,139 @@
+from datetime import date
+from typing import Any, Callable, Iterable, Sequence
+
+import numpy as np
+from sqlalchemy import Insert, Row, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.crud_base import dialect_insert
+from app.core.series import daily, lttb
+from app.crud.records import epley_1rm
+from app.models import HistoryVersion, SetEntry
+from app.schemas import ProgressMetric
+
+type SetValues = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+# metric -> (value of a set from its weight and reps, reduction over a day)
+_METRICS: dict[ProgressMetric, tuple[SetValues, np.ufunc]] = {
+    ProgressMetric.WEIGHT: (lambda weight, reps: weight, np.maximum),
+    ProgressMetric.REPS: (lambda weight, reps: reps, np.maximum),
+    ProgressMetric.VOLUME: (lambda weight, reps: weight * reps, np.add),
+    ProgressMetric.E1RM: (epley_1rm, np.maximum),
+}
+
+
+def progress_series(
+    rows: Sequence[Sequence[Any]], metric: ProgressMetric, points: int
+) -> dict[str, Any]:
+    """
+    Compute the daily series of a metric over a history and downsample it.
+
+    Sets without reps are ignored. The series is reduced to one value per day
+    and then to at most ``points`` days with LTTB, so its size does not depend
+    on the length of the history.
+
+    :param rows: Sets as ``(performed_at, reps, weight)`` rows in time order.
+    :param metric: Metric to compute.
+    :param points: Maximum number of points of the series.
+    :return: Number of training days and the ``day``/``value`` points.
+    """
+    if not rows:
+        return {"days": 0, "points": []}
+    performed_at, reps, weights = zip(*rows)
+    # proleptic Gregorian day numbers, far cheaper than converting to datetime64
+    days = np.fromiter(
+        (moment.toordinal() for moment in performed_at), dtype=np.int64, count=len(rows)
+    )
+    reps = np.asarray(reps, dtype=np.int64)
+    weights = np.asarray(weights, dtype=np.float64)
+    valid = reps > 0
+    days, reps, weights = days[valid], reps[valid], weights[valid]
+
+    values, reduce = _METRICS[metric]
+    days, values = daily(days, values(weights, reps).astype(np.float64), reduce)
+    kept = lttb(days, values, points)
+    return {
+        "days": int(days.size),
+        "points": [
+            {"day": date.fromordinal(day), "value": value}
+            for day, value in zip(days[kept].tolist(), values[kept].tolist())
+        ],
+    }
+
+
+def _history(user_id: int, exercise_id: int) -> Select:
+    # served by the (user, exercise, performed_at) index
+    return (
+        select(SetEntry.performed_at, SetEntry.reps, SetEntry.weight)
+        .where(SetEntry.user_id == user_id, SetEntry.exercise_id == exercise_id)
+        .order_by(SetEntry.performed_at)
+    )
+
+
+async def get_history(
+    db: AsyncSession, *, user_id: int, exercise_id: int
+) -> Sequence[Row]:
+    """
+    Load the sets of a user on an exercise as columns, in time order.
+
+    :param db: SQLAlchemy async database session.
+    :param user_id: ID of the user.
+    :param exercise_id: ID of the exercise.
+    :return: ``(performed_at, reps, weight)`` rows.
+    """
+    return (await db.execute(_history(user_id, exercise_id))).all()
+
+
+async def get_version(db: AsyncSession, *, user_id: int, exercise_id: int) -> int:
+    """
+    Retrieve the version of the history of a user on an exercise.
+
+    :param db: SQLAlchemy async database session.
+    :param user_id: ID of the user.
+    :param exercise_id: ID of the exercise.
+    :return: Version, 0 if no set was ever written.
+    """
+    statement = select(HistoryVersion.version).where(
+        HistoryVersion.user_id == user_id, HistoryVersion.exercise_id == exercise_id
+    )
+    return (await db.scalar(statement)) or 0
+
+
+def _bump_versions(dialect_name: str) -> Insert:
+    statement = dialect_insert(HistoryVersion, dialect_name)
+    return statement.on_conflict_do_update(
+        index_elements=["user_id", "exercise_id"],
+        set_={"version": HistoryVersion.version + 1},
+    )
+
+
+def _versions_of(sets: Iterable[Any]) -> list[dict[str, int]]:
+    # sorted by key so that concurrent writers lock the rows in the same order
+    keys = sorted({(item.user_id, item.exercise_id) for item in sets})
+    return [
+        {"user_id": user_id, "exercise_id": exercise_id, "version": 1}
+        for user_id, exercise_id in keys
+    ]
+
+
+def bump_versions(db: Session, *, sets: Iterable[Any]) -> None:
+    """
+    Move the histories touched by written sets to a new version.
+
+    :param db: SQLAlchemy database session.
+    :param sets: Inserted or removed sets with ``user_id`` and ``exercise_id``.
+    """
+    if versions := _versions_of(sets):
+        db.execute(_bump_versions(db.get_bind().dialect.name), versions)
+
+
+async def bump_versions_async(db: AsyncSession, *, sets: Iterable[Any]) -> None:
+    """
+    Move the histories touched by written sets to a new version.
+
+    :param db: SQLAlchemy async database session.
+    :param sets: Inserted or removed sets with ``user_id`` and ``exercise_id``.
+    """
+    if versions := _versions_of(sets):
+        await db.execute(_bump_versions(db.get_bind().dialect.name), versions)
@@ -0,0 +1,250 @@
+import csv
+import io
+from collections import defaultdict
+from datetime import date, timedelta
+from typing import Any, Sequence
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, joinedload
+
+from app.core import settings
+from app.core.similarity import cooccurrence, top_k
+from app.crud.training import week_start
+from app.models import Exercise, ExerciseNeighbor, PersonalRecord, WeeklyExerciseRollup
+
+# similarity added to exercises of the same category
+CATEGORY_WEIGHT = 0.1
+# most trained recent exercises whose neighbors are recommended to a user
+RECOMMENDATION_SEEDS = 20
+
+_INSERT_BATCH_SIZE = 50_000
+
+_with_category = joinedload(Exercise.category, innerjoin=True)
+
+
+def _columns(rows: Sequence[Sequence[int]]) -> tuple[np.ndarray, np.ndarray]:
+    array = np.array(rows, dtype=np.int64).reshape(-1, 2)
+    return array[:, 0], array[:, 1]
+
+
+def exercise_neighbors(  # pylint: disable=too-many-arguments,too-many-locals
+    exercise_ids: np.ndarray,
+    category_ids: np.ndarray,
+    user_ids: np.ndarray,
+    trained_ids: np.ndarray,
+    k: int,
+    category_weight: float = CATEGORY_WEIGHT,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Compute the ``k`` most similar exercises of every exercise.
+
+    The similarity of two exercises is the cosine of their sparse user vectors,
+    i.e. the number of users who trained both over the geometric mean of their
+    user counts, plus ``category_weight`` within the same category. The most
+    popular exercises of its category complete the neighbors of an exercise with
+    too little history.
+
+    :param exercise_ids: Sorted IDs of the catalog.
+    :param category_ids: Category of every exercise.
+    :param user_ids: User of every trained exercise, sorted.
+    :param trained_ids: Exercises trained by the users, each once per user.
+    :param k: Number of neighbors per exercise.
+    :param category_weight: Similarity of exercises of the same category.
+    :return: Exercise IDs, 0-based ranks, neighbor IDs and scores in rank order.
+    """
+    size = exercise_ids.size
+    items = np.searchsorted(exercise_ids, trained_ids)
+    known = items < size
+    known[known] = exercise_ids[items[known]] == trained_ids[known]
+    user_ids, items = user_ids[known], items[known]
+    popularity = np.bincount(items, minlength=size)
+    _, category_index = np.unique(category_ids, return_inverse=True)
+
+    # the best pairs of every block of co-occurrences, so that only k rows per
+    # exercise are kept at once
+    blocks = [(np.empty(0, dtype=np.int64),) * 2 + (np.empty(0),)]
+    for left, right, together in cooccurrence(user_ids, items, size):
+        score = together / np.sqrt(popularity[left] * popularity[right])
+        score += category_weight * (category_index[left] == category_index[right])
+        source, _, target, score = top_k(left, right, score, k, tie_breaker=popularity)
+        blocks.append((source, target, score))
+
+    # the k + 1 most popular exercises of every category, so that k remain without
+    # the exercise itself
+    order = np.lexsort((np.arange(size), -popularity, category_index))
+    ordered_categories = category_index[order]
+    position = np.arange(size) - np.searchsorted(ordered_categories, ordered_categories)
+    popular = position <= k
+    table = np.full((category_index.max(initial=-1) + 1, k + 1), -1, dtype=np.int64)
+    table[ordered_categories[popular], position[popular]] = order[popular]
+    candidates = table[category_index].ravel()
+    sources = np.repeat(np.arange(size), k + 1)
+    valid = (candidates >= 0) & (candidates != sources)
+    blocks.append(
+        (sources[valid], candidates[valid], np.full(int(valid.sum()), category_weight))
+    )
+
+    source, rank, target, score = top_k(
+        *(np.concatenate(column) for column in zip(*blocks)),
+        k,
+        tie_breaker=popularity,
+    )
+    return exercise_ids[source], rank, exercise_ids[target], score
+
+
+def _copy(db: Session, rows: Sequence[tuple]) -> None:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    buffer.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {ExerciseNeighbor.__tablename__} "
+            "(exercise_id, rank, neighbor_id, score) FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def _insert(db: Session, rows: Sequence[tuple]) -> None:
+    keys = ("exercise_id", "rank", "neighbor_id", "score")
+    db.execute(insert(ExerciseNeighbor), [dict(zip(keys, row)) for row in rows])
+
+
+def build_recommendations(
+    db: Session, *, neighbors: int = settings.RECOMMENDATION_NEIGHBORS
+) -> int:
+    """
+    Replace the neighbors of every exercise, in a single transaction.
+
+    Readers keep seeing the previous neighbors until the commit. Postgres receives
+    the rows with ``COPY``.
+
+    :param db: SQLAlchemy database session.
+    :param neighbors: Number of neighbors per exercise.
+    :return: Number of stored neighbors.
+    """
+    exercise_ids, category_ids = _columns(
+        db.execute(
+            select(Exercise.id, Exercise.category_id).order_by(Exercise.id)
+        ).all()
+    )
+    user_ids, trained_ids = _columns(
+        db.execute(
+            select(PersonalRecord.user_id, PersonalRecord.exercise_id).order_by(
+                PersonalRecord.user_id
+            )
+        ).all()
+    )
+    columns = exercise_neighbors(
+        exercise_ids, category_ids, user_ids, trained_ids, neighbors
+    )
+    rows = list(zip(*(column.tolist() for column in columns)))
+
+    store = _copy if db.get_bind().dialect.name == "postgresql" else _insert
+    db.execute(delete(ExerciseNeighbor))
+    for start in range(0, len(rows), _INSERT_BATCH_SIZE):
+        store(db, rows[start : start + _INSERT_BATCH_SIZE])
+    db.commit()
+    return len(rows)
+
+
+def _recommendation(exercise: Exercise, score: float) -> dict[str, Any]:
+    return {
+        "id": exercise.id,
+        "name": exercise.name,
+        "description": exercise.description,
+        "category_id": exercise.category_id,
+        "category": exercise.category,
+        "score": score,
+    }
+
+
+async def get_similar(
+    db: AsyncSession, *, exercise_id: int, limit: int
+) -> list[dict[str, Any]]:
+    """
+    Retrieve the precomputed most similar exercises of an exercise.
+
+    :param db: SQLAlchemy async database session.
+    :param exercise_id: ID of the exercise.
+    :param limit: Maximum number of exercises.
+    :return: Exercises with their category and similarity score, most similar first.
+    """
+    statement = (
+        select(Exercise, ExerciseNeighbor.score)
+        .join(ExerciseNeighbor, ExerciseNeighbor.neighbor_id == Exercise.id)
+        .where(ExerciseNeighbor.exercise_id == exercise_id)
+        .order_by(ExerciseNeighbor.rank)
+        .limit(limit)
+        .options(_with_category)
+    )
+    rows = (await db.execute(statement)).all()
+    return [_recommendation(exercise, score) for exercise, score in rows]
+
+
+async def get_recommendations(
+    db: AsyncSession, *, user_id: int, limit: int
+) -> list[dict[str, Any]]:
+    """
+    Recommend exercises similar to the ones a user trained recently.
+
+    The neighbors of the most trained exercises of the last weeks are scored by
+    their similarity weighted with the share of sets of the exercise they are a
+    neighbor of. Every exercise the user ever trained is left out.
+
+    :param db: SQLAlchemy async database session.
+    :param user_id: ID of the user.
+    :param limit: Maximum number of exercises.
+    :return: Exercises with their category and score, best first.
+    """
+    since = week_start(date.today()) - timedelta(
+        weeks=settings.RECOMMENDATION_HISTORY_WEEKS - 1
+    )
+    sets = func.sum(WeeklyExerciseRollup.sets)
+    statement = (
+        select(WeeklyExerciseRollup.exercise_id, sets)
+        .where(
+            WeeklyExerciseRollup.user_id == user_id, WeeklyExerciseRollup.week >= since
+        )
+        .group_by(WeeklyExerciseRollup.exercise_id)
+        .order_by(sets.desc(), WeeklyExerciseRollup.exercise_id)
+        .limit(RECOMMENDATION_SEEDS)
+    )
+    seeds = dict((await db.execute(statement)).all())
+    if not seeds:
+        return []
+    total = sum(seeds.values())
+    # a personal record is kept for every exercise with logged sets
+    statement = select(PersonalRecord.exercise_id).where(
+        PersonalRecord.user_id == user_id
+    )
+    trained = set((await db.scalars(statement)).all()) | seeds.keys()
+
+    statement = select(
+        ExerciseNeighbor.exercise_id,
+        ExerciseNeighbor.neighbor_id,
+        ExerciseNeighbor.score,
+    ).where(ExerciseNeighbor.exercise_id.in_(seeds))
+    scores: dict[int, float] = defaultdict(float)
+    for exercise_id, neighbor_id, score in (await db.execute(statement)).all():
+        if neighbor_id not in trained:
+            scores[neighbor_id] += score * seeds[exercise_id] / total
+    best = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:limit]
+    if not best:
+        return []
+
+    statement = (
+        select(Exercise)
+        .where(Exercise.id.in_([exercise_id for exercise_id, _ in best]))
+        .options(_with_category)
+    )
+    exercises = {item.id: item for item in (await db.scalars(statement)).all()}
+    return [
+        _recommendation(exercises[exercise_id], score)
+        for exercise_id, score in best
+        if exercise_id in exercises
+    ]
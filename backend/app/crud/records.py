@@ -0,0 +1,258 @@
+from itertools import islice
+from typing import Any, Iterable, Sequence
+
+import numpy as np
+from sqlalchemy import (
+    ColumnElement,
+    Delete,
+    Insert,
+    Select,
+    case,
+    delete,
+    func,
+    insert,
+    select,
+    tuple_,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.crud_base import AsyncCRUDBase, dialect_insert
+from app.models import PersonalRecord, SetEntry, User
+from app.schemas import PersonalRecord as PersonalRecordSchema
+
+
+RECORDS_BATCH_SIZE = 100
+
+# Brzycki's formula diverges at 37 reps
+_BRZYCKI_MAX_REPS = 36
+
+_SET_COLUMNS = (SetEntry.user_id, SetEntry.exercise_id, SetEntry.reps, SetEntry.weight)
+
+
+def epley_1rm(weight: np.ndarray, reps: np.ndarray) -> np.ndarray:
+    """
+    Estimate one-rep maxima with Epley's formula ``w * (1 + r / 30)``.
+
+    :param weight: Lifted weights.
+    :param reps: Repetitions, a single rep is its own maximum.
+    :return: Estimates, 0 for sets without reps.
+    """
+    estimate = np.where(reps == 1, weight, weight * (1 + reps / 30))
+    return np.where(reps > 0, estimate, 0.0)
+
+
+def brzycki_1rm(weight: np.ndarray, reps: np.ndarray) -> np.ndarray:
+    """
+    Estimate one-rep maxima with Brzycki's formula ``w * 36 / (37 - r)``.
+
+    :param weight: Lifted weights.
+    :param reps: Repetitions.
+    :return: Estimates, 0 for sets without reps or with too many reps for the formula.
+    """
+    valid = (reps > 0) & (reps <= _BRZYCKI_MAX_REPS)
+    return np.where(valid, weight * 36 / np.where(valid, 37 - reps, 1), 0.0)
+
+
+def personal_records(rows: Sequence[Sequence[Any]]) -> list[dict[str, Any]]:
+    """
+    Compute the records of each user and exercise from sets, in vectorized passes.
+
+    The sets are sorted by user, exercise, weight and reps, so the last set of
+    each group holds the best weight with its most reps and the other records
+    are maxima reduced over the groups.
+
+    :param rows: Sets as ``(user_id, exercise_id, reps, weight)`` rows.
+    :return: Record rows, one per user and exercise with at least one rep.
+    """
+    if not rows:
+        return []
+    user_ids, exercise_ids, reps, weights = (
+        np.asarray(column) for column in zip(*rows)
+    )
+    reps, weights = reps.astype(np.int64), weights.astype(np.float64)
+    valid = reps > 0
+    if not valid.all():
+        user_ids, exercise_ids = user_ids[valid], exercise_ids[valid]
+        reps, weights = reps[valid], weights[valid]
+    if reps.size == 0:
+        return []
+
+    order = np.lexsort((reps, weights, exercise_ids, user_ids))
+    user_ids, exercise_ids = user_ids[order], exercise_ids[order]
+    reps, weights = reps[order], weights[order]
+    new_group = np.empty(len(reps), dtype=bool)
+    new_group[0] = True
+    new_group[1:] = (user_ids[1:] != user_ids[:-1]) | (
+        exercise_ids[1:] != exercise_ids[:-1]
+    )
+    starts = np.flatnonzero(new_group)
+    lasts = np.append(starts[1:], len(reps)) - 1
+
+    records = zip(
+        user_ids[starts].tolist(),
+        exercise_ids[starts].tolist(),
+        weights[lasts].tolist(),
+        reps[lasts].tolist(),
+        np.maximum.reduceat(reps, starts).tolist(),
+        np.maximum.reduceat(epley_1rm(weights, reps), starts).tolist(),
+        np.maximum.reduceat(brzycki_1rm(weights, reps), starts).tolist(),
+    )
+    keys = (
+        "user_id",
+        "exercise_id",
+        "best_weight",
+        "best_weight_reps",
+        "best_reps",
+        "epley_1rm",
+        "brzycki_1rm",
+    )
+    return [dict(zip(keys, record)) for record in records]
+
+
+def _greatest(dialect_name: str, *values: ColumnElement) -> ColumnElement:
+    # SQLite's scalar `max()` with several arguments is Postgres' `greatest()`
+    if dialect_name == "postgresql":
+        return func.greatest(*values)
+    return func.max(*values)
+
+
+def _raise_records(dialect_name: str) -> Insert:
+    statement = dialect_insert(PersonalRecord, dialect_name)
+    new, old = statement.excluded, PersonalRecord
+    return statement.on_conflict_do_update(
+        index_elements=["user_id", "exercise_id"],
+        set_={
+            # evaluated against the current row, before any column is updated
+            "best_weight_reps": case(
+                (new.best_weight > old.best_weight, new.best_weight_reps),
+                (
+                    new.best_weight == old.best_weight,
+                    _greatest(dialect_name, old.best_weight_reps, new.best_weight_reps),
+                ),
+                else_=old.best_weight_reps,
+            ),
+            **{
+                column: _greatest(dialect_name, getattr(old, column), new[column])
+                for column in ("best_weight", "best_reps", "epley_1rm", "brzycki_1rm")
+            },
+        },
+    )
+
+
+def _records_of(sets: Iterable[Any]) -> list[dict[str, Any]]:
+    rows = [(item.user_id, item.exercise_id, item.reps, item.weight) for item in sets]
+    # sorted by key so that concurrent writers lock the rows in the same order
+    return sorted(
+        personal_records(rows), key=lambda row: (row["user_id"], row["exercise_id"])
+    )
+
+
+def update_records(db: Session, *, sets: Iterable[Any]) -> None:
+    """
+    Raise the records with newly logged sets in the current transaction.
+
+    :param db: SQLAlchemy database session.
+    :param sets: Sets with ``user_id``, ``exercise_id``, ``reps`` and ``weight``.
+    """
+    if records := _records_of(sets):
+        db.execute(_raise_records(db.get_bind().dialect.name), records)
+
+
+async def update_records_async(db: AsyncSession, *, sets: Iterable[Any]) -> None:
+    """
+    Raise the records with newly logged sets in the current transaction.
+
+    :param db: SQLAlchemy async database session.
+    :param sets: Sets with ``user_id``, ``exercise_id``, ``reps`` and ``weight``.
+    """
+    if records := _records_of(sets):
+        await db.execute(_raise_records(db.get_bind().dialect.name), records)
+
+
+def _history_of(keys: list[tuple[int, int]]) -> Select:
+    return select(*_SET_COLUMNS).where(
+        tuple_(SetEntry.user_id, SetEntry.exercise_id).in_(keys)
+    )
+
+
+def _delete_records(keys: list[tuple[int, int]]) -> Delete:
+    return delete(PersonalRecord).where(
+        tuple_(PersonalRecord.user_id, PersonalRecord.exercise_id).in_(keys)
+    )
+
+
+def _keys_of(sets: Iterable[Any]) -> list[tuple[int, int]]:
+    return sorted({(item.user_id, item.exercise_id) for item in sets})
+
+
+def refresh_records(db: Session, *, sets: Iterable[Any]) -> None:
+    """
+    Recompute the records touched by removed sets from the remaining history.
+
+    :param db: SQLAlchemy database session.
+    :param sets: Removed sets with ``user_id`` and ``exercise_id``.
+    """
+    if not (keys := _keys_of(sets)):
+        return
+    records = personal_records(db.execute(_history_of(keys)).all())
+    db.execute(_delete_records(keys))
+    if records:
+        db.execute(insert(PersonalRecord), records)
+
+
+async def refresh_records_async(db: AsyncSession, *, sets: Iterable[Any]) -> None:
+    """
+    Recompute the records touched by removed sets from the remaining history.
+
+    :param db: SQLAlchemy async database session.
+    :param sets: Removed sets with ``user_id`` and ``exercise_id``.
+    """
+    if not (keys := _keys_of(sets)):
+        return
+    records = personal_records((await db.execute(_history_of(keys))).all())
+    await db.execute(_delete_records(keys))
+    if records:
+        await db.execute(insert(PersonalRecord), records)
+
+
+def rebuild_records(
+    db: Session,
+    *,
+    user_ids: Iterable[int] | None = None,
+    batch_size: int = RECORDS_BATCH_SIZE,
+) -> int:
+    """
+    Recompute the records from the logged history, one transaction per batch of users.
+
+    The sets of a batch are loaded as columns and reduced with NumPy in one pass.
+
+    :param db: SQLAlchemy database session.
+    :param user_ids: Users to rebuild, all users by default.
+    :param batch_size: Number of users per transaction, bounds the memory use.
+    :return: Number of rebuilt records.
+    """
+    if user_ids is None:
+        user_ids = db.scalars(select(User.id).order_by(User.id)).all()
+    ids = iter(list(user_ids))
+    rebuilt = 0
+    while batch := list(islice(ids, batch_size)):
+        statement = select(*_SET_COLUMNS).where(SetEntry.user_id.in_(batch))
+        records = personal_records(db.execute(statement).all())
+        db.execute(delete(PersonalRecord).where(PersonalRecord.user_id.in_(batch)))
+        if records:
+            db.execute(insert(PersonalRecord), records)
+        db.commit()
+        rebuilt += len(records)
+    return rebuilt
+
+
+class AsyncCRUDPersonalRecord(
+    AsyncCRUDBase[PersonalRecord, PersonalRecordSchema, PersonalRecordSchema]
+):
+    pass
+
+
+async_personal_record = AsyncCRUDPersonalRecord(
+    PersonalRecord, cursor_columns=(PersonalRecord.user_id, PersonalRecord.exercise_id)
+)
@@ -0,0 +1,444 @@
+import math
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from itertools import islice
+from typing import Any, Iterable, NamedTuple
+
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Executable,
+    Insert,
+    Row,
+    Select,
+    cast,
+    delete,
+    func,
+    insert,
+    literal_column,
+    select,
+    type_coerce,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.crud_base import AsyncCRUDBase, dialect_insert
+from app.models import (
+    Exercise,
+    SetEntry,
+    User,
+    WeeklyExerciseRollup,
+    WeeklyRollup,
+    WorkoutSession,
+)
+from app.schemas import CategoryWeeklyTraining, WeeklyTraining
+
+
+ROLLUP_BATCH_SIZE = 1000
+
+_TOTALS = ("sets", "reps", "volume")
+
+
+class RollupMismatch(NamedTuple):
+    table: str
+    key: tuple
+    expected: tuple | None
+    actual: tuple | None
+
+
+def week_start(value: date | datetime) -> date:
+    """
+    First day (Monday) of the week of a date or time.
+
+    :param value: Date or naive UTC time.
+    :return: Monday of its week.
+    """
+    if isinstance(value, datetime):
+        value = value.date()
+    return value - timedelta(days=value.weekday())
+
+
+def week_of(dialect_name: str, column: ColumnElement) -> ColumnElement[date]:
+    """
+    SQL counterpart of :func:`week_start`.
+
+    Arguments are inlined so that the expression can be both selected and grouped by.
+
+    :param dialect_name: Name of the database dialect.
+    :param column: Timestamp column.
+    :return: Expression of the Monday of the week.
+    """
+    if dialect_name == "postgresql":
+        return cast(func.date_trunc(literal_column("'week'"), column), Date)
+    # the next Sunday (or the day itself) and back to its Monday
+    return type_coerce(
+        func.date(column, literal_column("'weekday 0'"), literal_column("'-6 days'")),
+        Date,
+    )
+
+
+def _increment(model: Any, dialect_name: str, key_columns: list[str]) -> Insert:
+    statement = dialect_insert(model, dialect_name)
+    columns = [
+        column.key
+        for column in model.__table__.columns
+        if column.key not in key_columns
+    ]
+    return statement.on_conflict_do_update(
+        index_elements=key_columns,
+        set_={
+            column: getattr(model, column) + statement.excluded[column]
+            for column in columns
+        },
+    )
+
+
+def rollup_changes(
+    dialect_name: str,
+    *,
+    sets: Iterable[Any] = (),
+    sessions: Iterable[Any] = (),
+    sign: int = 1,
+) -> list[tuple[Executable, list[dict[str, Any]] | None]]:
+    """
+    Build the statements applying logged (or removed) sets and sessions to the rollups.
+
+    Deltas are summed per key first, so a whole session costs one upsert per table.
+    Rows are sorted by key so that concurrent writers lock them in the same order.
+
+    :param dialect_name: Name of the database dialect.
+    :param sets: Sets with ``user_id``, ``exercise_id``, ``reps``, ``weight`` and ``performed_at``.
+    :param sessions: Sessions with ``user_id`` and ``started_at``.
+    :param sign: 1 for added, -1 for removed sets and sessions.
+    :return: Statements with their parameters.
+    """
+    weekly: dict[tuple, dict[str, Any]] = defaultdict(
+        lambda: {"sessions": 0, "sets": 0, "reps": 0, "volume": 0.0}
+    )
+    exercises: dict[tuple, dict[str, Any]] = defaultdict(
+        lambda: {"sets": 0, "reps": 0, "volume": 0.0}
+    )
+    for set_entry in sets:
+        week = week_start(set_entry.performed_at)
+        for totals in (
+            weekly[set_entry.user_id, week],
+            exercises[set_entry.user_id, week, set_entry.exercise_id],
+        ):
+            totals["sets"] += sign
+            totals["reps"] += sign * set_entry.reps
+            totals["volume"] += sign * set_entry.reps * set_entry.weight
+    for session in sessions:
+        weekly[session.user_id, week_start(session.started_at)]["sessions"] += sign
+
+    changes: list[tuple[Executable, list[dict[str, Any]] | None]] = []
+    if exercises:
+        changes.append(
+            (
+                _increment(
+                    WeeklyExerciseRollup,
+                    dialect_name,
+                    ["user_id", "week", "exercise_id"],
+                ),
+                [
+                    {
+                        "user_id": user_id,
+                        "week": week,
+                        "exercise_id": exercise_id,
+                        **totals,
+                    }
+                    for (user_id, week, exercise_id), totals in sorted(
+                        exercises.items()
+                    )
+                ],
+            )
+        )
+    if weekly:
+        changes.append(
+            (
+                _increment(WeeklyRollup, dialect_name, ["user_id", "week"]),
+                [
+                    {"user_id": user_id, "week": week, **totals}
+                    for (user_id, week), totals in sorted(weekly.items())
+                ],
+            )
+        )
+    if sign < 0 and weekly:
+        user_ids = sorted({user_id for user_id, _ in weekly})
+        changes.append(
+            (
+                delete(WeeklyExerciseRollup).where(
+                    WeeklyExerciseRollup.user_id.in_(user_ids),
+                    WeeklyExerciseRollup.sets <= 0,
+                ),
+                None,
+            )
+        )
+        changes.append(
+            (
+                delete(WeeklyRollup).where(
+                    WeeklyRollup.user_id.in_(user_ids),
+                    WeeklyRollup.sessions <= 0,
+                    WeeklyRollup.sets <= 0,
+                ),
+                None,
+            )
+        )
+    return changes
+
+
+def update_rollups(db: Session, **kwargs) -> None:
+    """
+    Apply logged or removed sets and sessions to the rollups in the current transaction.
+
+    :param db: SQLAlchemy database session.
+    :param kwargs: Keyword arguments of :func:`rollup_changes`.
+    """
+    for statement, rows in rollup_changes(db.get_bind().dialect.name, **kwargs):
+        db.execute(statement, rows)
+
+
+async def update_rollups_async(db: AsyncSession, **kwargs) -> None:
+    """
+    Apply logged or removed sets and sessions to the rollups in the current transaction.
+
+    :param db: SQLAlchemy async database session.
+    :param kwargs: Keyword arguments of :func:`rollup_changes`.
+    """
+    for statement, rows in rollup_changes(db.get_bind().dialect.name, **kwargs):
+        await db.execute(statement, rows)
+
+
+def _exercise_totals(dialect_name: str, user_ids: list[int]) -> Select:
+    week = week_of(dialect_name, SetEntry.performed_at)
+    return (
+        select(
+            SetEntry.user_id,
+            week.label("week"),
+            SetEntry.exercise_id,
+            func.count().label("sets"),
+            func.sum(SetEntry.reps).label("reps"),
+            func.sum(SetEntry.reps * SetEntry.weight).label("volume"),
+        )
+        .where(SetEntry.user_id.in_(user_ids))
+        .group_by(SetEntry.user_id, week, SetEntry.exercise_id)
+    )
+
+
+def _session_counts(dialect_name: str, user_ids: list[int]) -> Select:
+    week = week_of(dialect_name, WorkoutSession.started_at)
+    return (
+        select(
+            WorkoutSession.user_id,
+            week.label("week"),
+            func.count().label("sessions"),
+        )
+        .where(WorkoutSession.user_id.in_(user_ids))
+        .group_by(WorkoutSession.user_id, week)
+    )
+
+
+def user_batches(
+    db: Session, user_ids: Iterable[int] | None, batch_size: int
+) -> Iterable[list[int]]:
+    if user_ids is None:
+        user_ids = db.scalars(select(User.id).order_by(User.id)).all()
+    ids = iter(list(user_ids))
+    while batch := list(islice(ids, batch_size)):
+        yield batch
+
+
+def rebuild_rollups(
+    db: Session,
+    *,
+    user_ids: Iterable[int] | None = None,
+    batch_size: int = ROLLUP_BATCH_SIZE,
+) -> int:
+    """
+    Recompute the rollups from the logged history, one transaction per batch of users.
+
+    Each batch is aggregated by the database with ``INSERT ... SELECT ... GROUP BY``.
+
+    :param db: SQLAlchemy database session.
+    :param user_ids: Users to rebuild, all users by default.
+    :param batch_size: Number of users per transaction.
+    :return: Number of rebuilt users.
+    """
+    dialect_name = db.get_bind().dialect.name
+    rollup = WeeklyExerciseRollup
+    rebuilt = 0
+    for batch in user_batches(db, user_ids, batch_size):
+        db.execute(delete(rollup).where(rollup.user_id.in_(batch)))
+        db.execute(delete(WeeklyRollup).where(WeeklyRollup.user_id.in_(batch)))
+        db.execute(
+            insert(rollup).from_select(
+                ["user_id", "week", "exercise_id", *_TOTALS],
+                _exercise_totals(dialect_name, batch),
+            )
+        )
+        db.execute(
+            insert(WeeklyRollup).from_select(
+                ["user_id", "week", *_TOTALS],
+                select(
+                    rollup.user_id,
+                    rollup.week,
+                    func.sum(rollup.sets),
+                    func.sum(rollup.reps),
+                    func.sum(rollup.volume),
+                )
+                .where(rollup.user_id.in_(batch))
+                .group_by(rollup.user_id, rollup.week),
+            )
+        )
+        sessions = dialect_insert(WeeklyRollup, dialect_name).from_select(
+            ["user_id", "week", "sessions"], _session_counts(dialect_name, batch)
+        )
+        db.execute(
+            sessions.on_conflict_do_update(
+                index_elements=["user_id", "week"],
+                set_={"sessions": sessions.excluded["sessions"]},
+            )
+        )
+        db.commit()
+        rebuilt += len(batch)
+    return rebuilt
+
+
+def _differences(
+    table: str, expected: dict[tuple, tuple], actual: dict[tuple, tuple]
+) -> list[RollupMismatch]:
+    mismatches = []
+    for key in sorted(expected.keys() | actual.keys()):
+        want, got = expected.get(key), actual.get(key)
+        if (
+            want is None
+            or got is None
+            or not all(
+                math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-6)
+                for a, b in zip(want, got)
+            )
+        ):
+            mismatches.append(RollupMismatch(table, key, want, got))
+    return mismatches
+
+
+def _expected_weeks(
+    session_counts: Iterable[Row], exercise_totals: dict[tuple, tuple]
+) -> dict[tuple, tuple]:
+    weeks: dict[tuple, list] = defaultdict(lambda: [0, 0, 0, 0.0])
+    for row in session_counts:
+        weeks[row.user_id, row.week][0] = row.sessions
+    for (user_id, week, _), totals in exercise_totals.items():
+        for index, value in enumerate(totals, start=1):
+            weeks[user_id, week][index] += value
+    return {key: tuple(totals) for key, totals in weeks.items()}
+
+
+def check_rollups(
+    db: Session,
+    *,
+    user_ids: Iterable[int] | None = None,
+    batch_size: int = ROLLUP_BATCH_SIZE,
+) -> list[RollupMismatch]:
+    """
+    Compare the rollups with totals aggregated from the logged history.
+
+    :param db: SQLAlchemy database session.
+    :param user_ids: Users to check, all users by default.
+    :param batch_size: Number of users aggregated per query.
+    :return: Rollup rows that are missing, superfluous or differ from the history.
+    """
+    dialect_name = db.get_bind().dialect.name
+    rollup = WeeklyExerciseRollup
+    mismatches = []
+    for batch in user_batches(db, user_ids, batch_size):
+        expected_exercises = {
+            (row.user_id, row.week, row.exercise_id): (row.sets, row.reps, row.volume)
+            for row in db.execute(_exercise_totals(dialect_name, batch))
+        }
+        actual_exercises = {
+            (row.user_id, row.week, row.exercise_id): (row.sets, row.reps, row.volume)
+            for row in db.scalars(select(rollup).where(rollup.user_id.in_(batch)))
+        }
+        mismatches += _differences(
+            rollup.__tablename__, expected_exercises, actual_exercises
+        )
+
+        expected_weeks = _expected_weeks(
+            db.execute(_session_counts(dialect_name, batch)), expected_exercises
+        )
+        actual_weeks = {
+            (row.user_id, row.week): (row.sessions, row.sets, row.reps, row.volume)
+            for row in db.scalars(
+                select(WeeklyRollup).where(WeeklyRollup.user_id.in_(batch))
+            )
+        }
+        mismatches += _differences(
+            WeeklyRollup.__tablename__, expected_weeks, actual_weeks
+        )
+    return mismatches
+
+
+class AsyncCRUDWeeklyRollup(
+    AsyncCRUDBase[WeeklyRollup, WeeklyTraining, WeeklyTraining]
+):
+    async def get_weeks(
+        self, db: AsyncSession, *, user_id: int, since: date
+    ) -> list[WeeklyRollup]:
+        """
+        Retrieve the weekly totals of a user, one row per week with training.
+
+        :param db: SQLAlchemy async database session.
+        :param user_id: ID of the user.
+        :param since: First week to include.
+        :return: Weekly totals in week order.
+        """
+        statement = (
+            select(WeeklyRollup)
+            .where(WeeklyRollup.user_id == user_id, WeeklyRollup.week >= since)
+            .order_by(WeeklyRollup.week)
+        )
+        return (await db.scalars(statement)).all()
+
+
+class AsyncCRUDWeeklyExerciseRollup(
+    AsyncCRUDBase[WeeklyExerciseRollup, CategoryWeeklyTraining, CategoryWeeklyTraining]
+):
+    async def get_category_weeks(
+        self, db: AsyncSession, *, user_id: int, since: date
+    ) -> list[Row]:
+        """
+        Retrieve the weekly totals of a user per category of the trained exercises.
+
+        :param db: SQLAlchemy async database session.
+        :param user_id: ID of the user.
+        :param since: First week to include.
+        :return: Rows of week, category ID and totals in week and category order.
+        """
+        rollup = self.model
+        statement = (
+            select(
+                rollup.week,
+                Exercise.category_id,
+                func.sum(rollup.sets).label("sets"),
+                func.sum(rollup.reps).label("reps"),
+                func.sum(rollup.volume).label("volume"),
+            )
+            .join(Exercise, Exercise.id == rollup.exercise_id)
+            .where(rollup.user_id == user_id, rollup.week >= since)
+            .group_by(rollup.week, Exercise.category_id)
+            .order_by(rollup.week, Exercise.category_id)
+        )
+        return (await db.execute(statement)).all()
+
+
+async_weekly_rollup = AsyncCRUDWeeklyRollup(
+    WeeklyRollup, cursor_columns=(WeeklyRollup.user_id, WeeklyRollup.week)
+)
+async_weekly_exercise_rollup = AsyncCRUDWeeklyExerciseRollup(
+    WeeklyExerciseRollup,
+    cursor_columns=(
+        WeeklyExerciseRollup.user_id,
+        WeeklyExerciseRollup.week,
+        WeeklyExerciseRollup.exercise_id,
+    ),
+)
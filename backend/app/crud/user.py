@@ -1,41 +1,85 @@
 from typing import Any
 
+from sqlalchemy import Row, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from app.core.security import get_password_hash, verify_password
-from app.core.crud_base import CRUDBase
+from app.core.cache import principal_cache
+from app.core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_password,
+    verify_password_async,
+)
+from app.core.crud_base import AsyncCRUDBase, CRUDBase
 from app.models import User
 from app.schemas import UserCreate, UserUpdate
 
 
+def _build_user(obj_in: UserCreate, hashed_password: str) -> User:
+    return User(
+        email=obj_in.email,
+        password=hashed_password,
+        first_name=obj_in.first_name,
+        last_name=obj_in.last_name,
+        is_superuser=obj_in.is_superuser,
+    )
+
+
+def _get_update_data(obj_in: UserUpdate | dict[str, Any]) -> dict[str, Any]:
+    if isinstance(obj_in, dict):
+        update_data = dict(obj_in)
+    else:
+        update_data = obj_in.model_dump(exclude_unset=True)
+    if update_data.get("password") is None:
+        update_data.pop("password", None)
+    return update_data
+
+
+def _invalidate_principals(users: list[User]) -> None:
+    for db_obj in users:
+        principal_cache.invalidate(db_obj.id)
+
+
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     def create(self, db: Session, *, obj_in: UserCreate) -> User:
-        hashed_password = get_password_hash(obj_in.password)
-        db_obj = User(
-            email=obj_in.email,
-            password=hashed_password,
-            first_name=obj_in.first_name,
-            last_name=obj_in.last_name,
-            is_superuser=obj_in.is_superuser,
-        )
+        db_obj = _build_user(obj_in, get_password_hash(obj_in.password))
         db.add(db_obj)
-        db.commit()
-        db.refresh(db_obj)
+        self._save(db, db_obj)
         return db_obj
 
     def update(
         self, db: Session, *, db_obj: User, obj_in: UserUpdate | dict[str, Any]
     ) -> User:
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.model_dump(exclude_unset=True)
+        update_data = _get_update_data(obj_in)
         if "password" in update_data:
-            hashed_password = get_password_hash(update_data["password"])
-            del update_data["password"]
-            update_data["password"] = hashed_password
+            update_data["password"] = get_password_hash(update_data["password"])
+
+        db_obj = super().update(db, db_obj=db_obj, obj_in=update_data)
+        principal_cache.invalidate(db_obj.id)
+        return db_obj
 
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+    def update_where(
+        self, db: Session, *, filters: dict[str, Any], values: dict[str, Any]
+    ) -> list[User]:
+        updated = super().update_where(db, filters=filters, values=values)
+        _invalidate_principals(updated)
+        return updated
+
+    def delete_where(self, db: Session, *, filters: dict[str, Any]) -> list[User]:
+        deleted = super().delete_where(db, filters=filters)
+        _invalidate_principals(deleted)
+        return deleted
+
+    def deactivate(self, db: Session, *, db_obj: User) -> User:
+        """
+        Deactivate a user so that it can no longer authenticate.
+
+        :param db: SQLAlchemy database session.
+        :param db_obj: User to deactivate.
+        :return: Updated user.
+        """
+        return self.update(db, db_obj=db_obj, obj_in={"is_active": False})
 
     def authenticate(self, db: Session, *, email: str, password: str) -> User | None:
         user_instance = self.get(db, email=email)
@@ -46,4 +90,73 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
         return user_instance
 
 
+class AsyncCRUDUser(AsyncCRUDBase[User, UserCreate, UserUpdate]):
+    """User CRUD on an async session, password hashing runs on the hashing executor."""
+
+    async def create(self, db: AsyncSession, *, obj_in: UserCreate) -> User:
+        db_obj = _build_user(obj_in, await get_password_hash_async(obj_in.password))
+        db.add(db_obj)
+        await self._save(db)
+        return db_obj
+
+    async def get_version(self, db: AsyncSession, *, user_id: int) -> Row | None:
+        """
+        Retrieve only the validators of a user, without loading the whole record.
+
+        :param db: SQLAlchemy async database session.
+        :param user_id: ID of the user.
+        :return: Row of ``version`` and ``updated_at`` or None if not found.
+        """
+        statement = select(User.version, User.updated_at).where(User.id == user_id)
+        return (await db.execute(statement)).one_or_none()
+
+    async def update(
+        self, db: AsyncSession, *, db_obj: User, obj_in: UserUpdate | dict[str, Any]
+    ) -> User:
+        update_data = _get_update_data(obj_in)
+        if "password" in update_data:
+            update_data["password"] = await get_password_hash_async(
+                update_data["password"]
+            )
+
+        db_obj = await super().update(db, db_obj=db_obj, obj_in=update_data)
+        principal_cache.invalidate(db_obj.id)
+        return db_obj
+
+    async def update_where(
+        self, db: AsyncSession, *, filters: dict[str, Any], values: dict[str, Any]
+    ) -> list[User]:
+        updated = await super().update_where(db, filters=filters, values=values)
+        _invalidate_principals(updated)
+        return updated
+
+    async def delete_where(
+        self, db: AsyncSession, *, filters: dict[str, Any]
+    ) -> list[User]:
+        deleted = await super().delete_where(db, filters=filters)
+        _invalidate_principals(deleted)
+        return deleted
+
+    async def deactivate(self, db: AsyncSession, *, db_obj: User) -> User:
+        """
+        Deactivate a user so that it can no longer authenticate.
+
+        :param db: SQLAlchemy async database session.
+        :param db_obj: User to deactivate.
+        :return: Updated user.
+        """
+        return await self.update(db, db_obj=db_obj, obj_in={"is_active": False})
+
+    async def authenticate(
+        self, db: AsyncSession, *, email: str, password: str
+    ) -> User | None:
+        user_instance = await self.get(db, email=email)
+        if not user_instance:
+            return None
+        if not await verify_password_async(password, user_instance.password):
+            return None
+        return user_instance
+
+
 user = CRUDUser(User)
+async_user = AsyncCRUDUser(User)
@@ -0,0 +1,218 @@
+from datetime import datetime, timezone
+from typing import Any, Iterable
+
+from sqlalchemy import Delete, Select, delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.crud_base import AsyncCRUDBase, CRUDBase, primary_key_filters
+from app.crud.leaderboard import update_leaderboards, update_leaderboards_async
+from app.crud.progress import bump_versions, bump_versions_async
+from app.crud.records import (
+    refresh_records,
+    refresh_records_async,
+    update_records,
+    update_records_async,
+)
+from app.crud.training import update_rollups, update_rollups_async
+from app.models import SetEntry, WorkoutSession
+from app.schemas import SetEntryCreate, WorkoutSessionCreate, WorkoutSessionUpdate
+
+
+# multi-row `INSERT ... VALUES (...), (...) RETURNING`, a whole session is one statement.
+# Ordering the returned rows by parameter would make SQLite insert row by row.
+_INSERT_SETS = insert(SetEntry).returning(SetEntry)
+
+
+def _in_time_order(sets: Iterable[SetEntry]) -> list[SetEntry]:
+    return sorted(sets, key=lambda item: (item.performed_at, item.id))
+
+
+def _select_sessions(filters: dict[str, Any]) -> Select:
+    return select(WorkoutSession.user_id, WorkoutSession.started_at).filter_by(
+        **filters
+    )
+
+
+def _delete_sets(filters: dict[str, Any]) -> Delete:
+    sessions = select(WorkoutSession.id).filter_by(**filters)
+    # the removed sets are subtracted from the rollups, records and leaderboards and
+    # bump the versions of their histories
+    return (
+        delete(SetEntry)
+        .where(SetEntry.session_id.in_(sessions))
+        .returning(
+            SetEntry.user_id,
+            SetEntry.exercise_id,
+            SetEntry.reps,
+            SetEntry.weight,
+            SetEntry.performed_at,
+        )
+    )
+
+
+def _build_session(obj_in: WorkoutSessionCreate, user_id: int) -> WorkoutSession:
+    return WorkoutSession(
+        user_id=user_id,
+        started_at=obj_in.started_at or datetime.now(timezone.utc).replace(tzinfo=None),
+        ended_at=obj_in.ended_at,
+        notes=obj_in.notes,
+    )
+
+
+def _set_rows(
+    db_obj: WorkoutSession, sets: Iterable[SetEntryCreate]
+) -> list[dict[str, Any]]:
+    return [
+        {
+            "session_id": db_obj.id,
+            "user_id": db_obj.user_id,
+            "exercise_id": set_in.exercise_id,
+            "reps": set_in.reps,
+            "weight": set_in.weight,
+            "performed_at": set_in.performed_at or db_obj.started_at,
+        }
+        for set_in in sets
+    ]
+
+
+class CRUDWorkoutSession(
+    CRUDBase[WorkoutSession, WorkoutSessionCreate, WorkoutSessionUpdate]
+):
+    def create_with_sets(
+        self, db: Session, *, obj_in: WorkoutSessionCreate, user_id: int
+    ) -> WorkoutSession:
+        """
+        Log a whole session, its sets are inserted with a single statement.
+
+        :param db: SQLAlchemy database session.
+        :param obj_in: Session with its sets.
+        :param user_id: ID of the user who trained.
+        :return: Created session with its sets.
+        """
+        db_obj = _build_session(obj_in, user_id)
+        db.add(db_obj)
+        db.flush()
+        sets = self.add_sets(db, db_obj=db_obj, sets=obj_in.sets, save=False)
+        set_committed_value(db_obj, "sets", sets)
+        update_rollups(db, sessions=[db_obj])
+        self._save(db, db_obj)
+        return db_obj
+
+    def add_sets(
+        self,
+        db: Session,
+        *,
+        db_obj: WorkoutSession,
+        sets: list[SetEntryCreate],
+        save: bool = True,
+    ) -> list[SetEntry]:
+        """
+        Append sets to a session with a single statement.
+
+        :param db: SQLAlchemy database session.
+        :param db_obj: Session the sets belong to.
+        :param sets: Sets to insert.
+        :param save: Whether to commit (or flush in a unit of work).
+        :return: Created sets in time order.
+        """
+        rows = _set_rows(db_obj, sets)
+        created = _in_time_order(db.scalars(_INSERT_SETS, rows)) if rows else []
+        update_rollups(db, sets=created)
+        update_records(db, sets=created)
+        bump_versions(db, sets=created)
+        update_leaderboards(db, sets=created)
+        if save:
+            self._save(db)
+        return created
+
+    def remove(self, db: Session, **kwargs) -> WorkoutSession | None:
+        # the sets are deleted first, only once the session is known to be single
+        primary_key_filters(self.primary_key, kwargs)
+        # explicit for databases not enforcing the cascade of the foreign key
+        sessions = db.execute(_select_sessions(kwargs)).all()
+        sets = db.execute(_delete_sets(kwargs)).all()
+        update_rollups(db, sets=sets, sessions=sessions, sign=-1)
+        refresh_records(db, sets=sets)
+        bump_versions(db, sets=sets)
+        update_leaderboards(db, sets=sets)
+        return super().remove(db, **kwargs)
+
+
+class AsyncCRUDWorkoutSession(
+    AsyncCRUDBase[WorkoutSession, WorkoutSessionCreate, WorkoutSessionUpdate]
+):
+    # one-to-many: a second `SELECT ... WHERE session_id IN (...)`
+    with_sets = (selectinload(WorkoutSession.sets),)
+
+    async def create_with_sets(
+        self, db: AsyncSession, *, obj_in: WorkoutSessionCreate, user_id: int
+    ) -> WorkoutSession:
+        """
+        Log a whole session, its sets are inserted with a single statement.
+
+        :param db: SQLAlchemy async database session.
+        :param obj_in: Session with its sets.
+        :param user_id: ID of the user who trained.
+        :return: Created session with its sets.
+        """
+        db_obj = _build_session(obj_in, user_id)
+        db.add(db_obj)
+        await db.flush()
+        sets = await self.add_sets(db, db_obj=db_obj, sets=obj_in.sets, save=False)
+        set_committed_value(db_obj, "sets", sets)
+        await update_rollups_async(db, sessions=[db_obj])
+        await self._save(db)
+        return db_obj
+
+    async def add_sets(
+        self,
+        db: AsyncSession,
+        *,
+        db_obj: WorkoutSession,
+        sets: list[SetEntryCreate],
+        save: bool = True,
+    ) -> list[SetEntry]:
+        """
+        Append sets to a session with a single statement.
+
+        :param db: SQLAlchemy async database session.
+        :param db_obj: Session the sets belong to.
+        :param sets: Sets to insert.
+        :param save: Whether to commit (or flush in a unit of work).
+        :return: Created sets in time order.
+        """
+        rows = _set_rows(db_obj, sets)
+        created = _in_time_order(await db.scalars(_INSERT_SETS, rows)) if rows else []
+        await update_rollups_async(db, sets=created)
+        await update_records_async(db, sets=created)
+        await bump_versions_async(db, sets=created)
+        await update_leaderboards_async(db, sets=created)
+        if save:
+            await self._save(db)
+        return created
+
+    async def remove(self, db: AsyncSession, **kwargs) -> WorkoutSession | None:
+        # the sets are deleted first, only once the session is known to be single
+        primary_key_filters(self.primary_key, kwargs)
+        # explicit for databases not enforcing the cascade of the foreign key
+        sessions = (await db.execute(_select_sessions(kwargs))).all()
+        sets = (await db.execute(_delete_sets(kwargs))).all()
+        await update_rollups_async(db, sets=sets, sessions=sessions, sign=-1)
+        await refresh_records_async(db, sets=sets)
+        await bump_versions_async(db, sets=sets)
+        await update_leaderboards_async(db, sets=sets)
+        return await super().remove(db, **kwargs)
+
+
+class AsyncCRUDSetEntry(AsyncCRUDBase[SetEntry, SetEntryCreate, SetEntryCreate]):
+    pass
+
+
+workout_session = CRUDWorkoutSession(WorkoutSession)
+async_workout_session = AsyncCRUDWorkoutSession(WorkoutSession)
+# history of a user in time order, served by the (user, exercise, performed_at) index
+async_set_entry = AsyncCRUDSetEntry(
+    SetEntry, cursor_columns=(SetEntry.performed_at, SetEntry.id)
+)
@@ -0,0 +1,39 @@
+from typing import Any
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.core import deps, settings
+from app.core.batch import render_batch, run_batch
+
+router = APIRouter()
+
+BATCH_PATH = f"{settings.API_STR}/batch"
+
+
+@router.post("", response_model=list[schemas.BatchResponse])
+async def batch(
+    request: Request,
+    items: list[schemas.BatchRequest] = Body(
+        ..., min_length=1, max_length=settings.BATCH_MAX_REQUESTS
+    ),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Execute several API requests in a single round trip.
+
+    The caller is authenticated once for every item. Consecutive GET requests run
+    concurrently, other requests run one at a time in the batch order. Every item
+    gets its own status, a failing item does not fail the batch.
+    """
+    for item in items:
+        if item.url.partition("?")[0].rstrip("/") == BATCH_PATH:
+            raise HTTPException(status_code=400, detail="Batches cannot be nested.")
+    # the session that authenticated the caller (the same instance, dependencies are
+    # cached per request) must not hold a pooled connection while the items wait
+    # for their own
+    await db.close()
+    responses = await run_batch(request, items, current_user)
+    return Response(content=render_batch(responses), media_type="application/json")
@@ -0,0 +1,118 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import crud, schemas
+from app.core import deps
+from app.core.cache import catalog_cache
+from app.core.http_cache import cached_json
+from app.core.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+category_list = TypeAdapter(list[schemas.Category])
+category_detail = TypeAdapter(schemas.CategoryWithExercises)
+
+
+@router.get("/", response_model=list[schemas.Category])
+async def read_categories(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: deps.PageParams = Depends(),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve categories.
+
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
+    """
+
+    async def load(response: Response) -> Any:
+        return await page.fetch(crud.async_category, db, response)
+
+    return await cached_json(request, catalog_cache, category_list, load)
+
+
+@router.post("/", response_model=schemas.Category)
+async def create_category(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    category_in: schemas.CategoryCreate,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Create new category.
+    """
+    if await crud.async_category.get(db, name=category_in.name):
+        raise HTTPException(
+            status_code=400, detail="The category with this name already exists."
+        )
+    return await crud.async_category.create(db, obj_in=category_in)
+
+
+@router.get("/{category_id}", response_model=schemas.CategoryWithExercises)
+async def read_category(
+    request: Request,
+    category_id: int,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get a specific category with its exercises.
+    """
+
+    async def load(response: Response) -> Any:
+        category = await crud.async_category.get(
+            db, id=category_id, options=crud.async_category.with_exercises
+        )
+        if not category:
+            raise HTTPException(status_code=404, detail="The category does not exist.")
+        return category
+
+    return await cached_json(request, catalog_cache, category_detail, load)
+
+
+@router.put("/{category_id}", response_model=schemas.Category)
+async def update_category(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    category_id: int,
+    category_in: schemas.CategoryUpdate,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Update a category.
+    """
+    category = await crud.async_category.get(db, id=category_id)
+    if not category:
+        raise HTTPException(status_code=404, detail="The category does not exist.")
+    existing = await crud.async_category.get(db, name=category_in.name)
+    if existing and existing.id != category_id:
+        raise HTTPException(
+            status_code=400, detail="The category with this name already exists."
+        )
+    return await crud.async_category.update(db, db_obj=category, obj_in=category_in)
+
+
+@router.delete("/{category_id}", response_model=schemas.Category)
+async def delete_category(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    category_id: int,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Delete a category without exercises.
+    """
+    try:
+        category = await crud.async_category.remove(db, id=category_id)
+    except IntegrityError as exc:
+        raise HTTPException(
+            status_code=400, detail="The category still has exercises."
+        ) from exc
+    if not category:
+        raise HTTPException(status_code=404, detail="The category does not exist.")
+    return category
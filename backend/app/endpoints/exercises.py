@@ -0,0 +1,203 @@
+import io
+from typing import Any
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Request,
+    Query,
+    Response,
+    UploadFile,
+)
+from pydantic import TypeAdapter
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app import crud, schemas
+from app.core import deps, settings
+from app.core.cache import catalog_cache
+from app.core.export import ExportFormat
+from app.core.http_cache import cached_json
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.crud.catalog_import import import_catalog
+from app.crud.recommendations import get_similar
+
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+exercise_list = TypeAdapter(list[schemas.ExerciseWithCategory])
+exercise_detail = TypeAdapter(schemas.ExerciseWithCategory)
+exercise_recommendations = TypeAdapter(list[schemas.ExerciseRecommendation])
+
+
+async def _check_category(db: AsyncSession, category_id: int | None) -> None:
+    if category_id is not None and not await crud.async_category.get(
+        db, id=category_id
+    ):
+        raise HTTPException(status_code=400, detail="The category does not exist.")
+
+
+@router.get("/", response_model=list[schemas.ExerciseWithCategory])
+async def read_exercises(
+    request: Request,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: deps.PageParams = Depends(),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve exercises with their categories.
+
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
+    """
+
+    async def load(response: Response) -> Any:
+        return await page.fetch(
+            crud.async_exercise, db, response, options=crud.async_exercise.with_category
+        )
+
+    return await cached_json(request, catalog_cache, exercise_list, load)
+
+
+@router.post("/", response_model=schemas.Exercise)
+async def create_exercise(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    exercise_in: schemas.ExerciseCreate,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Create new exercise.
+    """
+    if await crud.async_exercise.get(db, name=exercise_in.name):
+        raise HTTPException(
+            status_code=400, detail="The exercise with this name already exists."
+        )
+    await _check_category(db, exercise_in.category_id)
+    return await crud.async_exercise.create(db, obj_in=exercise_in)
+
+
+@router.post("/import", response_model=schemas.ImportReport)
+async def import_exercises(
+    *,
+    db: Session = Depends(deps.get_db),
+    file: UploadFile,
+    import_format: ExportFormat = Query(ExportFormat.CSV, alias="format"),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Import exercises and their categories from a CSV or NDJSON file.
+
+    Rows need `name`, `category` and optionally `description`. Categories are
+    created when missing and exercises with an existing name are updated. Invalid
+    rows are skipped and reported.
+    """
+    stream = io.TextIOWrapper(file.file, encoding="utf-8", newline="")
+    return await run_in_threadpool(import_catalog, db, stream, import_format)
+
+
+@router.get("/search", response_model=list[schemas.ExerciseWithCategory])
+async def search_exercises(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Search exercises by name and description, best matches first.
+    """
+    return await crud.async_exercise.search(
+        db, query=q, limit=limit, options=crud.async_exercise.with_category
+    )
+
+
+@router.get("/{exercise_id}", response_model=schemas.ExerciseWithCategory)
+async def read_exercise(
+    request: Request,
+    exercise_id: int,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get a specific exercise with its category.
+    """
+
+    async def load(response: Response) -> Any:
+        exercise = await crud.async_exercise.get(
+            db, id=exercise_id, options=crud.async_exercise.with_category
+        )
+        if not exercise:
+            raise HTTPException(status_code=404, detail="The exercise does not exist.")
+        return exercise
+
+    return await cached_json(request, catalog_cache, exercise_detail, load)
+
+
+@router.get(
+    "/{exercise_id}/similar", response_model=list[schemas.ExerciseRecommendation]
+)
+async def read_similar_exercises(
+    request: Request,
+    exercise_id: int,
+    limit: int = Query(10, ge=1, le=settings.RECOMMENDATION_NEIGHBORS),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the exercises most often trained by the same users, favouring the
+    same category, with their similarity score.
+
+    Neighbors are precomputed by the `build_recommendations.py` job.
+    """
+
+    async def load(response: Response) -> Any:
+        return await get_similar(db, exercise_id=exercise_id, limit=limit)
+
+    return await cached_json(request, catalog_cache, exercise_recommendations, load)
+
+
+@router.put("/{exercise_id}", response_model=schemas.Exercise)
+async def update_exercise(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    exercise_id: int,
+    exercise_in: schemas.ExerciseUpdate,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Update an exercise.
+    """
+    exercise = await crud.async_exercise.get(db, id=exercise_id)
+    if not exercise:
+        raise HTTPException(status_code=404, detail="The exercise does not exist.")
+    if exercise_in.name is not None:
+        existing = await crud.async_exercise.get(db, name=exercise_in.name)
+        if existing and existing.id != exercise_id:
+            raise HTTPException(
+                status_code=400, detail="The exercise with this name already exists."
+            )
+    await _check_category(db, exercise_in.category_id)
+    return await crud.async_exercise.update(db, db_obj=exercise, obj_in=exercise_in)
+
+
+@router.delete("/{exercise_id}", response_model=schemas.Exercise)
+async def delete_exercise(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    exercise_id: int,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Delete an exercise that was never logged.
+    """
+    try:
+        exercise = await crud.async_exercise.remove(db, id=exercise_id)
+    except IntegrityError as exc:
+        await db.rollback()
+        raise HTTPException(
+            status_code=400, detail="The exercise has logged sets."
+        ) from exc
+    if not exercise:
+        raise HTTPException(status_code=404, detail="The exercise does not exist.")
+    return exercise
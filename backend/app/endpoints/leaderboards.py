@@ -0,0 +1,153 @@
+from datetime import date
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app import schemas
+from app.core import deps
+from app.core.leaderboard import leaderboards, lift_board, volume_board
+from app.crud.leaderboard import (
+    get_standings,
+    retained_since,
+    sync_leaderboards_async,
+)
+from app.crud.training import week_start
+from app.core.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+
+class BoardPage:
+    """Offset pagination of a leaderboard, ranks are positions."""
+
+    def __init__(
+        self,
+        skip: int = Query(0, ge=0),
+        limit: int = Query(100, ge=1, le=1000),
+    ):
+        self.skip = skip
+        self.limit = limit
+
+
+def _week(week: date | None = None) -> date:
+    # any day selects its week, the current one by default
+    monday = week_start(week or date.today())
+    if monday < retained_since():
+        raise HTTPException(
+            status_code=404, detail="Leaderboards of this week are not kept."
+        )
+    return monday
+
+
+async def _read_board(db: AsyncSession, board: str, page: BoardPage) -> dict[str, Any]:
+    await sync_leaderboards_async(db)
+    standings, total = leaderboards.top(board, page.skip, page.limit)
+    return {
+        "total": total,
+        "standings": await get_standings(db, standings=standings),
+    }
+
+
+async def _read_position(db: AsyncSession, board: str, user_id: int) -> dict[str, Any]:
+    await sync_leaderboards_async(db)
+    standing, total = leaderboards.rank(board, user_id)
+    return {
+        "total": total,
+        "rank": standing.rank if standing else None,
+        "score": standing.score if standing else None,
+    }
+
+
+@router.get("/exercises/{exercise_id}/lifts", response_model=schemas.Leaderboard)
+async def read_lift_leaderboard(
+    exercise_id: int,
+    page: BoardPage = Depends(),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the users ranked by the heaviest weight they lifted on an exercise.
+    """
+    return await _read_board(db, lift_board(exercise_id), page)
+
+
+@router.get(
+    "/exercises/{exercise_id}/lifts/me", response_model=schemas.LeaderboardPosition
+)
+async def read_lift_position(
+    exercise_id: int,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the position of the current user on the lift leaderboard of an exercise.
+    """
+    return await _read_position(db, lift_board(exercise_id), current_user.id)
+
+
+@router.get("/exercises/{exercise_id}/volume", response_model=schemas.Leaderboard)
+async def read_exercise_volume_leaderboard(
+    exercise_id: int,
+    week: date = Depends(_week),
+    page: BoardPage = Depends(),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the users ranked by their volume on an exercise during a week.
+
+    Weeks start on Monday (UTC), only the most recent weeks are kept.
+    """
+    return await _read_board(db, volume_board("exercise", exercise_id, week), page)
+
+
+@router.get(
+    "/exercises/{exercise_id}/volume/me", response_model=schemas.LeaderboardPosition
+)
+async def read_exercise_volume_position(
+    exercise_id: int,
+    week: date = Depends(_week),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the position of the current user on the weekly volume leaderboard of
+    an exercise.
+    """
+    board = volume_board("exercise", exercise_id, week)
+    return await _read_position(db, board, current_user.id)
+
+
+@router.get("/categories/{category_id}/volume", response_model=schemas.Leaderboard)
+async def read_category_volume_leaderboard(
+    category_id: int,
+    week: date = Depends(_week),
+    page: BoardPage = Depends(),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the users ranked by their volume on the exercises of a category during
+    a week.
+
+    Weeks start on Monday (UTC), only the most recent weeks are kept.
+    """
+    return await _read_board(db, volume_board("category", category_id, week), page)
+
+
+@router.get(
+    "/categories/{category_id}/volume/me", response_model=schemas.LeaderboardPosition
+)
+async def read_category_volume_position(
+    category_id: int,
+    week: date = Depends(_week),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the position of the current user on the weekly volume leaderboard of
+    a category.
+    """
+    board = volume_board("category", category_id, week)
+    return await _read_position(db, board, current_user.id)
@@ -3,24 +3,26 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core import security, deps, settings
-from app.crud import user as user_crud
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.crud import async_user as user_crud
 from app.schemas import Token
 
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
 
 
 @router.post("/login/access-token", response_model=Token)
-def login_access_token(
-    db: Session = Depends(deps.get_db), form_data: OAuth2PasswordRequestForm = Depends()
+async def login_access_token(
+    db: AsyncSession = Depends(deps.get_async_db),
+    form_data: OAuth2PasswordRequestForm = Depends(),
 ) -> Any:
     """
     OAuth2 compatible token login, get an access token for future requests
     """
-    user = user_crud.authenticate(
+    user = await user_crud.authenticate(
         db, email=form_data.username, password=form_data.password
     )
     if not user:
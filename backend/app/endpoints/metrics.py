@@ -0,0 +1,60 @@
+from typing import Any
+
+from fastapi import APIRouter, Depends
+
+from app import schemas
+from app.core import deps
+from app.core.cache import (
+    catalog_cache,
+    principal_cache,
+    progress_cache,
+    token_cache,
+)
+from app.core.hashing import hash_executor
+from app.core.leaderboard import leaderboards
+from app.core.database import engines
+from app.core.pool import pool_status
+
+router = APIRouter()
+
+
+@router.get("/pools", response_model=dict[str, dict[str, Any]])
+async def read_pool_metrics(
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Retrieve the state of every database connection pool.
+
+    Checked out, idle and overflow counts are live, checkout counts, timeouts
+    and wait times accumulate since the process started.
+    """
+    return {name: pool_status(engine) for name, engine in engines.items()}
+
+
+@router.get("/caches", response_model=dict[str, dict[str, Any]])
+async def read_cache_metrics(
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Retrieve the size and hit ratio of the per-process caches.
+    """
+    return {
+        "catalog": catalog_cache.stats(),
+        "leaderboards": leaderboards.stats(),
+        "principal": principal_cache.stats(),
+        "progress": progress_cache.stats(),
+        "token": token_cache.stats(),
+    }
+
+
+@router.get("/hashing", response_model=dict[str, float | int])
+async def read_hashing_metrics(
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Retrieve the workload of the password hashing executor.
+
+    Queue wait is the time a job waited for a worker, hash time the time spent
+    hashing, both accumulate since the process started.
+    """
+    return hash_executor.metrics.snapshot()
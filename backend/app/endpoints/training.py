@@ -0,0 +1,125 @@
+from datetime import date, timedelta
+from typing import Any
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from pydantic import TypeAdapter
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+
+from app import crud, schemas
+from app.core import deps, settings
+from app.core.cache import progress_cache
+from app.core.http_cache import cached_body, json_response
+from app.crud.progress import get_history, get_version, progress_series
+from app.crud.recommendations import get_recommendations
+from app.crud.training import week_start
+from app.core.unit_of_work import UnitOfWorkRoute
+
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+progress_detail = TypeAdapter(schemas.ProgressSeries)
+
+
+def _since(weeks: int) -> date:
+    return week_start(date.today()) - timedelta(weeks=weeks - 1)
+
+
+@router.get("/training/weekly", response_model=list[schemas.WeeklyTraining])
+async def read_weekly_training(
+    weeks: int = Query(12, ge=1, le=520),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the session count, sets, reps and volume of the current user per week.
+
+    Weeks start on Monday (UTC), weeks without training are omitted.
+    """
+    return await crud.async_weekly_rollup.get_weeks(
+        db, user_id=current_user.id, since=_since(weeks)
+    )
+
+
+@router.get("/training/categories", response_model=list[schemas.CategoryWeeklyTraining])
+async def read_category_training(
+    weeks: int = Query(12, ge=1, le=520),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the sets, reps and volume of the current user per week and category.
+
+    Weeks start on Monday (UTC), weeks without training are omitted.
+    """
+    return await crud.async_weekly_exercise_rollup.get_category_weeks(
+        db, user_id=current_user.id, since=_since(weeks)
+    )
+
+
+@router.get("/records", response_model=list[schemas.PersonalRecord])
+async def read_personal_records(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: deps.PageParams = Depends(),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the personal records of the current user per exercise.
+
+    Estimated one-rep maxima use Epley's and Brzycki's formulas. The cursor of
+    the next page is returned in the `X-Next-Cursor` header.
+    """
+    return await page.fetch(
+        crud.async_personal_record,
+        db,
+        response,
+        filters={"user_id": current_user.id},
+    )
+
+
+@router.get("/progress/{exercise_id}", response_model=schemas.ProgressSeries)
+async def read_progress(  # pylint: disable=too-many-arguments
+    request: Request,
+    exercise_id: int,
+    metric: schemas.ProgressMetric = schemas.ProgressMetric.E1RM,
+    points: int = Query(
+        settings.PROGRESS_DEFAULT_POINTS, ge=3, le=settings.PROGRESS_MAX_POINTS
+    ),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the daily progress of the current user on an exercise.
+
+    The series holds the best weight, the most reps, the volume or the best Epley
+    estimated one-rep maximum of every training day, downsampled to at most
+    `points` days with the Largest-Triangle-Three-Buckets algorithm. Series are
+    cached until the next set write of the exercise.
+    """
+    version = await get_version(db, user_id=current_user.id, exercise_id=exercise_id)
+    key = (current_user.id, exercise_id, metric, points, version)
+    cached = progress_cache.get(key)
+    if cached is None:
+        rows = await get_history(db, user_id=current_user.id, exercise_id=exercise_id)
+        series = await run_in_threadpool(progress_series, rows, metric, points)
+        body = progress_detail.dump_json(
+            schemas.ProgressSeries(exercise_id=exercise_id, metric=metric, **series)
+        )
+        cached = cached_body(body)
+        progress_cache.set(key, cached)
+    return json_response(request, cached)
+
+
+@router.get("/recommendations", response_model=list[schemas.ExerciseRecommendation])
+async def read_recommendations(
+    limit: int = Query(10, ge=1, le=100),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Recommend exercises similar to the ones the current user trained recently.
+
+    Exercises trained in the recent weeks are not recommended, users without
+    recent training get no recommendations.
+    """
+    return await get_recommendations(db, user_id=current_user.id, limit=limit)
@@ -1,90 +1,155 @@
 from typing import Any
 
-from fastapi import APIRouter, Body, Depends, HTTPException
-from fastapi.encoders import jsonable_encoder
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
 from pydantic.networks import EmailStr
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app import crud, models, schemas
+from app import crud, schemas
 from app.core import deps
+from app.core.cache import principal_cache
+from app.core.export import EXPORT_MEDIA_TYPES, ExportFormat, csv_rows, ndjson_lines
+from app.core.http_cache import not_modified, validator_headers
+from app.core.unit_of_work import UnitOfWorkRoute
 
-router = APIRouter()
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+
+def _user_etag(user_id: int, version: int) -> str:
+    return f'"user-{user_id}-{version}"'
 
 
 @router.get("/", response_model=list[schemas.User])
-def read_users(
-    db: Session = Depends(deps.get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+async def read_users(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: deps.PageParams = Depends(),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
     Retrieve users.
+
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
     """
-    users = crud.user.get_multi(db, skip=skip, limit=limit)
-    return users
+    return await page.fetch(crud.async_user, db, response)
+
+
+@router.get("/export", response_class=StreamingResponse)
+async def export_users(
+    export_format: ExportFormat = Query(ExportFormat.NDJSON, alias="format"),
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
+) -> Any:
+    """
+    Export every user as newline delimited JSON or CSV.
+
+    Users are streamed from a server-side cursor one chunk at a time, so memory
+    use does not grow with the number of users.
+    """
+    chunks = crud.async_user.stream(db)
+    if export_format is ExportFormat.CSV:
+        body = csv_rows(chunks, schemas.User)
+    else:
+        body = ndjson_lines(chunks, schemas.User)
+    return StreamingResponse(
+        body,
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={
+            "Content-Disposition": f'attachment; filename="users.{export_format.value}"'
+        },
+    )
 
 
 @router.post("/", response_model=schemas.User)
-def create_user(
+async def create_user(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     user_in: schemas.UserCreate,
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
     Create new user.
     """
-    user = crud.user.get(db, email=user_in.email)
+    user = await crud.async_user.get(db, email=user_in.email)
     if user:
         raise HTTPException(
             status_code=400,
             detail="The user with this username already exists in the system.",
         )
-    user = crud.user.create(db, obj_in=user_in)
+    user = await crud.async_user.create(db, obj_in=user_in)
     return user
 
 
 @router.put("/me", response_model=schemas.User)
-def update_user_me(
+async def update_user_me(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     password: str = Body(None),
     first_name: str = Body(None),
     last_name: str = Body(None),
-    current_user: models.User = Depends(deps.get_current_active_user),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Update own user.
     """
-    current_user = crud.user.get(db, id=current_user.id)
-    current_user_data = jsonable_encoder(current_user)
-    user_in = schemas.UserUpdate(**current_user_data)
+    current_user = await crud.async_user.get(db, id=current_user.id)
+    update_data = {}
     if password is not None:
-        user_in.password = password
+        update_data["password"] = password
     if first_name is not None:
-        user_in.first_name = first_name
+        update_data["first_name"] = first_name
     if last_name is not None:
-        user_in.last_name = last_name
-    user = crud.user.update(db, db_obj=current_user, obj_in=user_in)
+        update_data["last_name"] = last_name
+    user = await crud.async_user.update(db, db_obj=current_user, obj_in=update_data)
     return user
 
 
 @router.get("/me", response_model=schemas.User)
-def read_user_me(
-    db: Session = Depends(deps.get_db),
-    current_user: models.User = Depends(deps.get_current_active_user),
+async def read_user_me(
+    request: Request,
+    response: Response,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+    db: AsyncSession = Depends(deps.get_async_read_db),
 ) -> Any:
     """
     Get current user.
+
+    Supports conditional requests with `If-None-Match` and `If-Modified-Since`,
+    which are checked against the stored user rather than the cached principal.
     """
-    return current_user
+    # the principal cache is per process, another worker may have updated the user
+    validators = await crud.async_user.get_version(db, user_id=current_user.id)
+    if validators is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    etag = _user_etag(current_user.id, validators.version)
+    headers = validator_headers(etag, validators.updated_at)
+    if not_modified(request, etag, validators.updated_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    user = current_user
+    if validators.version != current_user.version:
+        user = await crud.async_user.get(db, id=current_user.id)
+        if user is None:
+            raise HTTPException(status_code=404, detail="User not found")
+        principal_cache.invalidate(user.id)
+        etag = _user_etag(user.id, user.version)
+        headers = validator_headers(etag, user.updated_at)
+    response.headers.update(headers)
+    return user
 
 
 @router.post("/open", response_model=schemas.User)
-def create_user_open(
+async def create_user_open(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     password: str = Body(...),
     email: EmailStr = Body(...),
     first_name: str = Body(...),
@@ -93,7 +158,7 @@ def create_user_open(
     """
     Create new user without the need to be logged in.
     """
-    user = crud.user.get(db, email=email)
+    user = await crud.async_user.get(db, email=email)
     if user:
         raise HTTPException(
             status_code=400,
@@ -102,45 +167,60 @@ def create_user_open(
     user_in = schemas.UserCreate(
         password=password, email=email, first_name=first_name, last_name=last_name
     )
-    user = crud.user.create(db, obj_in=user_in)
+    user = await crud.async_user.create(db, obj_in=user_in)
     return user
 
 
 @router.get("/{user_id}", response_model=schemas.User)
-def read_user_by_id(
+async def read_user_by_id(
+    request: Request,
+    response: Response,
     user_id: int,
-    current_user: models.User = Depends(deps.get_current_active_user),
-    db: Session = Depends(deps.get_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+    db: AsyncSession = Depends(deps.get_async_read_db),
 ) -> Any:
     """
     Get a specific user by id.
+
+    Supports conditional requests with `If-None-Match` and `If-Modified-Since`,
+    which are checked before loading the user.
     """
-    user = crud.user.get(db, id=user_id)
-    if user == current_user:
-        return user
-    if not crud.user.is_superuser(current_user):
+    if user_id != current_user.id and not current_user.is_superuser:
         raise HTTPException(
             status_code=400, detail="The user doesn't have enough privileges"
         )
+    validators = await crud.async_user.get_version(db, user_id=user_id)
+    if validators is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    etag = _user_etag(user_id, validators.version)
+    headers = validator_headers(etag, validators.updated_at)
+    if not_modified(request, etag, validators.updated_at):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    user = await crud.async_user.get(db, id=user_id)
+    # the user may have changed or been deleted since its validators were read
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    etag = _user_etag(user_id, user.version)
+    response.headers.update(validator_headers(etag, user.updated_at))
     return user
 
 
 @router.put("/{user_id}", response_model=schemas.User)
-def update_user(
+async def update_user(
     *,
-    db: Session = Depends(deps.get_db),
+    db: AsyncSession = Depends(deps.get_async_db),
     user_id: int,
     user_in: schemas.UserUpdate,
-    current_user: models.User = Depends(deps.get_current_active_superuser),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_superuser),
 ) -> Any:
     """
     Update a user.
     """
-    user = crud.user.get(db, id=user_id)
+    user = await crud.async_user.get(db, id=user_id)
     if not user:
         raise HTTPException(
             status_code=404,
             detail="The user with this username does not exist in the system",
         )
-    user = crud.user.update(db, db_obj=user, obj_in=user_in)
+    user = await crud.async_user.update(db, db_obj=user, obj_in=user_in)
     return user
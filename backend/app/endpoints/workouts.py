@@ -0,0 +1,163 @@
+from typing import Any, Sequence
+
+from fastapi import APIRouter, Body, Depends, HTTPException, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql.base import ExecutableOption
+
+from app import crud, schemas
+from app.core import deps, settings
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.models import Exercise, WorkoutSession
+
+router = APIRouter(route_class=UnitOfWorkRoute)
+
+
+async def _get_own_session(
+    db: AsyncSession,
+    session_id: int,
+    current_user: schemas.UserPrincipal,
+    options: Sequence[ExecutableOption] = (),
+) -> WorkoutSession:
+    session = await crud.async_workout_session.get(db, id=session_id, options=options)
+    # sessions of other users are not disclosed
+    if not session or (
+        session.user_id != current_user.id and not current_user.is_superuser
+    ):
+        raise HTTPException(
+            status_code=404, detail="The workout session does not exist."
+        )
+    return session
+
+
+async def _check_exercises(
+    db: AsyncSession, sets: list[schemas.SetEntryCreate]
+) -> None:
+    exercise_ids = {set_in.exercise_id for set_in in sets}
+    if not exercise_ids:
+        return
+    found = await db.scalars(select(Exercise.id).where(Exercise.id.in_(exercise_ids)))
+    if missing := exercise_ids - set(found):
+        raise HTTPException(
+            status_code=400, detail=f"The exercises {sorted(missing)} do not exist."
+        )
+
+
+@router.get("/", response_model=list[schemas.WorkoutSession])
+async def read_workout_sessions(
+    response: Response,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: deps.PageParams = Depends(),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the workout sessions of the current user, oldest first.
+
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
+    """
+    return await page.fetch(
+        crud.async_workout_session,
+        db,
+        response,
+        filters={"user_id": current_user.id},
+    )
+
+
+@router.post("/", response_model=schemas.WorkoutSessionWithSets)
+async def create_workout_session(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    session_in: schemas.WorkoutSessionCreate,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Log a whole workout session of the current user with its sets.
+
+    Sets without `performed_at` are dated at the start of the session.
+    """
+    await _check_exercises(db, session_in.sets)
+    return await crud.async_workout_session.create_with_sets(
+        db, obj_in=session_in, user_id=current_user.id
+    )
+
+
+@router.get("/sets", response_model=list[schemas.SetEntry])
+async def read_sets(
+    response: Response,
+    exercise_id: int | None = None,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    page: deps.PageParams = Depends(),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve the sets of the current user in time order, optionally of one exercise.
+
+    The cursor of the next page is returned in the `X-Next-Cursor` header.
+    """
+    filters = {"user_id": current_user.id}
+    if exercise_id is not None:
+        filters["exercise_id"] = exercise_id
+    return await page.fetch(crud.async_set_entry, db, response, filters=filters)
+
+
+@router.get("/{session_id}", response_model=schemas.WorkoutSessionWithSets)
+async def read_workout_session(
+    session_id: int,
+    db: AsyncSession = Depends(deps.get_async_read_db),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get a workout session with its sets.
+    """
+    return await _get_own_session(
+        db, session_id, current_user, crud.async_workout_session.with_sets
+    )
+
+
+@router.put("/{session_id}", response_model=schemas.WorkoutSession)
+async def update_workout_session(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    session_id: int,
+    session_in: schemas.WorkoutSessionUpdate,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Update the end or the notes of a workout session.
+    """
+    session = await _get_own_session(db, session_id, current_user)
+    return await crud.async_workout_session.update(
+        db, db_obj=session, obj_in=session_in
+    )
+
+
+@router.delete("/{session_id}", response_model=schemas.WorkoutSession)
+async def delete_workout_session(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    session_id: int,
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Delete a workout session with its sets.
+    """
+    await _get_own_session(db, session_id, current_user)
+    return await crud.async_workout_session.remove(db, id=session_id)
+
+
+@router.post("/{session_id}/sets", response_model=list[schemas.SetEntry])
+async def create_sets(
+    *,
+    db: AsyncSession = Depends(deps.get_async_db),
+    session_id: int,
+    sets_in: list[schemas.SetEntryCreate] = Body(
+        ..., min_length=1, max_length=settings.WORKOUT_MAX_SETS
+    ),
+    current_user: schemas.UserPrincipal = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Append sets to a workout session, inserted with a single statement.
+    """
+    session = await _get_own_session(db, session_id, current_user)
+    await _check_exercises(db, sets_in)
+    return await crud.async_workout_session.add_sets(db, db_obj=session, sets=sets_in)
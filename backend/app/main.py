@@ -1,12 +1,22 @@
-from fastapi import FastAPI
+import asyncio
+
+from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core import settings
 from app.core.api import api_router
+from app.core.compression import CompressionMiddleware
+from app.core.database import engines
+from app.core.pagination import NEXT_CURSOR_HEADER
+from app.core.responses import FastJSONResponse
+from app.core.pool import run_liveness_checks
+from app.core.hashing import HashingUnavailable, hash_executor
 
 
 app = FastAPI(
-    title=settings.PROJECT_NAME, openapi_url=f"{settings.API_STR}/openapi.json"
+    title=settings.PROJECT_NAME,
+    openapi_url=f"{settings.API_STR}/openapi.json",
+    default_response_class=FastJSONResponse,
 )
 
 if settings.CORS_ORIGINS:
@@ -16,6 +26,41 @@ if settings.CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Last-Modified"],
     )
 
+# added last so that it wraps CORS and compresses every response
+app.add_middleware(CompressionMiddleware)
+
 app.include_router(api_router, prefix=settings.API_STR)
+
+
+@app.exception_handler(HashingUnavailable)
+async def hashing_unavailable_handler(
+    request: Request, exc: HashingUnavailable
+) -> FastJSONResponse:
+    return FastJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": str(exc)},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.on_event("shutdown")
+def shutdown_hash_executor() -> None:
+    hash_executor.shutdown()
+
+
+@app.on_event("startup")
+async def start_pool_liveness_checks() -> None:
+    if settings.DB_POOL_LIVENESS_INTERVAL > 0:
+        app.state.pool_liveness = asyncio.create_task(
+            run_liveness_checks(engines, settings.DB_POOL_LIVENESS_INTERVAL)
+        )
+
+
+@app.on_event("shutdown")
+async def stop_pool_liveness_checks() -> None:
+    task = getattr(app.state, "pool_liveness", None)
+    if task is not None:
+        task.cancel()
@@ -1,2 +1,10 @@
 from app.models.user import User
-from app.models.exercise import Exercise, Category
+from app.models.exercise import Exercise, Category, ExerciseNeighbor
+from app.models.workout import WorkoutSession, SetEntry
+from app.models.training import (
+    WeeklyRollup,
+    WeeklyExerciseRollup,
+    PersonalRecord,
+    HistoryVersion,
+    LeaderboardEntry,
+)
@@ -1,3 +1,4 @@
+from sqlalchemy import DDL, Index, SmallInteger, event, func, literal_column
 from sqlalchemy.orm import relationship, Mapped, mapped_column
 from sqlalchemy.sql.schema import ForeignKey
 
@@ -24,3 +25,80 @@ class Exercise(Base):
 
     def __repr__(self) -> str:
         return f"<Exercise: {self.name}>"
+
+
+class ExerciseNeighbor(Base):
+    """
+    Precomputed most similar exercises of an exercise, replaced by the offline
+    ``build_recommendations.py`` job and read in rank order.
+    """
+
+    exercise_id: Mapped[int] = mapped_column(
+        ForeignKey("exercise.id", ondelete="CASCADE"), primary_key=True
+    )
+    rank: Mapped[int] = mapped_column(SmallInteger, primary_key=True)
+    neighbor_id: Mapped[int] = mapped_column(
+        ForeignKey("exercise.id", ondelete="CASCADE")
+    )
+    score: Mapped[float]
+
+    def __repr__(self) -> str:
+        return f"<ExerciseNeighbor: {self.exercise_id} #{self.rank}>"
+
+
+def _weighted_document(column, weight: str):
+    # constants are inlined rather than bound so that queries match the index expression
+    return func.setweight(
+        func.to_tsvector(literal_column("'english'"), column),
+        literal_column(f"'{weight}'"),
+    )
+
+
+# Postgres full-text document of an exercise, matches in the name rank higher. Its GIN
+# index (ix_exercise_search) is created by migration, functional indexes are not reflected
+EXERCISE_SEARCH_VECTOR = _weighted_document(Exercise.__table__.c.name, "A").op("||")(
+    _weighted_document(Exercise.__table__.c.description, "B")
+)
+
+Index(
+    "ix_exercise_name_trgm",
+    Exercise.__table__.c.name,
+    postgresql_using="gin",
+    postgresql_ops={"name": "gin_trgm_ops"},
+).ddl_if(dialect="postgresql")
+event.listen(
+    Exercise.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
+
+# SQLite fallback: an FTS5 index over the exercise table kept in sync by triggers
+EXERCISE_FTS_TABLE = "exercise_fts"
+_SQLITE_SEARCH_DDL = (
+    f"CREATE VIRTUAL TABLE {EXERCISE_FTS_TABLE} USING fts5(name, description, "
+    "content='exercise', content_rowid='id', tokenize='porter unicode61')",
+    f"INSERT INTO {EXERCISE_FTS_TABLE}({EXERCISE_FTS_TABLE}, rank) "
+    "VALUES ('rank', 'bm25(10.0, 1.0)')",
+    f"CREATE TRIGGER exercise_fts_insert AFTER INSERT ON exercise BEGIN "
+    f"INSERT INTO {EXERCISE_FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+    f"CREATE TRIGGER exercise_fts_delete AFTER DELETE ON exercise BEGIN "
+    f"INSERT INTO {EXERCISE_FTS_TABLE}({EXERCISE_FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); END",
+    f"CREATE TRIGGER exercise_fts_update AFTER UPDATE ON exercise BEGIN "
+    f"INSERT INTO {EXERCISE_FTS_TABLE}({EXERCISE_FTS_TABLE}, rowid, name, description) "
+    "VALUES ('delete', old.id, old.name, old.description); "
+    f"INSERT INTO {EXERCISE_FTS_TABLE}(rowid, name, description) "
+    "VALUES (new.id, new.name, new.description); END",
+)
+for _statement in _SQLITE_SEARCH_DDL:
+    event.listen(
+        Exercise.__table__,
+        "after_create",
+        DDL(_statement).execute_if(dialect="sqlite"),
+    )
+event.listen(
+    Exercise.__table__,
+    "after_drop",
+    DDL(f"DROP TABLE IF EXISTS {EXERCISE_FTS_TABLE}").execute_if(dialect="sqlite"),
+)
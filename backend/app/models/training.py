@@ -0,0 +1,116 @@
+from datetime import date, datetime
+
+from sqlalchemy import String
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql.schema import ForeignKey
+
+from app.core.database import Base
+
+
+class WeeklyRollup(Base):
+    """
+    Training totals of a user per week (starting on Monday, UTC).
+
+    Maintained incrementally by every set and session write, sessions count in
+    the week they started.
+    """
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    week: Mapped[date] = mapped_column(primary_key=True)
+    sessions: Mapped[int] = mapped_column(default=0, server_default="0")
+    sets: Mapped[int] = mapped_column(default=0, server_default="0")
+    reps: Mapped[int] = mapped_column(default=0, server_default="0")
+    volume: Mapped[float] = mapped_column(default=0, server_default="0")
+
+    def __repr__(self) -> str:
+        return f"<WeeklyRollup: user {self.user_id} week {self.week}>"
+
+
+class WeeklyExerciseRollup(Base):
+    """
+    Training totals of a user per week and exercise, category totals group them by
+    the current category of the exercise.
+    """
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    week: Mapped[date] = mapped_column(primary_key=True)
+    exercise_id: Mapped[int] = mapped_column(
+        ForeignKey("exercise.id"), primary_key=True
+    )
+    sets: Mapped[int] = mapped_column(default=0, server_default="0")
+    reps: Mapped[int] = mapped_column(default=0, server_default="0")
+    volume: Mapped[float] = mapped_column(default=0, server_default="0")
+
+    def __repr__(self) -> str:
+        return (
+            f"<WeeklyExerciseRollup: user {self.user_id} week {self.week} "
+            f"exercise {self.exercise_id}>"
+        )
+
+
+class PersonalRecord(Base):
+    """
+    Best performances of a user on an exercise, raised by every logged set.
+
+    ``best_weight_reps`` is the most reps done at ``best_weight``, the estimated
+    one-rep maxima are the best over all sets.
+    """
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    exercise_id: Mapped[int] = mapped_column(
+        ForeignKey("exercise.id"), primary_key=True
+    )
+    best_weight: Mapped[float]
+    best_weight_reps: Mapped[int]
+    best_reps: Mapped[int]
+    epley_1rm: Mapped[float]
+    brzycki_1rm: Mapped[float]
+
+    def __repr__(self) -> str:
+        return f"<PersonalRecord: user {self.user_id} exercise {self.exercise_id}>"
+
+
+class HistoryVersion(Base):
+    """
+    Write counter of the history of a user on an exercise, bumped by every set write.
+
+    Keys the cached progress series. Rows are not deleted with the sets, so a
+    version is never reused, only with their user or exercise.
+    """
+
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    exercise_id: Mapped[int] = mapped_column(
+        ForeignKey("exercise.id", ondelete="CASCADE"), primary_key=True
+    )
+    version: Mapped[int] = mapped_column(default=0, server_default="0")
+
+    def __repr__(self) -> str:
+        return f"<HistoryVersion: user {self.user_id} exercise {self.exercise_id}>"
+
+
+class LeaderboardEntry(Base):
+    """
+    Checkpoint of the score of a user on a leaderboard, shared by the workers.
+
+    Written with the sets that change it, a score of 0 is kept as a tombstone so
+    that the workers drop the user from their ranked index.
+    """
+
+    board: Mapped[str] = mapped_column(String(64), primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), primary_key=True
+    )
+    score: Mapped[float]
+    week: Mapped[date | None]
+    updated_at: Mapped[datetime] = mapped_column(index=True)
+
+    def __repr__(self) -> str:
+        return f"<LeaderboardEntry: {self.board} user {self.user_id}>"
@@ -1,4 +1,5 @@
 from datetime import datetime
+from sqlalchemy import literal_column
 from sqlalchemy.sql import func
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -11,9 +12,16 @@ class User(Base):
     first_name: Mapped[str] = mapped_column(index=True)
     last_name: Mapped[str] = mapped_column(index=True)
     password: Mapped[str]
-    is_active: Mapped[bool] = True
-    is_superuser: Mapped[bool] = False
+    is_active: Mapped[bool] = mapped_column(default=True)
+    is_superuser: Mapped[bool] = mapped_column(default=False)
     create_date: Mapped[datetime] = mapped_column(server_default=func.now())
+    # validators of conditional requests, maintained by every UPDATE including bulk ones
+    version: Mapped[int] = mapped_column(
+        default=1, server_default="1", onupdate=literal_column("version") + 1
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        server_default=func.now(), onupdate=func.now()
+    )
 
     def __repr__(self) -> str:
         return f"<User: {self.email}>"
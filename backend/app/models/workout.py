@@ -0,0 +1,69 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Index, Integer
+from sqlalchemy.orm import relationship, Mapped, mapped_column
+from sqlalchemy.sql import func
+from sqlalchemy.sql.schema import ForeignKey
+
+from app.core.database import Base
+
+
+class WorkoutSession(Base):
+    id: Mapped[int] = mapped_column(primary_key=True, index=True)
+    user_id: Mapped[int] = mapped_column(
+        ForeignKey("user.id", ondelete="CASCADE"), index=True
+    )
+    started_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    ended_at: Mapped[datetime | None]
+    notes: Mapped[str] = mapped_column(default="", server_default="")
+    sets: Mapped[list["SetEntry"]] = relationship(
+        "SetEntry",
+        back_populates="session",
+        order_by="SetEntry.performed_at, SetEntry.id",
+        passive_deletes=True,
+    )
+
+    def __repr__(self) -> str:
+        return f"<WorkoutSession: {self.id} of user {self.user_id}>"
+
+
+class SetEntry(Base):
+    """
+    A logged set, the append-mostly bulk of the database.
+
+    On Postgres the table is range partitioned by month on ``performed_at`` by
+    migration, where the primary key is ``(id, performed_at)`` as partitioned
+    tables require. Monthly partitions are created ahead of time by
+    ``create_partitions.py``, rows outside of them land in a default partition.
+    """
+
+    id: Mapped[int] = mapped_column(
+        BigInteger().with_variant(Integer, "sqlite"), primary_key=True
+    )
+    session_id: Mapped[int] = mapped_column(
+        ForeignKey("workoutsession.id", ondelete="CASCADE"), index=True
+    )
+    # denormalized from the session so that per-user history needs no join
+    user_id: Mapped[int] = mapped_column(ForeignKey("user.id", ondelete="CASCADE"))
+    exercise_id: Mapped[int] = mapped_column(ForeignKey("exercise.id"))
+    reps: Mapped[int]
+    weight: Mapped[float] = mapped_column(default=0, server_default="0")
+    performed_at: Mapped[datetime] = mapped_column(server_default=func.now())
+    session: Mapped["WorkoutSession"] = relationship(back_populates="sets")
+
+    __table_args__ = (
+        Index(
+            "ix_setentry_user_exercise_performed_at",
+            "user_id",
+            "exercise_id",
+            "performed_at",
+        ),
+        # inserts arrive in time order, so a BRIN index covers time ranges at a
+        # fraction of the size and write cost of a btree
+        Index(
+            "ix_setentry_performed_at_brin", "performed_at", postgresql_using="brin"
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    def __repr__(self) -> str:
+        return f"<SetEntry: {self.reps} x {self.weight} of exercise {self.exercise_id}>"
@@ -1,7 +1,40 @@
 from app.schemas.token import Token, TokenPayload
-from app.schemas.user import UserCreate, UserInDB as User, UserUpdate
+from app.schemas.user import UserCreate, UserInDB as User, UserUpdate, UserPrincipal
 from app.schemas.category import (
     CategoryCreate,
     CategoryUpdate,
     CategoryInDB as Category,
+    CategoryWithExercises,
 )
+from app.schemas.exercise import (
+    ExerciseCreate,
+    ExerciseUpdate,
+    ExerciseInDB as Exercise,
+    ExerciseWithCategory,
+    ExerciseRecommendation,
+    ExerciseImport,
+    ImportReport,
+    ImportRowError,
+)
+from app.schemas.workout import (
+    SetEntryCreate,
+    SetEntryInDB as SetEntry,
+    WorkoutSessionCreate,
+    WorkoutSessionUpdate,
+    WorkoutSessionInDB as WorkoutSession,
+    WorkoutSessionWithSets,
+)
+from app.schemas.training import (
+    WeeklyTraining,
+    CategoryWeeklyTraining,
+    ProgressMetric,
+    ProgressPoint,
+    ProgressSeries,
+)
+from app.schemas.records import PersonalRecordInDB as PersonalRecord
+from app.schemas.leaderboard import (
+    Leaderboard,
+    LeaderboardPosition,
+    LeaderboardStanding,
+)
+from app.schemas.batch import BatchMethod, BatchRequest, BatchResponse
@@ -0,0 +1,32 @@
+import re
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel, Field
+
+from app.core import settings
+
+
+class BatchMethod(str, Enum):
+    GET = "GET"
+    POST = "POST"
+    PUT = "PUT"
+    PATCH = "PATCH"
+    DELETE = "DELETE"
+
+
+class BatchRequest(BaseModel):
+    method: BatchMethod = BatchMethod.GET
+    # path of an endpoint of the API with its query string, e.g. "/api/exercises?limit=10"
+    url: str = Field(max_length=2048, pattern=f"^{re.escape(settings.API_STR)}/")
+    # e.g. If-None-Match, the batch request's credentials are used for every item
+    headers: dict[str, str] = {}
+    # JSON body of the request
+    body: Any = None
+
+
+class BatchResponse(BaseModel):
+    status: int
+    headers: dict[str, str]
+    # JSON body of the response, the text of other media types, None when empty
+    body: Any = None
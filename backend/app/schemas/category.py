@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CategoryBase(BaseModel):
@@ -18,3 +18,16 @@ class CategoryInDB(CategoryBase):
 
     class Config:
         orm_mode = True
+
+
+class CategoryExercise(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    description: str
+
+
+# Category together with its exercises (one-to-many, loaded with a second SELECT ... IN)
+class CategoryWithExercises(CategoryInDB):
+    exercises: list[CategoryExercise]
@@ -0,0 +1,58 @@
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.schemas.category import CategoryInDB
+
+
+class ExerciseBase(BaseModel):
+    name: str
+    description: str
+    category_id: int
+
+
+class ExerciseCreate(ExerciseBase):
+    pass
+
+
+# only the fields sent are updated, none of them can be null (defaults are not
+# validated, an explicit null is)
+class ExerciseUpdate(ExerciseBase):
+    name: str = None
+    description: str = None
+    category_id: int = None
+
+
+class ExerciseInDB(ExerciseBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+
+
+# Exercise listed together with its category (many-to-one, loaded with a join)
+class ExerciseWithCategory(ExerciseInDB):
+    category: CategoryInDB
+
+
+# Similar or recommended exercise with its similarity score
+class ExerciseRecommendation(ExerciseWithCategory):
+    score: float
+
+
+# Row of a bulk catalog import, the category is referenced by name
+class ExerciseImport(BaseModel):
+    name: str = Field(min_length=1)
+    description: str = ""
+    category: str = Field(min_length=1)
+
+
+class ImportRowError(BaseModel):
+    line: int
+    error: str
+
+
+class ImportReport(BaseModel):
+    rows: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: list[ImportRowError] = []
+    seconds: float = 0.0
+    rows_per_second: float = 0.0
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+
+
+class LeaderboardStanding(BaseModel):
+    rank: int
+    user_id: int
+    first_name: str
+    last_name: str
+    score: float
+
+
+class Leaderboard(BaseModel):
+    # number of ranked users
+    total: int
+    standings: list[LeaderboardStanding]
+
+
+class LeaderboardPosition(BaseModel):
+    total: int
+    # None while the user is not ranked on the board
+    rank: int | None
+    score: float | None
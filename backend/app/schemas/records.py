@@ -0,0 +1,12 @@
+from pydantic import BaseModel, ConfigDict
+
+
+class PersonalRecordInDB(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    exercise_id: int
+    best_weight: float
+    best_weight_reps: int
+    best_reps: int
+    epley_1rm: float
+    brzycki_1rm: float
@@ -0,0 +1,41 @@
+from datetime import date
+from enum import Enum
+
+from pydantic import BaseModel, ConfigDict
+
+
+class TrainingTotals(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    week: date
+    sets: int
+    reps: int
+    volume: float
+
+
+class WeeklyTraining(TrainingTotals):
+    sessions: int
+
+
+class CategoryWeeklyTraining(TrainingTotals):
+    category_id: int
+
+
+class ProgressMetric(str, Enum):
+    WEIGHT = "weight"
+    REPS = "reps"
+    VOLUME = "volume"
+    E1RM = "e1rm"
+
+
+class ProgressPoint(BaseModel):
+    day: date
+    value: float
+
+
+class ProgressSeries(BaseModel):
+    exercise_id: int
+    metric: ProgressMetric
+    # training days in the whole history, before downsampling
+    days: int
+    points: list[ProgressPoint]
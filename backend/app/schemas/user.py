@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, ConfigDict, EmailStr
 
 
 # Shared properties
@@ -33,3 +33,18 @@ class UserInDB(UserBase):
 
     class ConfigDict:
         from_attributes = True
+
+
+# Immutable snapshot of the authenticated user kept in the principal cache
+class UserPrincipal(BaseModel):
+    model_config = ConfigDict(frozen=True, from_attributes=True)
+
+    id: int
+    email: EmailStr
+    first_name: str
+    last_name: str
+    is_active: bool
+    is_superuser: bool
+    create_date: datetime | None = None
+    version: int
+    updated_at: datetime | None = None
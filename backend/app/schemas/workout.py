@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+from typing import Annotated
+
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field
+
+from app.core import settings
+
+
+def _to_naive_utc(value: datetime) -> datetime:
+    # timestamps are stored without time zone, as UTC
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+
+UTCDateTime = Annotated[datetime, AfterValidator(_to_naive_utc)]
+
+
+class SetEntryBase(BaseModel):
+    exercise_id: int
+    reps: int = Field(ge=0, le=10_000)
+    weight: float = Field(0, ge=0, le=10_000)
+
+
+class SetEntryCreate(SetEntryBase):
+    # defaults to the start of the session
+    performed_at: UTCDateTime | None = None
+
+
+class SetEntryInDB(SetEntryBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    session_id: int
+    performed_at: datetime
+
+
+class WorkoutSessionBase(BaseModel):
+    ended_at: UTCDateTime | None = None
+    notes: str = Field("", max_length=10_000)
+
+
+# Whole logged session, its sets are inserted with a single statement
+class WorkoutSessionCreate(WorkoutSessionBase):
+    started_at: UTCDateTime | None = None
+    sets: list[SetEntryCreate] = Field([], max_length=settings.WORKOUT_MAX_SETS)
+
+
+# only the fields sent are updated, notes cannot be null
+class WorkoutSessionUpdate(WorkoutSessionBase):
+    ended_at: UTCDateTime | None = None
+
+
+class WorkoutSessionInDB(WorkoutSessionBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    user_id: int
+    started_at: datetime
+
+
+class WorkoutSessionWithSets(WorkoutSessionInDB):
+    sets: list[SetEntryInDB]
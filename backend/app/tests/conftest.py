@@ -1,14 +1,31 @@
 import pytest
 import logging
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.pool import StaticPool
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.engine import Engine
 
 from app.main import app as base_app
-from app.core.deps import get_db
+from app.models import User
+from app.tests.utils import add_model_to_db
+from app.core.cache import (
+    catalog_cache,
+    principal_cache,
+    progress_cache,
+    token_cache,
+)
+from app.core.leaderboard import leaderboards
+from app.core.deps import (
+    get_async_db,
+    get_async_read_db,
+    get_current_user,
+    get_db,
+    get_read_db,
+)
+from app.core.unit_of_work import register_session
 from app.core.database import Base
 from app.tests import env
 
@@ -22,11 +39,25 @@ def db_engine_session() -> tuple[Engine, sessionmaker]:
     engine = create_engine(
         env.SQLALCHEMY_DATABASE_URL,
         connect_args={"check_same_thread": False},
-        poolclass=StaticPool,
     )
+
+    @event.listens_for(engine, "connect")
+    def _enable_wal(dbapi_connection, connection_record):
+        # readers must not block the async engine writing to the same file
+        dbapi_connection.execute("PRAGMA journal_mode=WAL")
+
     TestingSessionLocal = sessionmaker(bind=engine)
     LOG.debug("Database engine session has been created.")
-    return engine, TestingSessionLocal
+    yield engine, TestingSessionLocal
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def async_db_sessionmaker() -> async_sessionmaker:
+    """Provide an async session factory bound to the test database."""
+    engine = create_async_engine(env.SQLALCHEMY_ASYNC_DATABASE_URL, poolclass=NullPool)
+    LOG.debug("Async database engine has been created.")
+    return async_sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -58,15 +89,48 @@ def override_get_db(db_engine_session: tuple[Engine, sessionmaker]):
     """Override the get_db dependency to use the test database."""
     _, TestingSessionLocal = db_engine_session
 
-    def _get_db_override():
+    def _get_db_override(request: Request):
         with TestingSessionLocal() as db:
+            register_session(request, db)
             yield db
 
     base_app.dependency_overrides[get_db] = _get_db_override
-    LOG.debug("Database dependency `get_db` has been overridden.")
+    base_app.dependency_overrides[get_read_db] = _get_db_override
+    LOG.debug("Database dependencies `get_db`, `get_read_db` have been overridden.")
     yield
     base_app.dependency_overrides.pop(get_db, None)
-    LOG.debug("Database dependency `get_db` has been restored.")
+    base_app.dependency_overrides.pop(get_read_db, None)
+    LOG.debug("Database dependencies `get_db`, `get_read_db` have been restored.")
+
+
+@pytest.fixture(scope="function", autouse=True)
+def override_get_async_db(async_db_sessionmaker: async_sessionmaker):
+    """Override the get_async_db dependency to use the test database."""
+
+    async def _get_async_db_override(request: Request):
+        async with async_db_sessionmaker() as db:
+            register_session(request, db)
+            yield db
+
+    base_app.dependency_overrides[get_async_db] = _get_async_db_override
+    base_app.dependency_overrides[get_async_read_db] = _get_async_db_override
+    LOG.debug("Database dependencies `get_async_db`, `get_async_read_db` overridden.")
+    yield
+    base_app.dependency_overrides.pop(get_async_db, None)
+    base_app.dependency_overrides.pop(get_async_read_db, None)
+    LOG.debug("Database dependencies `get_async_db`, `get_async_read_db` restored.")
+
+
+@pytest.fixture(scope="function", autouse=True)
+def clear_caches():
+    """Drop per-process caches so that no state leaks between tests."""
+    yield
+    principal_cache.clear()
+    token_cache.clear()
+    catalog_cache.clear()
+    progress_cache.clear()
+    leaderboards.clear()
+    LOG.debug("Per-process caches have been cleared.")
 
 
 @pytest.fixture(scope="session")
@@ -80,3 +144,44 @@ def client(app: FastAPI) -> TestClient:
     """Provide a test client for FastAPI using the provided app instance."""
     with TestClient(app) as c:
         yield c
+
+
+@pytest.fixture(scope="function")
+def create_user_model(
+    request: pytest.FixtureRequest, db_session: Session
+) -> tuple[User, dict]:
+    """
+    Create a user model using the provided request parameters and return the user and its data.
+
+    :param request: The pytest request object with test parameters.
+    :param db_session: The database session.
+    :return: A tuple containing the user model and its expected data.
+    """
+    user = add_model_to_db(db_session, User, request.param)
+    return user, request.param
+
+
+@pytest.fixture(scope="function")
+def override_get_current_user(
+    create_user_model: tuple[User, dict], app: FastAPI
+) -> User:
+    """Override the get_db dependency to use the test database."""
+    user, _ = create_user_model
+
+    def _get_current_user_override():
+        return user
+
+    app.dependency_overrides[get_current_user] = _get_current_user_override
+    LOG.debug("Overridden `get_current_user` dependency.")
+    yield user
+    app.dependency_overrides.pop(get_current_user, None)
+    LOG.debug("Restored `get_current_user` dependency.")
+
+
+@pytest.fixture(scope="function")
+def get_current_superuser(override_get_current_user: User, db_session: Session) -> User:
+    override_get_current_user.is_superuser = True
+    db_session.commit()
+    db_session.refresh(override_get_current_user)
+    LOG.debug("Set current user as superuser.")
+    return override_get_current_user
@@ -6,6 +6,17 @@ USER_URL = f"{settings.API_STR}/users"
 USER_ME_URL = f"{USER_URL}/me"
 USER_CREATE_OPEN_URL = f"{USER_URL}/open"
 LOGIN_URL = f"{settings.API_STR}/login/access-token"
+CATEGORY_URL = f"{settings.API_STR}/categories"
+EXERCISE_URL = f"{settings.API_STR}/exercises"
+USER_EXPORT_URL = f"{USER_URL}/export"
+POOL_METRICS_URL = f"{settings.API_STR}/metrics/pools"
+HASHING_METRICS_URL = f"{settings.API_STR}/metrics/hashing"
+WORKOUT_URL = f"{settings.API_STR}/workouts"
+TRAINING_URL = f"{USER_ME_URL}/training"
+RECORDS_URL = f"{USER_ME_URL}/records"
+PROGRESS_URL = f"{USER_ME_URL}/progress"
+LEADERBOARD_URL = f"{settings.API_STR}/leaderboards"
+BATCH_URL = f"{settings.API_STR}/batch"
 
 # test data
 SAMPLE_USER_DATA = (
@@ -55,3 +66,18 @@ SAMPLE_EXERCISE_DATA = (
         "category_id": 3,
     },
 )
+
+SAMPLE_WORKOUT_DATA = {
+    "started_at": "2026-10-05T18:00:00Z",
+    "notes": "push day",
+    "sets": [
+        {"exercise_id": 1, "reps": 5, "weight": 100},
+        {
+            "exercise_id": 1,
+            "reps": 5,
+            "weight": 105,
+            "performed_at": "2026-10-05T20:10:00+02:00",
+        },
+        {"exercise_id": 3, "reps": 8, "weight": 140},
+    ],
+}
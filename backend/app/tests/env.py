@@ -1,2 +1,8 @@
-# db related
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
+import os
+import tempfile
+
+
+# db related, a file database so that the sync and async engines share data
+SQLALCHEMY_DATABASE_PATH = os.path.join(tempfile.mkdtemp(), "test.db")
+SQLALCHEMY_DATABASE_URL = f"sqlite:///{SQLALCHEMY_DATABASE_PATH}"
+SQLALCHEMY_ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{SQLALCHEMY_DATABASE_PATH}"
@@ -1,8 +1,11 @@
 import logging
 import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import Session
 
-from app.models import Category
+from app.models import Category, Exercise
+from app.tests import const
 from app.tests.utils import add_model_to_db
 
 
@@ -24,3 +27,38 @@ def create_category_model(
     instance = add_model_to_db(db_session, Category, request.param)
     LOG.debug(f"Added category to database: {instance}")
     return instance, request.param
+
+
+@pytest.fixture(scope="function")
+def count_queries(async_db_sessionmaker: async_sessionmaker) -> list[str]:
+    """Record the SQL statements executed by the async test engine."""
+    engine = async_db_sessionmaker.kw["bind"].sync_engine
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture(scope="function")
+def catalog(request: pytest.FixtureRequest, db_session: Session) -> list[Category]:
+    """
+    Create the sample categories with the requested number of exercises each.
+
+    :param request: The pytest request object with the number of exercises per category.
+    :param db_session: The database session to use for adding the catalog.
+    :return: The added categories.
+    """
+    categories = [Category(**data) for data in const.SAMPLE_CATEGORY_DATA]
+    for category in categories:
+        category.exercises = [
+            Exercise(name=f"{category.name} {i}", description=f"{category.name} {i}")
+            for i in range(request.param)
+        ]
+    db_session.add_all(categories)
+    db_session.commit()
+    LOG.debug(f"Added catalog with {request.param} exercises per category.")
+    return categories
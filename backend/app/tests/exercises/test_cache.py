@@ -0,0 +1,64 @@
+import logging
+
+from app.core.cache import CachedBody, CatalogCache
+
+
+LOG = logging.getLogger(__name__)
+
+
+def _body(size: int) -> CachedBody:
+    return CachedBody(body=b"x" * size, etag='"etag"', headers={}, encoded={})
+
+
+def test_catalog_cache_byte_cap():
+    """
+    Test that the catalog cache evicts least recently used responses beyond its byte cap.
+
+    Requirements:
+        - A catalog cache of at most 100 bytes.
+
+    Steps:
+        1. Store two 40 byte responses, read the first one, then store a third one.
+        2. Store a response larger than the cap.
+
+    Pass criteria:
+        - The least recently used response is evicted and counted.
+        - The oversized response is not stored.
+    """
+    cache = CatalogCache(maxsize=10, ttl=60, max_bytes=100)
+    cache.set("a", _body(40))
+    cache.set("b", _body(40))
+    assert cache.get("a") is not None, "Response a should be cached!"
+    cache.set("c", _body(40))
+    stats = cache.stats()
+    LOG.debug(f"Catalog cache stats: {stats}")
+    assert cache.get("b") is None, "Least recently used response b should be evicted!"
+    assert stats["bytes"] == 80, f"Unexpected cache size: {stats}"
+    assert stats["evictions"] == 1, f"Unexpected evictions: {stats}"
+
+    cache.set("d", _body(101))
+    assert cache.get("d") is None, "Oversized response should not be cached!"
+
+
+def test_catalog_cache_version():
+    """
+    Test that bumping the catalog version drops responses and rejects stale ones.
+
+    Requirements:
+        - A catalog cache.
+
+    Steps:
+        1. Store a response, then bump the version.
+        2. Store a response loaded under the previous version.
+
+    Pass criteria:
+        - The cache is empty after the bump and the stale response is not stored.
+    """
+    cache = CatalogCache(maxsize=10, ttl=60, max_bytes=100)
+    version = cache.version
+    cache.set("a", _body(10), version=version)
+    cache.bump_version()
+    assert cache.get("a") is None, "Response should be dropped by the version bump!"
+    cache.set("a", _body(10), version=version)
+    assert cache.get("a") is None, "Stale response should not be stored!"
+    assert cache.stats()["bytes"] == 0, f"Unexpected cache size: {cache.stats()}"
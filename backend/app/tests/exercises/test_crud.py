@@ -0,0 +1,179 @@
+import io
+import logging
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.crud_base import dialect_insert
+from app.core.export import ExportFormat
+from app.crud import category as category_crud, exercise as exercise_crud
+from app.crud.catalog_import import import_catalog
+from app.models import Category, Exercise
+from app.schemas import CategoryCreate
+from app.tests import const
+
+
+LOG = logging.getLogger(__name__)
+
+
+def test_create_many_categories(db_session: Session):
+    """
+    Test creating many categories in bulk.
+
+    Requirements:
+        - Database session available.
+
+    Steps:
+        1. Create all sample categories with a chunk size smaller than the input.
+        2. Count the categories in the database.
+
+    Pass criteria:
+        - Created categories are returned in input order with their IDs.
+        - All categories are stored in the database.
+    """
+    objs_in = [CategoryCreate(**data) for data in const.SAMPLE_CATEGORY_DATA]
+    categories = category_crud.create_many(db_session, objs_in=objs_in, chunk_size=4)
+    LOG.debug(f"Created categories: {categories}")
+    assert [category.name for category in categories] == [
+        data["name"] for data in const.SAMPLE_CATEGORY_DATA
+    ], f"Created categories {categories} do not match the input order!"
+    assert all(category.id is not None for category in categories), "Missing IDs!"
+    count = db_session.scalar(select(func.count()).select_from(Category))
+    assert count == len(
+        const.SAMPLE_CATEGORY_DATA
+    ), f"Actual number of categories {count} does not match expected {len(const.SAMPLE_CATEGORY_DATA)}"
+
+
+def test_upsert_many_categories(db_session: Session):
+    """
+    Test upserting categories that partially exist already.
+
+    Requirements:
+        - Database session available.
+
+    Steps:
+        1. Create the first half of the sample categories.
+        2. Upsert all sample categories by name.
+        3. Count the categories in the database.
+        4. Build an upsert for a dialect without ``ON CONFLICT``.
+
+    Pass criteria:
+        - Existing categories keep their IDs.
+        - Missing categories are inserted without duplicates.
+        - The unsupported dialect is rejected with a ValueError.
+    """
+    half = len(const.SAMPLE_CATEGORY_DATA) // 2
+    existing = category_crud.create_many(
+        db_session, objs_in=const.SAMPLE_CATEGORY_DATA[:half]
+    )
+    upserted = category_crud.upsert_many(
+        db_session,
+        objs_in=const.SAMPLE_CATEGORY_DATA,
+        conflict_columns=["name"],
+        chunk_size=4,
+    )
+    LOG.debug(f"Upserted categories: {upserted}")
+    assert [category.id for category in upserted[:half]] == [
+        category.id for category in existing
+    ], "Existing categories should keep their IDs!"
+    count = db_session.scalar(select(func.count()).select_from(Category))
+    assert count == len(
+        const.SAMPLE_CATEGORY_DATA
+    ), f"Actual number of categories {count} does not match expected {len(const.SAMPLE_CATEGORY_DATA)}"
+
+    with pytest.raises(ValueError, match="mysql"):
+        dialect_insert(Category, "mysql")
+
+
+@pytest.mark.parametrize("catalog", [0], indirect=True)
+def test_search_exercises(
+    catalog: list[Category], db_session: Session, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test ranked exercise search and its index staying in sync with the table.
+
+    Requirements:
+        - The sample exercises exist.
+
+    Steps:
+        1. Search by a name prefix and by a description term.
+        2. Search again on a dialect without full-text index.
+        3. Rename an exercise, delete another one and search again.
+
+    Pass criteria:
+        - Name matches rank above description matches, with or without index.
+        - Renamed and deleted exercises are no longer found under their old data.
+    """
+    exercise_crud.create_many(
+        db_session,
+        objs_in=[
+            *const.SAMPLE_EXERCISE_DATA,
+            {"name": "dips", "description": "after bench press", "category_id": 1},
+        ],
+    )
+    names = [item.name for item in exercise_crud.search(db_session, query="bench")]
+    LOG.debug(f"Search results: {names}")
+    assert names == ["bench press", "dips"], f"Unexpected search results: {names}"
+    names = [item.name for item in exercise_crud.search(db_session, query="squat")]
+    assert names == ["squats"], f"Prefix search did not match: {names}"
+    assert exercise_crud.search(db_session, query="?!") == [], "Empty query matched!"
+    with monkeypatch.context() as patch:
+        patch.setattr(db_session.get_bind().dialect, "name", "mysql")
+        names = [item.name for item in exercise_crud.search(db_session, query="BENCH")]
+    assert names == ["bench press", "dips"], f"Unexpected fallback results: {names}"
+
+    exercise_crud.update_where(
+        db_session, filters={"name": "bench press"}, values={"name": "floor press"}
+    )
+    exercise_crud.delete_where(db_session, filters={"name": "dips"})
+    names = [item.name for item in exercise_crud.search(db_session, query="bench")]
+    assert names == ["floor press"], f"Search index out of sync: {names}"
+
+
+@pytest.mark.parametrize("catalog", [1], indirect=True)
+def test_import_catalog(catalog: list[Category], db_session: Session):
+    """
+    Test importing a CSV catalog with new, existing and invalid rows.
+
+    Requirements:
+        - The sample categories exist with one exercise each.
+
+    Steps:
+        1. Import a CSV file updating an existing exercise, adding exercises to an
+           existing and a new category, and containing invalid and duplicate rows.
+        2. Read the exercises back.
+
+    Pass criteria:
+        - Valid rows are imported, the new category is created once.
+        - Invalid and duplicate rows are reported by line and skipped.
+    """
+    existing = catalog[0].exercises[0].name
+    stream = io.StringIO(
+        "name,description,category\r\n"
+        f"{existing},updated,back\r\n"
+        "pistol squat,,legs\r\n"
+        "turkish get-up,full body,kettlebell\r\n"
+        "windmill,,kettlebell\r\n"
+        ",no name,legs\r\n"
+        "pistol squat,again,legs\r\n"
+    )
+    report = import_catalog(db_session, stream, ExportFormat.CSV)
+    LOG.debug(f"Import report: {report}")
+    assert (report.rows, report.imported, report.failed) == (6, 4, 2), report
+    assert [error.line for error in report.errors] == [6, 7], report.errors
+
+    db_session.expire_all()
+    updated = exercise_crud.get(db_session, name=existing)
+    assert updated.description == "updated", "Existing exercise was not updated!"
+    assert updated.category.name == "back", "Category of the update was ignored!"
+    kettlebell = db_session.scalars(
+        select(Category).where(Category.name == "kettlebell")
+    ).all()
+    assert len(kettlebell) == 1, f"New category created {len(kettlebell)} times!"
+    assert {item.name for item in kettlebell[0].exercises} == {
+        "turkish get-up",
+        "windmill",
+    }, "Exercises were not added to the new category!"
+    count = db_session.scalar(select(func.count()).select_from(Exercise))
+    assert count == len(catalog) + 3, f"Unexpected number of exercises {count}"
@@ -0,0 +1,378 @@
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.crud import category as category_crud, exercise as exercise_crud
+from app.models import Category
+from app.schemas import CategoryCreate
+from app.tests import const
+
+
+LOG = logging.getLogger(__name__)
+
+
+def _add_exercises(db_session: Session, categories: list[Category], count: int):
+    # through the CRUD so that the catalog cache is invalidated
+    exercise_crud.create_many(
+        db_session,
+        objs_in=[
+            {
+                "name": f"{category.name} extra {i}",
+                "description": "extra",
+                "category_id": category.id,
+            }
+            for category in categories
+            for i in range(count)
+        ],
+    )
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.parametrize("catalog", [1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_exercises_constant_queries(
+    catalog: list[Category],
+    count_queries: list[str],
+    client: TestClient,
+    db_session: Session,
+):
+    """
+    Test that listing exercises with their categories does not query per category.
+
+    Requirements:
+        - A catalog with one exercise per sample category.
+
+    Steps:
+        1. List the exercises and count the executed queries.
+        2. Add more exercises to every category.
+        3. List the exercises again and count the executed queries.
+
+    Pass criteria:
+        - Every exercise is returned with its category.
+        - The number of queries does not grow with the catalog.
+    """
+    response = client.get(const.EXERCISE_URL)
+    assert response.status_code == 200, response.text
+    first_count = len(count_queries)
+    LOG.debug(f"Queries for a small catalog: {count_queries}")
+
+    _add_exercises(db_session, catalog, 4)
+    count_queries.clear()
+    response = client.get(const.EXERCISE_URL)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert len(data) == 5 * len(catalog), f"Unexpected number of exercises: {data}"
+    assert all(
+        item["category"]["id"] == item["category_id"] for item in data
+    ), f"Categories do not match the exercises: {data}"
+    assert (
+        len(count_queries) == first_count
+    ), f"Query count grew from {first_count} to {len(count_queries)}: {count_queries}"
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.parametrize("catalog", [1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_category_constant_queries(
+    catalog: list[Category],
+    count_queries: list[str],
+    client: TestClient,
+    db_session: Session,
+):
+    """
+    Test that reading a category with its exercises takes the same queries for any size.
+
+    Requirements:
+        - A catalog with one exercise per sample category.
+
+    Steps:
+        1. Read a category and count the executed queries.
+        2. Add more exercises to every category.
+        3. Read the category again and count the executed queries.
+
+    Pass criteria:
+        - The category is returned with all of its exercises.
+        - The number of queries does not grow with the number of exercises.
+    """
+    url = f"{const.CATEGORY_URL}/{catalog[0].id}"
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    first_count = len(count_queries)
+
+    _add_exercises(db_session, catalog, 4)
+    count_queries.clear()
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert len(data["exercises"]) == 5, f"Unexpected exercises: {data['exercises']}"
+    assert (
+        len(count_queries) == first_count
+    ), f"Query count grew from {first_count} to {len(count_queries)}: {count_queries}"
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.parametrize("catalog", [2], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_exercises_cursor_pagination(catalog: list[Category], client: TestClient):
+    """
+    Test walking through the exercises page by page with the next cursor.
+
+    Requirements:
+        - A catalog with two exercises per sample category.
+
+    Steps:
+        1. Request pages of five exercises following the `X-Next-Cursor` header.
+
+    Pass criteria:
+        - Every exercise is returned exactly once and the last page has no cursor.
+    """
+    ids, params = [], {"limit": 5}
+    while True:
+        response = client.get(const.EXERCISE_URL, params=params)
+        assert response.status_code == 200, response.text
+        ids.extend(item["id"] for item in response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            break
+        params = {"limit": 5, "cursor": cursor}
+    assert ids == sorted(set(ids)), f"Exercises repeated or out of order: {ids}"
+    assert len(ids) == 2 * len(catalog), f"Unexpected number of exercises: {ids}"
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.parametrize("catalog", [0], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_create_exercise_success(catalog: list[Category], client: TestClient):
+    """
+    Test creating an exercise as a superuser.
+
+    Requirements:
+        - The current user has superuser privileges.
+        - The sample categories exist.
+
+    Steps:
+        1. Send a POST request with valid exercise data.
+        2. Send a POST request with an unknown category.
+
+    Pass criteria:
+        - The exercise is created, the unknown category is rejected.
+    """
+    payload = const.SAMPLE_EXERCISE_DATA[0]
+    response = client.post(const.EXERCISE_URL, json=payload)
+    assert response.status_code == 200, response.text
+    assert response.json()["name"] == payload["name"], response.text
+
+    response = client.post(
+        const.EXERCISE_URL, json={**const.SAMPLE_EXERCISE_DATA[1], "category_id": 999}
+    )
+    assert response.status_code == 400, response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.parametrize("catalog", [1], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_update_exercise_and_category(catalog: list[Category], client: TestClient):
+    """
+    Test updating exercises and categories as a superuser.
+
+    Requirements:
+        - The current user has superuser privileges.
+        - The sample categories exist with one exercise each.
+
+    Steps:
+        1. Send PUT requests with null exercise fields.
+        2. Rename an exercise and a category to the name of another one.
+        3. Rename an exercise and a category to their own or a new name.
+
+    Pass criteria:
+        - Null fields and existing names are rejected, the exercise is unchanged.
+        - Omitted fields are kept and the other renames succeed.
+    """
+    first, second = catalog[0], catalog[1]
+    exercise_url = f"{const.EXERCISE_URL}/{first.exercises[0].id}"
+    for field in ("name", "description", "category_id"):
+        response = client.put(exercise_url, json={field: None})
+        LOG.debug(f"Null {field}: {response.text}")
+        assert response.status_code == 422, response.text
+
+    response = client.put(exercise_url, json={"name": second.exercises[0].name})
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "The exercise with this name already exists."
+    response = client.put(
+        f"{const.CATEGORY_URL}/{first.id}", json={"name": second.name}
+    )
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "The category with this name already exists."
+
+    response = client.get(exercise_url)
+    assert response.json()["name"] == first.exercises[0].name, response.text
+    response = client.put(exercise_url, json={"name": first.exercises[0].name})
+    assert response.status_code == 200, response.text
+    response = client.put(exercise_url, json={"name": "incline bench press"})
+    assert response.status_code == 200, response.text
+    assert response.json()["description"] == first.exercises[0].description
+    response = client.put(f"{const.CATEGORY_URL}/{first.id}", json={"name": "pecs"})
+    assert response.status_code == 200, response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.parametrize("catalog", [0], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_create_category_forbidden(catalog: list[Category], client: TestClient):
+    """
+    Test that a regular user cannot create a category.
+
+    Requirements:
+        - The current user has no superuser privileges.
+
+    Steps:
+        1. Send a POST request with category data.
+
+    Pass criteria:
+        - The request is rejected.
+    """
+    response = client.post(const.CATEGORY_URL, json={"name": "cardio"})
+    assert response.status_code == 400, response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.parametrize("catalog", [2], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_search_exercises(catalog: list[Category], client: TestClient):
+    """
+    Test searching exercises through the API.
+
+    Requirements:
+        - A catalog with two exercises per sample category.
+
+    Steps:
+        1. Search for the name of a category with a limit of one.
+
+    Pass criteria:
+        - The best match is returned together with its category.
+    """
+    response = client.get(
+        f"{const.EXERCISE_URL}/search", params={"q": "legs", "limit": 1}
+    )
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert len(data) == 1, f"Unexpected search results: {data}"
+    assert data[0]["category"]["name"] == "legs", f"Unexpected search results: {data}"
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.parametrize("catalog", [1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_categories_etag(
+    catalog: list[Category],
+    count_queries: list[str],
+    client: TestClient,
+    db_session: Session,
+):
+    """
+    Test that catalog responses are cached, revalidated with ETags and invalidated on writes.
+
+    Requirements:
+        - A catalog with one exercise per sample category.
+
+    Steps:
+        1. List the categories.
+        2. List them again with and without the returned ETag in `If-None-Match`.
+        3. Create a category and list the categories with the old ETag.
+
+    Pass criteria:
+        - Repeated requests do not query the database, a matching ETag gets a 304.
+        - After the write the new catalog is returned with a new ETag.
+    """
+    response = client.get(const.CATEGORY_URL)
+    assert response.status_code == 200, response.text
+    etag = response.headers["ETag"]
+    assert etag.startswith('"'), f"ETag should be strong and quoted: {etag}"
+
+    count_queries.clear()
+    response = client.get(const.CATEGORY_URL, headers={"If-None-Match": etag})
+    assert response.status_code == 304, response.text
+    assert response.content == b"", "A 304 response must not have a body!"
+    response = client.get(const.CATEGORY_URL)
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == len(catalog), response.text
+    assert (
+        count_queries == []
+    ), f"Cached responses queried the database: {count_queries}"
+
+    category_crud.create(db_session, obj_in=CategoryCreate(name="cardio"))
+    response = client.get(const.CATEGORY_URL, headers={"If-None-Match": etag})
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] != etag, "ETag did not change after a write!"
+    assert len(response.json()) == len(catalog) + 1, response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.parametrize("catalog", [5], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_exercises_precompressed(catalog: list[Category], client: TestClient):
+    """
+    Test that cached catalog responses are served from their compressed variant.
+
+    Requirements:
+        - A catalog large enough to be compressed.
+
+    Steps:
+        1. List the exercises accepting gzip, then without compression.
+        2. List them again with the ETag of the gzip variant.
+
+    Pass criteria:
+        - The gzip variant has its own ETag and decodes to the identity body.
+        - Either ETag revalidates the cached response.
+    """
+    response = client.get(const.EXERCISE_URL, headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip", response.headers
+    gzip_etag = response.headers["etag"]
+    identity = client.get(const.EXERCISE_URL, headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in identity.headers, identity.headers
+    assert identity.content == response.content, "Variants do not match!"
+    assert gzip_etag == identity.headers["etag"][:-1] + '-gzip"', gzip_etag
+
+    response = client.get(const.EXERCISE_URL, headers={"If-None-Match": gzip_etag})
+    assert response.status_code == 304, response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.parametrize("catalog", [0], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_import_exercises(catalog: list[Category], client: TestClient):
+    """
+    Test uploading an NDJSON catalog file.
+
+    Requirements:
+        - The current user has superuser privileges.
+        - The sample categories exist.
+
+    Steps:
+        1. Upload an NDJSON file with a valid and an invalid row.
+        2. List the exercises.
+
+    Pass criteria:
+        - The report counts one imported and one failed row.
+        - The imported exercise is listed, so the catalog cache was invalidated.
+    """
+    client.get(const.EXERCISE_URL)
+    content = (
+        b'{"name": "farmer walk", "description": "carry", "category": "legs"}\n'
+        b'{"name": "broken", "category": \n'
+    )
+    response = client.post(
+        f"{const.EXERCISE_URL}/import",
+        params={"format": "ndjson"},
+        files={"file": ("catalog.ndjson", content, "application/x-ndjson")},
+    )
+    LOG.debug(f"Import response: {response.text}")
+    assert response.status_code == 200, response.text
+    report = response.json()
+    assert (report["imported"], report["failed"]) == (1, 1), report
+    assert report["errors"][0]["line"] == 2, report
+
+    names = [item["name"] for item in client.get(const.EXERCISE_URL).json()]
+    assert "farmer walk" in names, f"Imported exercise not listed: {names}"
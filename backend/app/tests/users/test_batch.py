@@ -0,0 +1,217 @@
+import logging
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core import settings
+from app.core.cache import principal_cache
+from app.core.deps import get_async_read_db
+from app.core.security import create_access_token
+from app.models import Category, User
+from app.tests import const
+from app.endpoints import batch
+from app.tests.utils import add_model_to_db
+
+
+LOG = logging.getLogger(__name__)
+
+
+def test_batch_requests(client: TestClient, db_session: Session):
+    """
+    Test executing several reads in a single batch request.
+
+    Requirements:
+        - User is previously created in the database.
+        - A category exists.
+
+    Steps:
+        1. Request the current user, the categories, a missing category and an
+           invalid query in a batch.
+        2. Inspect the principal cache counters.
+
+    Pass criteria:
+        - Every item gets the status, headers and JSON body of its endpoint, in the
+          batch order, failing items do not fail the batch.
+        - The user is authenticated once for the whole batch.
+    """
+    user = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[0])
+    category = add_model_to_db(db_session, Category, const.SAMPLE_CATEGORY_DATA[0])
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+    before = principal_cache.stats()
+    response = client.post(
+        const.BATCH_URL,
+        headers=headers,
+        json=[
+            {"url": const.USER_ME_URL},
+            {"url": f"{const.CATEGORY_URL}/"},
+            {"url": f"{const.CATEGORY_URL}/999"},
+            {"url": f"{const.CATEGORY_URL}/?limit=0"},
+        ],
+    )
+    after = principal_cache.stats()
+    LOG.debug(f"Batch response: {response.text}")
+    assert response.status_code == 200, response.text
+
+    me, categories, missing, invalid = response.json()
+    assert me["status"] == 200, me
+    assert me["body"]["email"] == user.email
+    assert "etag" in me["headers"], me["headers"]
+    assert categories["status"] == 200, categories
+    assert categories["body"] == [{"id": category.id, "name": category.name}]
+    assert missing["status"] == 404, missing
+    assert missing["body"] == {"detail": "The category does not exist."}
+    assert invalid["status"] == 422, invalid
+    assert after["misses"] - before["misses"] == 1, "User not authenticated once"
+    assert after["hits"] == before["hits"], "Items authenticated again"
+
+
+def test_batch_writes_in_order(client: TestClient, db_session: Session):
+    """
+    Test that the items of a batch observe the writes of the items before them.
+
+    Requirements:
+        - User is previously created in the database.
+
+    Steps:
+        1. List the workout sessions, log one and list them again in a batch.
+
+    Pass criteria:
+        - The first list is empty, the session is created and the last list holds it.
+    """
+    user = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[0])
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+    response = client.post(
+        const.BATCH_URL,
+        headers=headers,
+        json=[
+            {"url": f"{const.WORKOUT_URL}/"},
+            {"method": "POST", "url": f"{const.WORKOUT_URL}/", "body": {"notes": "a"}},
+            {"url": f"{const.WORKOUT_URL}/"},
+        ],
+    )
+    LOG.debug(f"Batch response: {response.text}")
+    assert response.status_code == 200, response.text
+    before, created, after = response.json()
+    assert before["body"] == [], before
+    assert created["status"] == 200, created
+    assert [item["id"] for item in after["body"]] == [created["body"]["id"]]
+
+
+def test_batch_authenticates_again_after_write(client: TestClient, db_session: Session):
+    """
+    Test that the items after a write do not reuse the user authenticated before it.
+
+    Requirements:
+        - User is previously created in the database.
+
+    Steps:
+        1. Read the current user and its ETag.
+        2. Read it conditionally, update it and read it conditionally again in a batch.
+
+    Pass criteria:
+        - The first read is not modified, the last one returns the updated user
+          with a new ETag.
+    """
+    user = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[0])
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+    etag = client.get(const.USER_ME_URL, headers=headers).headers["etag"]
+    conditional = {"url": const.USER_ME_URL, "headers": {"If-None-Match": etag}}
+    response = client.post(
+        const.BATCH_URL,
+        headers=headers,
+        json=[
+            conditional,
+            {"method": "PUT", "url": const.USER_ME_URL, "body": {"first_name": "x"}},
+            conditional,
+        ],
+    )
+    LOG.debug(f"Batch response: {response.text}")
+    assert response.status_code == 200, response.text
+    before, updated, after = response.json()
+    assert before["status"] == 304, before
+    assert updated["status"] == 200, updated
+    assert after["status"] == 200, after
+    assert after["body"]["first_name"] == "x", after
+    assert after["headers"]["etag"] != etag, after["headers"]
+
+
+def test_batch_validation(client: TestClient, db_session: Session):
+    """
+    Test rejecting batches that cannot be executed.
+
+    Requirements:
+        - User is previously created in the database.
+
+    Steps:
+        1. Send a batch without credentials.
+        2. Send a nested batch, a batch outside of the API, an empty and a too
+           large batch.
+
+    Pass criteria:
+        - The batch is rejected as a whole before any item runs.
+    """
+    user = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[0])
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+    response = client.post(const.BATCH_URL, json=[{"url": const.USER_ME_URL}])
+    assert response.status_code == 401, response.text
+
+    response = client.post(
+        const.BATCH_URL, headers=headers, json=[{"url": const.BATCH_URL}]
+    )
+    assert response.status_code == 400, response.text
+    response = client.post(const.BATCH_URL, headers=headers, json=[{"url": "/docs"}])
+    assert response.status_code == 422, response.text
+    response = client.post(const.BATCH_URL, headers=headers, json=[])
+    assert response.status_code == 422, response.text
+    items = [{"url": const.USER_ME_URL}] * (settings.BATCH_MAX_REQUESTS + 1)
+    response = client.post(const.BATCH_URL, headers=headers, json=items)
+    assert response.status_code == 422, response.text
+
+
+def test_batch_releases_authentication_session(
+    app: FastAPI,
+    client: TestClient,
+    db_session: Session,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    """
+    Test that the batch does not hold a connection while its items run.
+
+    Requirements:
+        - User is previously created in the database, not cached.
+
+    Steps:
+        1. Record the read sessions opened by the requests.
+        2. Send a batch, checking its own session when the items start.
+
+    Pass criteria:
+        - The session that authenticated the caller ran its query and was closed
+          before the first item started.
+    """
+    user = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[0])
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+    open_session = app.dependency_overrides[get_async_read_db]
+    sessions, in_transaction = [], []
+
+    async def _recording_session(request: Request):
+        async for db in open_session(request):
+            sessions.append(db)
+            yield db
+
+    async def _checking_run_batch(*args, **kwargs):
+        in_transaction.append(sessions[0].in_transaction())
+        return await run_batch(*args, **kwargs)
+
+    run_batch = batch.run_batch
+    monkeypatch.setitem(app.dependency_overrides, get_async_read_db, _recording_session)
+    monkeypatch.setattr(batch, "run_batch", _checking_run_batch)
+    misses = principal_cache.stats()["misses"]
+    response = client.post(
+        const.BATCH_URL, headers=headers, json=[{"url": const.USER_ME_URL}]
+    )
+    assert response.status_code == 200, response.text
+    assert response.json()[0]["status"] == 200, response.text
+    assert principal_cache.stats()["misses"] == misses + 1, "Caller was not loaded"
+    assert in_transaction == [False], "Batch session still holds its connection"
@@ -0,0 +1,142 @@
+import gzip
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from app.core.compression import CompressionMiddleware, choose_encoding
+
+
+LOG = logging.getLogger(__name__)
+
+LARGE_BODY = b'{"data": "' + b"x" * 4096 + b'"}'
+
+
+@pytest.fixture(scope="module")
+def compression_client() -> TestClient:
+    """Provide a client of a small app behind the compression middleware."""
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=1024)
+
+    @app.get("/large")
+    def large():
+        return Response(
+            LARGE_BODY, media_type="application/json", headers={"ETag": '"v1"'}
+        )
+
+    @app.get("/small")
+    def small():
+        return Response(b'{"data": 1}', media_type="application/json")
+
+    @app.get("/binary")
+    def binary():
+        return Response(LARGE_BODY, media_type="application/octet-stream")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (LARGE_BODY for _ in range(3)), media_type="application/x-ndjson"
+        )
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse("y" * 2048)
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        (None, None),
+        ("gzip, deflate", "gzip"),
+        ("gzip;q=0, deflate", None),
+        ("identity", None),
+    ],
+)
+def test_choose_encoding(header: str | None, expected: str | None):
+    """
+    Test the content coding negotiation.
+
+    Requirements:
+        - None.
+
+    Steps:
+        1. Choose the encoding of an `Accept-Encoding` header.
+
+    Pass criteria:
+        - Gzip is chosen when accepted with a positive quality, nothing otherwise.
+    """
+    assert choose_encoding(header) == expected, f"Unexpected encoding for {header}"
+
+
+@pytest.mark.parametrize(
+    "path, compressed",
+    [("/large", True), ("/small", False), ("/binary", False), ("/text", True)],
+)
+def test_compression_threshold_and_media_types(
+    path: str, compressed: bool, compression_client: TestClient
+):
+    """
+    Test that only large responses of allowed media types are compressed.
+
+    Requirements:
+        - An app behind the compression middleware with a 1 KiB threshold.
+
+    Steps:
+        1. Request the path accepting gzip.
+
+    Pass criteria:
+        - Compressed responses are gzip encoded and vary on `Accept-Encoding`.
+        - Small and binary responses are sent unchanged.
+    """
+    response = compression_client.get(path, headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200, response.text
+    encoding = response.headers.get("content-encoding")
+    LOG.debug(f"{path}: {encoding}, {response.headers}")
+    assert (encoding == "gzip") is compressed, f"Unexpected encoding {encoding}"
+    if compressed:
+        assert "Accept-Encoding" in response.headers["vary"], response.headers
+
+
+def test_compression_etag_and_length(compression_client: TestClient):
+    """
+    Test the headers of a compressed response.
+
+    Requirements:
+        - An app behind the compression middleware.
+
+    Steps:
+        1. Request a large response with an ETag accepting gzip.
+
+    Pass criteria:
+        - The content length is the compressed length and the ETag names the coding.
+    """
+    with compression_client.stream(
+        "GET", "/large", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        raw = b"".join(response.iter_raw())
+    assert int(response.headers["content-length"]) == len(raw), response.headers
+    assert gzip.decompress(raw) == LARGE_BODY, "Body does not decompress!"
+    assert response.headers["etag"] == '"v1-gzip"', response.headers
+
+
+def test_compression_streaming(compression_client: TestClient):
+    """
+    Test that streamed responses are compressed on the fly.
+
+    Requirements:
+        - An app behind the compression middleware.
+
+    Steps:
+        1. Request a streamed response accepting gzip.
+
+    Pass criteria:
+        - The response is gzip encoded, has no content length and decodes to all chunks.
+    """
+    response = compression_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip", response.headers
+    assert "content-length" not in response.headers, response.headers
+    assert response.content == LARGE_BODY * 3, "Streamed body does not decompress!"
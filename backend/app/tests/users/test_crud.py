@@ -100,6 +100,39 @@ def test_update_user(create_user_model: tuple[User, dict], db_session: Session):
     ), f'Actual first name "{updated_user.first_name}" does not match expected "{NEW_FIRST_NAME}"'
 
 
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_update_user_bumps_version(
+    create_user_model: tuple[User, dict], db_session: Session
+):
+    """
+    Test that updates maintain the row version of a user.
+
+    Requirements:
+        - User is previously created in the database.
+
+    Steps:
+        1. Update the user with unchanged data.
+        2. Update the user's first name.
+        3. Update the user with a set-based update.
+
+    Pass criteria:
+        - The version starts at 1 and only grows on actual changes.
+    """
+    user, expected = create_user_model
+    assert user.version == 1, f"Unexpected initial version {user.version}"
+    assert user.updated_at is not None, "Modification time should be set!"
+    user = user_crud.update(
+        db_session, db_obj=user, obj_in={"first_name": expected["first_name"]}
+    )
+    assert user.version == 1, f"Unchanged update bumped the version to {user.version}"
+    user = user_crud.update(db_session, db_obj=user, obj_in={"first_name": "jane"})
+    assert user.version == 2, f"Unexpected version after update {user.version}"
+    (user,) = user_crud.update_where(
+        db_session, filters={"id": user.id}, values={"last_name": "roe"}
+    )
+    assert user.version == 3, f"Unexpected version after bulk update {user.version}"
+
+
 @pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
 def test_delete_user(create_user_model: tuple[User, dict], db_session: Session):
     """
@@ -194,3 +227,81 @@ def test_get_all_users(db_session: Session):
     assert len(users) == len(
         const.SAMPLE_USER_DATA
     ), f"Actual number of users {len(users)} does not match expected {len(const.SAMPLE_USER_DATA)}"
+
+
+def test_update_users_where(db_session: Session):
+    """
+    Test deactivating a group of users with a single statement.
+
+    Requirements:
+        - Users are previously created in the database.
+
+    Steps:
+        1. Create users in the database.
+        2. Deactivate all but the first user by their IDs.
+
+    Pass criteria:
+        - Only the selected users are returned and deactivated.
+    """
+    users = [add_model_to_db(db_session, User, data) for data in const.SAMPLE_USER_DATA]
+    ids = [user.id for user in users[1:]]
+    updated = user_crud.update_where(
+        db_session, filters={"id": ids}, values={"is_active": False}
+    )
+    LOG.debug(f"Deactivated users: {updated}")
+    assert sorted(user.id for user in updated) == ids, f"Unexpected users {updated}"
+    states = {
+        user.id: user_crud.get(db_session, id=user.id).is_active for user in users
+    }
+    assert states == {
+        users[0].id: True,
+        **{user_id: False for user_id in ids},
+    }, f"Unexpected activity states {states}"
+
+
+def test_delete_users_where(db_session: Session):
+    """
+    Test deleting a group of users with a single statement.
+
+    Requirements:
+        - Users are previously created in the database.
+
+    Steps:
+        1. Create users in the database.
+        2. Delete users by their first names.
+
+    Pass criteria:
+        - The deleted users are returned and no longer found in the database.
+    """
+    for data in const.SAMPLE_USER_DATA:
+        add_model_to_db(db_session, User, data)
+    names = [data["first_name"] for data in const.SAMPLE_USER_DATA[:2]]
+    deleted = user_crud.delete_where(db_session, filters={"first_name": names})
+    LOG.debug(f"Deleted users: {deleted}")
+    assert len(deleted) == 2, f"Expected 2 deleted users, got {deleted}"
+    remaining = user_crud.get_multi(db_session)
+    assert [user.first_name for user in remaining] == [
+        const.SAMPLE_USER_DATA[2]["first_name"]
+    ], f"Unexpected remaining users {remaining}"
+
+
+def test_stream_users(db_session: Session):
+    """
+    Test iterating over all users in chunks.
+
+    Requirements:
+        - Users are previously created in the database.
+
+    Steps:
+        1. Create users in the database.
+        2. Stream the users with a chunk size of two.
+
+    Pass criteria:
+        - Chunks hold at most two users and every user is streamed once in ID order.
+    """
+    users = [add_model_to_db(db_session, User, data) for data in const.SAMPLE_USER_DATA]
+    chunks = list(user_crud.stream(db_session, chunk_size=2))
+    LOG.debug(f"Streamed chunks: {chunks}")
+    assert all(len(chunk) <= 2 for chunk in chunks), f"Chunks too large: {chunks}"
+    streamed = [user.id for chunk in chunks for user in chunk]
+    assert streamed == [user.id for user in users], f"Unexpected users {streamed}"
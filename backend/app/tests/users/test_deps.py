@@ -0,0 +1,71 @@
+import logging
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from app.core.cache import principal_cache
+from app.core.security import create_access_token
+from app.crud import user as user_crud
+from app.models import User
+from app.tests import const
+from app.tests.utils import add_model_to_db
+
+
+LOG = logging.getLogger(__name__)
+
+
+def test_current_user_is_cached(client: TestClient, db_session: Session):
+    """
+    Test that the authenticated user is served from the principal cache.
+
+    Requirements:
+        - User is previously created in the database.
+
+    Steps:
+        1. Request the "me" endpoint twice with a valid token.
+        2. Inspect the principal cache counters.
+
+    Pass criteria:
+        - The first request misses the cache and the second one hits it.
+        - Both responses contain the same user.
+    """
+    user = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[0])
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+    before = principal_cache.stats()
+    first = client.get(const.USER_ME_URL, headers=headers)
+    second = client.get(const.USER_ME_URL, headers=headers)
+    after = principal_cache.stats()
+    LOG.debug(f"Principal cache stats: {after}")
+    stats = {key: after[key] - before[key] for key in ("hits", "misses")}
+
+    assert first.status_code == 200, first.text
+    assert second.status_code == 200, second.text
+    assert first.json() == second.json(), "Cached user differs from the database!"
+    assert stats["misses"] == 1, f"Expected 1 miss, got {stats['misses']}"
+    assert stats["hits"] == 1, f"Expected 1 hit, got {stats['hits']}"
+
+
+def test_deactivation_invalidates_cached_user(client: TestClient, db_session: Session):
+    """
+    Test that deactivating a user evicts it from the principal cache.
+
+    Requirements:
+        - User is previously created in the database.
+
+    Steps:
+        1. Request the "me" endpoint to populate the cache.
+        2. Deactivate the user.
+        3. Request the "me" endpoint again.
+
+    Pass criteria:
+        - The second request is rejected because the user is inactive.
+    """
+    user = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[0])
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+    response = client.get(const.USER_ME_URL, headers=headers)
+    assert response.status_code == 200, response.text
+
+    user_crud.deactivate(db_session, db_obj=user)
+    response = client.get(const.USER_ME_URL, headers=headers)
+    assert response.status_code == 400, response.text
+    assert response.json()["detail"] == "Inactive user", response.text
@@ -1,8 +1,15 @@
-import pytest
+import csv
+import io
+import json
 import logging
+
+import pytest
 from fastapi.testclient import TestClient
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 
+from app import crud
+from app.core.security import create_access_token
 from app.crud import user as user_crud
 from app.models import User
 from app.tests import const
@@ -252,3 +259,249 @@ def test_read_users_success(client: TestClient, db_session: Session):
     assert len(data) == len(
         const.SAMPLE_USER_DATA
     ), f'Actual number of users "{len(data)}" does not match expected "{len(const.SAMPLE_USER_DATA)}"'
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_update_me_password_success(
+    override_get_current_user: User, client: TestClient, db_session: Session
+):
+    """
+    Test successfully changing the current authenticated user's password.
+
+    Requirements:
+        - A user is authenticated.
+
+    Steps:
+        1. Send a PUT request to the "me" endpoint with a new password.
+        2. Log in with the new password.
+
+    Pass criteria:
+        - Both requests are successful.
+    """
+    user = override_get_current_user
+    new_password = "new password"
+    response = client.put(const.USER_ME_URL, json={"password": new_password})
+    assert response.status_code == 200, response.text
+    payload = {"username": user.email, "password": new_password}
+    response = client.post(const.LOGIN_URL, data=payload)
+    assert response.status_code == 200, response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_read_users_cursor_pagination(client: TestClient, db_session: Session):
+    """
+    Test walking through the users list with cursor pagination.
+
+    Requirements:
+        - Multiple users exist in the system.
+        - The current user has superuser privileges.
+
+    Steps:
+        1. Request the first page with a page size of one.
+        2. Follow the `X-Next-Cursor` header until it is missing.
+
+    Pass criteria:
+        - Every user is returned exactly once, in id order.
+        - The last page does not carry a next cursor.
+    """
+    for user in const.SAMPLE_USER_DATA[1:]:
+        add_model_to_db(db_session, User, user)
+    ids = []
+    params = {"limit": 1}
+    while True:
+        response = client.get(const.USER_URL, params=params)
+        assert response.status_code == 200, response.text
+        ids.extend(user["id"] for user in response.json())
+        next_cursor = response.headers.get("X-Next-Cursor")
+        if next_cursor is None:
+            break
+        params["cursor"] = next_cursor
+    LOG.debug(f"Paginated user ids: {ids}")
+    assert ids == sorted(ids), f"Users are not ordered by id: {ids}"
+    assert len(ids) == len(
+        const.SAMPLE_USER_DATA
+    ), f'Actual number of users "{len(ids)}" does not match expected "{len(const.SAMPLE_USER_DATA)}"'
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_read_users_invalid_cursor(client: TestClient):
+    """
+    Test that a malformed cursor is rejected.
+
+    Requirements:
+        - The current user has superuser privileges.
+
+    Steps:
+        1. Request the users list with a malformed cursor.
+
+    Pass criteria:
+        - The server responds with a 400 Bad Request status.
+    """
+    response = client.get(const.USER_URL, params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400, response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_retrieve_me_not_modified(override_get_current_user: User, client: TestClient):
+    """
+    Test conditional requests of the current user.
+
+    Requirements:
+        - A user is authenticated.
+
+    Steps:
+        1. Retrieve the current user and keep its validators.
+        2. Retrieve it again with `If-None-Match`, then with `If-Modified-Since`.
+        3. Retrieve it with an outdated entity tag.
+
+    Pass criteria:
+        - Matching validators get an empty 304 response with the same ETag.
+        - An outdated entity tag gets the full user.
+    """
+    response = client.get(const.USER_ME_URL)
+    assert response.status_code == 200, response.text
+    etag, last_modified = response.headers["ETag"], response.headers["Last-Modified"]
+
+    response = client.get(const.USER_ME_URL, headers={"If-None-Match": etag})
+    assert response.status_code == 304, response.text
+    assert response.headers["ETag"] == etag, "304 response should repeat the ETag!"
+    response = client.get(
+        const.USER_ME_URL, headers={"If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304, response.text
+
+    response = client.get(const.USER_ME_URL, headers={"If-None-Match": '"user-0-0"'})
+    assert response.status_code == 200, response.text
+    assert response.json()["id"] == override_get_current_user.id, response.text
+
+
+def test_retrieve_me_updated_elsewhere(client: TestClient, db_session: Session):
+    """
+    Test conditional requests of the current user updated by another worker.
+
+    Requirements:
+        - User is previously created in the database.
+
+    Steps:
+        1. Retrieve the current user, which caches its principal, and keep its ETag.
+        2. Update the user without invalidating the principal cache.
+        3. Retrieve the current user again with the ETag.
+
+    Pass criteria:
+        - The updated user is returned with a new ETag instead of a 304.
+    """
+    user = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[0])
+    headers = {"Authorization": f"Bearer {create_access_token(user.id)}"}
+    response = client.get(const.USER_ME_URL, headers=headers)
+    assert response.status_code == 200, response.text
+    etag = response.headers["ETag"]
+
+    db_session.execute(update(User).where(User.id == user.id).values(first_name="jane"))
+    db_session.commit()
+    response = client.get(const.USER_ME_URL, headers={**headers, "If-None-Match": etag})
+    LOG.debug(f"Response after the update: {response.text}")
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] != etag, "ETag did not change after an update!"
+    assert response.json()["first_name"] == "jane", response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_retrieve_user_by_id_not_modified(client: TestClient, db_session: Session):
+    """
+    Test conditional requests of a user by id.
+
+    Requirements:
+        - The current user has superuser privileges.
+        - Another user exists.
+
+    Steps:
+        1. Retrieve the other user and keep its ETag.
+        2. Retrieve it again with the ETag.
+        3. Update the user and retrieve it again with the ETag.
+
+    Pass criteria:
+        - The matching ETag gets a 304, the update changes the ETag.
+    """
+    other = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[1])
+    url = f"{const.USER_URL}/{other.id}"
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    etag = response.headers["ETag"]
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304, response.text
+
+    user_crud.update(db_session, db_obj=other, obj_in={"first_name": "jane"})
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200, response.text
+    assert response.headers["ETag"] != etag, "ETag did not change after an update!"
+    assert response.json()["first_name"] == "jane", response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_retrieve_user_deleted_after_validators(
+    client: TestClient, db_session: Session, monkeypatch: pytest.MonkeyPatch
+):
+    """
+    Test retrieving a user deleted between the read of its validators and its load.
+
+    Requirements:
+        - The current user has superuser privileges.
+        - Another user exists.
+
+    Steps:
+        1. Make the full load of the user find nothing, as after a concurrent delete.
+        2. Retrieve the user by id.
+
+    Pass criteria:
+        - The user is not found instead of failing the request.
+    """
+    other = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[1])
+
+    async def _deleted(db, id):  # pylint: disable=redefined-builtin
+        return None
+
+    monkeypatch.setattr(crud.async_user, "get", _deleted)
+    response = client.get(f"{const.USER_URL}/{other.id}")
+    assert response.status_code == 404, response.text
+    assert response.json() == {"detail": "User not found"}
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_export_users(client: TestClient, db_session: Session):
+    """
+    Test exporting every user as NDJSON and CSV.
+
+    Requirements:
+        - The current user has superuser privileges.
+        - Several users exist.
+
+    Steps:
+        1. Export the users as NDJSON.
+        2. Export the users as CSV.
+
+    Pass criteria:
+        - Every user is exported once in ID order without passwords.
+        - The CSV export starts with a header row.
+    """
+    for data in const.SAMPLE_USER_DATA[1:]:
+        add_model_to_db(db_session, User, data)
+    expected = [user.email for user in user_crud.get_multi(db_session)]
+
+    response = client.get(const.USER_EXPORT_URL)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/x-ndjson", response.headers
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [line["email"] for line in lines] == expected, f"Unexpected lines {lines}"
+    assert all("password" not in line for line in lines), "Passwords were exported!"
+
+    response = client.get(const.USER_EXPORT_URL, params={"format": "csv"})
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv"), response.headers
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["email"] for row in rows] == expected, f"Unexpected rows {rows}"
@@ -0,0 +1,177 @@
+import asyncio
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, exc
+from sqlalchemy.engine import Engine
+
+from app.core.database import engines
+from app.core.pool import (
+    InstrumentedQueuePool,
+    POOL_METRICS,
+    check_liveness,
+    instrument,
+    pool_status,
+)
+from app.tests import const, env
+
+
+LOG = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="function")
+def instrumented_engine() -> Engine:
+    """Provide an engine with a single connection instrumented pool on the test database."""
+    engine = instrument(
+        create_engine(
+            env.SQLALCHEMY_DATABASE_URL,
+            poolclass=InstrumentedQueuePool,
+            pool_logging_name="test-pool",
+            pool_size=1,
+            max_overflow=0,
+            pool_timeout=0.1,
+            connect_args={"check_same_thread": False},
+        )
+    )
+    POOL_METRICS.pop("test-pool", None)
+    yield engine
+    engine.dispose()
+    POOL_METRICS.pop("test-pool", None)
+
+
+def test_pool_status_counts_checkouts(instrumented_engine: Engine):
+    """
+    Test that the pool status reports live connection counts and checkout timeouts.
+
+    Requirements:
+        - An instrumented pool of one connection without overflow.
+
+    Steps:
+        1. Check out the only connection and read the pool status.
+        2. Try to check out another connection.
+        3. Return the connection, dispose the pool and read the pool status again.
+
+    Pass criteria:
+        - The checked out connection is reported while it is held.
+        - The failed checkout is counted as a timeout.
+        - Metrics survive disposing the pool.
+    """
+    with instrumented_engine.connect():
+        status = pool_status(instrumented_engine)
+        LOG.debug("Pool status while checked out: %s", status)
+        assert status["checked_out"] == 1, f"Unexpected status: {status}"
+        assert status["idle"] == 0, f"Unexpected status: {status}"
+        with pytest.raises(exc.TimeoutError):
+            instrumented_engine.connect()
+
+    instrumented_engine.dispose()
+    status = pool_status(instrumented_engine)
+    LOG.debug("Pool status after dispose: %s", status)
+    assert status["checked_out"] == 0, f"Unexpected status: {status}"
+    assert status["checkouts"] == 1, f"Unexpected status: {status}"
+    assert status["timeouts"] == 1, f"Unexpected status: {status}"
+    assert status["wait_max"] >= 0.1, f"Timeout wait not recorded: {status}"
+
+
+def test_check_liveness_disposes_failed_pool():
+    """
+    Test that the liveness check drops the connections of an unreachable database.
+
+    Requirements:
+        - An instrumented engine pointing to a database file that cannot be opened.
+
+    Steps:
+        1. Run the liveness check on the engine.
+
+    Pass criteria:
+        - The check does not raise and the pool holds no connection afterwards.
+    """
+    engine = create_engine(
+        "sqlite:////nonexistent/directory/test.db", poolclass=InstrumentedQueuePool
+    )
+    asyncio.run(check_liveness({"broken": engine}))
+    assert engine.pool.checkedin() == 0, "Pool should hold no connection!"
+
+
+def test_check_liveness_survives_driver_errors():
+    """
+    Test that errors raised by the driver outside of the DB-API do not end the check.
+
+    Requirements:
+        - Two instrumented engines, one whose connections fail with an OSError.
+
+    Steps:
+        1. Run the liveness check on both engines.
+
+    Pass criteria:
+        - The check does not raise and still pings the healthy engine.
+        - The failing pool is reported unhealthy with one failure.
+    """
+
+    def _unreachable():
+        raise OSError("Network is unreachable")
+
+    broken = create_engine(
+        "sqlite://",
+        creator=_unreachable,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name="test-unreachable",
+    )
+    healthy = create_engine(
+        "sqlite://", poolclass=InstrumentedQueuePool, pool_logging_name="test-healthy"
+    )
+    try:
+        asyncio.run(check_liveness({"broken": broken, "healthy": healthy}))
+        status = pool_status(broken)
+        LOG.debug("Status of the unreachable pool: %s", status)
+        assert status["healthy"] is False, f"Unexpected status: {status}"
+        assert status["liveness_failures"] == 1, f"Unexpected status: {status}"
+        assert pool_status(healthy)["healthy"] is True
+        assert pool_status(healthy)["checkouts"] == 1
+    finally:
+        POOL_METRICS.pop("test-unreachable", None)
+        POOL_METRICS.pop("test-healthy", None)
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_read_pool_metrics(client: TestClient):
+    """
+    Test retrieving the connection pool metrics as a superuser.
+
+    Requirements:
+        - The current user has superuser privileges.
+
+    Steps:
+        1. Send a GET request to the pool metrics endpoint.
+
+    Pass criteria:
+        - Every configured engine is reported with its connection counts and wait times.
+    """
+    response = client.get(const.POOL_METRICS_URL)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert set(data) == set(engines), f"Unexpected pools: {list(data)}"
+    for name, status in data.items():
+        for key in ("size", "checked_out", "idle", "overflow", "wait_avg", "timeouts"):
+            assert key in status, f"{key} missing from pool {name}: {status}"
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_pool_metrics_forbidden(client: TestClient):
+    """
+    Test that a regular user cannot retrieve the connection pool metrics.
+
+    Requirements:
+        - The current user has no superuser privileges.
+
+    Steps:
+        1. Send a GET request to the pool metrics endpoint.
+
+    Pass criteria:
+        - The request is rejected.
+    """
+    response = client.get(const.POOL_METRICS_URL)
+    assert response.status_code == 400, response.text
@@ -0,0 +1,93 @@
+import logging
+import os
+import tempfile
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.core.replicas import WROTE_KEY, ReplicaSet, RoutingSession
+from app.crud import user as user_crud
+from app.models import User
+from app.tests import const
+from app.tests.utils import add_model_to_db
+
+
+LOG = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="function")
+def replica_engines() -> list[Engine]:
+    """Provide two SQLite file databases standing in for read replicas."""
+    directory = tempfile.mkdtemp()
+    engines = [
+        create_engine(f"sqlite:///{os.path.join(directory, f'replica{i}.db')}")
+        for i in range(2)
+    ]
+    for engine in engines:
+        Base.metadata.create_all(bind=engine)
+    yield engines
+    for engine in engines:
+        engine.dispose()
+
+
+def test_replica_set_round_robin(replica_engines: list[Engine]):
+    """
+    Test that replicas are chosen in turn and failed replicas are skipped.
+
+    Requirements:
+        - Two replica engines.
+
+    Steps:
+        1. Choose a replica four times.
+        2. Mark the first replica as down and choose again.
+        3. Mark every replica as down and choose again.
+
+    Pass criteria:
+        - Replicas alternate, a down replica is skipped and no replica is returned when all are down.
+    """
+    replicas = ReplicaSet(replica_engines, retry_after=60)
+    chosen = [replicas.choose() for _ in range(4)]
+    assert chosen == replica_engines * 2, f"Replicas not chosen in turn: {chosen}"
+    replicas.mark_down(replica_engines[0])
+    assert [replicas.choose() for _ in range(2)] == [replica_engines[1]] * 2
+    replicas.mark_down(replica_engines[1])
+    assert replicas.choose() is None, "No replica should be available!"
+
+
+def test_routing_session_reads_own_writes(
+    replica_engines: list[Engine], db_engine_session: tuple
+):
+    """
+    Test that reads go to a replica until the request writes.
+
+    Requirements:
+        - A primary database and a replica containing different users.
+
+    Steps:
+        1. Read a user known only to the replica.
+        2. Flag the request as written and read a user known only to the primary.
+
+    Pass criteria:
+        - The first read is served by the replica, the second one by the primary.
+    """
+    primary, _ = db_engine_session
+    with Session(primary) as db:
+        add_model_to_db(db, User, const.SAMPLE_USER_DATA[0])
+    for engine in replica_engines:
+        with Session(engine) as db:
+            add_model_to_db(db, User, const.SAMPLE_USER_DATA[1])
+
+    request_state = SimpleNamespace()
+    replicas = ReplicaSet(replica_engines, retry_after=60)
+    with RoutingSession(
+        primary=primary, replicas=replicas, request_state=request_state
+    ) as db:
+        replica_user = user_crud.get(db, email=const.SAMPLE_USER_DATA[1]["email"])
+        assert replica_user is not None, "Read should be served by a replica!"
+        setattr(request_state, WROTE_KEY, True)
+        primary_user = user_crud.get(db, email=const.SAMPLE_USER_DATA[0]["email"])
+        assert primary_user is not None, "Read after write should use the primary!"
@@ -0,0 +1,66 @@
+import json
+import logging
+from datetime import datetime, timezone
+from decimal import Decimal
+
+from pydantic import TypeAdapter
+
+from app.core.responses import FastJSONResponse
+from app.schemas import User
+from app.tests import const
+
+
+LOG = logging.getLogger(__name__)
+
+
+def test_fast_json_response_matches_pydantic():
+    """
+    Test that the orjson response renders users like pydantic's JSON serialization.
+
+    Requirements:
+        - Users with naive and UTC creation dates.
+
+    Steps:
+        1. Render the users with the fast response class.
+        2. Serialize them with pydantic.
+
+    Pass criteria:
+        - Both serializations decode to the same data.
+    """
+    users = [
+        User(id=i, create_date=created, **const.SAMPLE_USER_DATA[i])
+        for i, created in enumerate(
+            [
+                datetime(2026, 10, 18, 12, 30, 1, 5),
+                datetime(2026, 10, 18, tzinfo=timezone.utc),
+            ]
+        )
+    ]
+    adapter = TypeAdapter(list[User])
+    rendered = FastJSONResponse(adapter.dump_python(users, mode="json")).body
+    LOG.debug(f"Rendered users: {rendered}")
+    assert json.loads(rendered) == json.loads(adapter.dump_json(users)), rendered
+    assert json.loads(FastJSONResponse({1: users[1].create_date}).body) == {
+        "1": "2026-10-18T00:00:00Z"
+    }, "Datetimes should be rendered like pydantic does!"
+
+
+def test_fast_json_response_fallback():
+    """
+    Test that values orjson does not support are rendered with `jsonable_encoder`.
+
+    Requirements:
+        - None.
+
+    Steps:
+        1. Render a decimal and a pydantic model.
+
+    Pass criteria:
+        - Both are rendered as JSON values.
+    """
+    user = User(id=1, **const.SAMPLE_USER_DATA[0])
+    rendered = json.loads(
+        FastJSONResponse({"amount": Decimal("1.5"), "user": user}).body
+    )
+    assert rendered["amount"] == 1.5, rendered
+    assert rendered["user"]["email"] == user.email, rendered
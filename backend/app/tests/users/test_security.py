@@ -0,0 +1,178 @@
+import asyncio
+import logging
+
+import pytest
+from fastapi.testclient import TestClient
+from jose import jwt
+
+from app.core import settings
+from app.core.cache import token_cache
+from app.core.hashing import HashingExecutor, HashingQueueFull, hash_executor
+from app.core.security import (
+    create_access_token,
+    decode_access_token,
+    get_password_hash,
+    get_password_hash_async,
+    verify_password,
+    verify_password_async,
+)
+from app.tests import const
+
+
+LOG = logging.getLogger(__name__)
+
+
+def test_hash_password_on_executor():
+    """
+    Test hashing and verifying a password through the hashing executor.
+
+    Requirements:
+        - Hashing executor is configured with at least one worker process.
+
+    Steps:
+        1. Hash a password with the async entry point.
+        2. Verify the password with the async entry point.
+        3. Inspect the executor metrics.
+
+    Pass criteria:
+        - The hash is verifiable with the synchronous helper.
+        - The async verification succeeds for the right password and fails for a wrong one.
+        - Completed jobs are reported together with queue wait and hash time.
+    """
+    password = const.SAMPLE_USER_DATA[0]["password"]
+    before = hash_executor.metrics.snapshot()
+
+    async def _hash_and_verify() -> tuple[str, bool, bool]:
+        hashed = await get_password_hash_async(password)
+        return (
+            hashed,
+            await verify_password_async(password, hashed),
+            await verify_password_async("wrong password", hashed),
+        )
+
+    hashed, valid, invalid = asyncio.run(_hash_and_verify())
+    after = hash_executor.metrics.snapshot()
+    LOG.debug(f"Hashing metrics: {after}")
+
+    assert verify_password(password, hashed), "Hash from executor is not verifiable!"
+    assert valid is True, "Correct password should be verified!"
+    assert invalid is False, "Wrong password should not be verified!"
+    assert (
+        after["completed"] - before["completed"] == 3
+    ), f"Expected 3 completed jobs, got {after['completed'] - before['completed']}"
+    assert after["hash_time_avg"] > 0, "Hash time should be recorded!"
+    assert after["queue_wait_max"] >= 0, "Queue wait should be recorded!"
+
+
+def test_hash_executor_rejects_when_queue_is_full():
+    """
+    Test that the hashing executor rejects jobs beyond its queue depth.
+
+    Requirements:
+        - Inline executor without spare queue slots.
+
+    Steps:
+        1. Occupy the only executor slot.
+        2. Submit another job.
+
+    Pass criteria:
+        - HashingQueueFull is raised and counted as rejected.
+    """
+    executor = HashingExecutor(pool_size=0, queue_depth=0, timeout=1)
+    executor._slots.acquire()  # pylint: disable=protected-access
+    with pytest.raises(HashingQueueFull):
+        executor.run(get_password_hash, "password")
+    assert executor.metrics.snapshot()["rejected"] == 1, "Rejection not counted!"
+
+
+def test_hash_executor_inline_mode():
+    """
+    Test running the hashing executor without worker processes.
+
+    Requirements:
+        - Executor configured with zero workers.
+
+    Steps:
+        1. Hash a password synchronously.
+
+    Pass criteria:
+        - The hash is valid and the job is counted as completed.
+    """
+    executor = HashingExecutor(pool_size=0, queue_depth=1, timeout=1)
+    hashed = executor.run(get_password_hash, "password")
+    assert verify_password("password", hashed), "Inline hash is not verifiable!"
+    assert executor.metrics.snapshot()["completed"] == 1, "Job not counted!"
+
+
+def test_decode_access_token_is_cached():
+    """
+    Test that a repeated access token is served from the token cache.
+
+    Requirements:
+        - A valid access token.
+
+    Steps:
+        1. Decode the same token twice.
+        2. Inspect the token cache counters.
+
+    Pass criteria:
+        - Both decodes return the token subject.
+        - The second decode hits the cache.
+    """
+    token = create_access_token(42)
+    hits_before = token_cache.stats()["hits"]
+    first = decode_access_token(token)
+    second = decode_access_token(token)
+    stats = token_cache.stats()
+    LOG.debug(f"Token cache stats: {stats}")
+    hits = stats["hits"] - hits_before
+    assert first.sub == second.sub == 42, f"Unexpected subjects {first}, {second}"
+    assert hits == 1, f"Expected 1 hit, got {hits}"
+
+
+def test_decode_access_token_flushes_on_key_rotation(monkeypatch: pytest.MonkeyPatch):
+    """
+    Test that rotating the secret key invalidates cached tokens.
+
+    Requirements:
+        - A valid access token signed with the current key.
+
+    Steps:
+        1. Decode the token to populate the cache.
+        2. Change the secret key.
+        3. Decode the token again.
+
+    Pass criteria:
+        - The second decode fails signature verification.
+    """
+    token = create_access_token(42)
+    decode_access_token(token)
+    monkeypatch.setattr(settings, "SECRET_KEY", "rotated secret")
+    with pytest.raises(jwt.JWTError):
+        decode_access_token(token)
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_read_hashing_metrics(client: TestClient):
+    """
+    Test retrieving the hashing executor metrics as a superuser.
+
+    Requirements:
+        - The current user has superuser privileges.
+
+    Steps:
+        1. Hash a password through the executor.
+        2. Send a GET request to the hashing metrics endpoint.
+
+    Pass criteria:
+        - The counters and timings of the executor are reported.
+    """
+    asyncio.run(get_password_hash_async(const.SAMPLE_USER_DATA[0]["password"]))
+    response = client.get(const.HASHING_METRICS_URL)
+    LOG.debug(f"Hashing metrics: {response.text}")
+    assert response.status_code == 200, response.text
+    metrics = response.json()
+    assert metrics == hash_executor.metrics.snapshot(), metrics
+    assert metrics["completed"] >= 1, metrics
+    assert {"queue_wait_avg", "queue_wait_max", "hash_time_avg"} <= metrics.keys()
@@ -0,0 +1,93 @@
+import logging
+
+import pytest
+from fastapi import APIRouter, Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core import settings
+from app.core.deps import get_async_db
+from app.core.unit_of_work import UnitOfWorkRoute
+from app.crud import async_user
+from app.crud import user as user_crud
+from app.schemas import UserCreate
+from app.tests import const
+
+
+LOG = logging.getLogger(__name__)
+
+FAILING_URL = "/unit-of-work/failing-signup"
+
+
+@pytest.fixture(scope="function")
+def unit_of_work(monkeypatch: pytest.MonkeyPatch):
+    """Enable the request scoped unit of work."""
+    monkeypatch.setattr(settings, "DB_UNIT_OF_WORK", True)
+
+
+@pytest.fixture(scope="function")
+def failing_route(app: FastAPI):
+    """Register a route that writes a user and then fails."""
+    router = APIRouter(route_class=UnitOfWorkRoute)
+
+    @router.post(FAILING_URL)
+    async def failing_signup(db: AsyncSession = Depends(get_async_db)):
+        await async_user.create(db, obj_in=UserCreate(**const.SAMPLE_USER_DATA[0]))
+        raise HTTPException(status_code=409, detail="Conflict after write")
+
+    app.include_router(router)
+    yield
+    app.router.routes = [
+        route
+        for route in app.router.routes
+        if getattr(route, "path", "") != FAILING_URL
+    ]
+
+
+@pytest.mark.usefixtures("unit_of_work")
+def test_unit_of_work_commits_successful_request(
+    client: TestClient, db_session: Session
+):
+    """
+    Test that a successful request is committed by the unit of work.
+
+    Requirements:
+        - Unit of work is enabled.
+
+    Steps:
+        1. Create a user via the open endpoint.
+        2. Retrieve the user from the database.
+
+    Pass criteria:
+        - The user is persisted.
+    """
+    payload = const.SAMPLE_USER_DATA[1]
+    response = client.post(const.USER_CREATE_OPEN_URL, json=payload)
+    assert response.status_code == 200, response.text
+    assert response.json()["create_date"] is not None, "Server default not fetched!"
+    user = user_crud.get(db_session, email=payload["email"])
+    assert user is not None, f"User not found in database: {payload}"
+
+
+@pytest.mark.usefixtures("unit_of_work", "failing_route")
+def test_unit_of_work_rolls_back_failed_request(
+    client: TestClient, db_session: Session
+):
+    """
+    Test that a failed request is rolled back by the unit of work.
+
+    Requirements:
+        - Unit of work is enabled.
+
+    Steps:
+        1. Call an endpoint that creates a user and then raises an HTTP error.
+        2. Retrieve the user from the database.
+
+    Pass criteria:
+        - The error is returned and the user is not persisted.
+    """
+    response = client.post(FAILING_URL)
+    assert response.status_code == 409, response.text
+    user = user_crud.get(db_session, email=const.SAMPLE_USER_DATA[0]["email"])
+    assert user is None, "User should have been rolled back!"
@@ -0,0 +1,27 @@
+import logging
+
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models import Category, Exercise
+from app.tests import const
+
+
+LOG = logging.getLogger(__name__)
+
+
+@pytest.fixture(scope="function")
+def exercises(db_session: Session) -> list[Exercise]:
+    """
+    Create the sample categories and exercises.
+
+    :param db_session: The database session to use for adding the catalog.
+    :return: The added exercises.
+    """
+    db_session.add_all(Category(**data) for data in const.SAMPLE_CATEGORY_DATA)
+    db_session.flush()
+    instances = [Exercise(**data) for data in const.SAMPLE_EXERCISE_DATA]
+    db_session.add_all(instances)
+    db_session.commit()
+    LOG.debug(f"Added exercises: {instances}")
+    return instances
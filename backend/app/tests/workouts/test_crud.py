@@ -0,0 +1,710 @@
+import logging
+from datetime import date, datetime, timedelta
+
+import numpy as np
+import pytest
+from sqlalchemy import event, func, select, update
+from sqlalchemy.orm import Session
+
+from app.core.leaderboard import (
+    Leaderboards,
+    RankedIndex,
+    Standing,
+    leaderboards,
+    lift_board,
+    volume_board,
+)
+from app.core.partitions import add_months, create_month_partitions
+from app.core.series import lttb
+from app.core.similarity import cooccurrence, top_k
+from app.crud import workout_session as workout_crud
+from app.crud.leaderboard import rebuild_leaderboards, sync_leaderboards
+from app.crud.progress import progress_series
+from app.crud.recommendations import exercise_neighbors
+from app.crud.records import brzycki_1rm, epley_1rm, rebuild_records
+from app.crud.training import check_rollups, rebuild_rollups, week_start
+from app.models import (
+    Exercise,
+    HistoryVersion,
+    LeaderboardEntry,
+    PersonalRecord,
+    SetEntry,
+    User,
+    WeeklyExerciseRollup,
+    WeeklyRollup,
+)
+from app.schemas import ProgressMetric, SetEntryCreate, WorkoutSessionCreate
+from app.tests import const
+from app.tests.utils import add_model_to_db
+
+
+LOG = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_create_session_with_sets(
+    create_user_model: tuple[User, dict],
+    exercises: list[Exercise],
+    db_session: Session,
+):
+    """
+    Test logging a whole session with a single insert of its sets.
+
+    Requirements:
+        - A user and the sample exercises exist.
+
+    Steps:
+        1. Log the sample session while recording the executed statements.
+        2. Read the session and its sets back.
+
+    Pass criteria:
+        - All sets are inserted with one statement.
+        - Sets without a time are dated at the start of the session, times are stored in UTC.
+    """
+    user, _ = create_user_model
+    statements = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db_session.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    try:
+        session = workout_crud.create_with_sets(
+            db_session,
+            obj_in=WorkoutSessionCreate(**const.SAMPLE_WORKOUT_DATA),
+            user_id=user.id,
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _record)
+    set_inserts = [
+        item for item in statements if item.startswith("INSERT INTO setentry")
+    ]
+    LOG.debug(f"Set inserts: {set_inserts}")
+    assert (
+        len(set_inserts) == 1
+    ), f"Sets were inserted with {len(set_inserts)} statements!"
+
+    assert session.started_at == datetime(2026, 10, 5, 18), session.started_at
+    times = [item.performed_at for item in session.sets]
+    assert times == [
+        datetime(2026, 10, 5, 18),
+        datetime(2026, 10, 5, 18),
+        datetime(2026, 10, 5, 18, 10),
+    ], f"Unexpected set times: {times}"
+    assert {item.user_id for item in session.sets} == {user.id}, "Sets lack their user!"
+    assert len(session.sets) == len(const.SAMPLE_WORKOUT_DATA["sets"])
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_remove_session_with_sets(
+    create_user_model: tuple[User, dict],
+    exercises: list[Exercise],
+    db_session: Session,
+):
+    """
+    Test deleting a session together with its sets.
+
+    Requirements:
+        - A user and the sample exercises exist.
+
+    Steps:
+        1. Log two sessions.
+        2. Delete the first one.
+
+    Pass criteria:
+        - Only the sets of the other session remain.
+    """
+    user, _ = create_user_model
+    obj_in = WorkoutSessionCreate(**const.SAMPLE_WORKOUT_DATA)
+    first = workout_crud.create_with_sets(db_session, obj_in=obj_in, user_id=user.id)
+    second = workout_crud.create_with_sets(db_session, obj_in=obj_in, user_id=user.id)
+
+    removed = workout_crud.remove(db_session, id=first.id)
+    assert removed.id == first.id, f"Unexpected removed session {removed}"
+    session_ids = set(db_session.scalars(select(SetEntry.session_id)))
+    LOG.debug(f"Sessions with sets: {session_ids}")
+    assert session_ids == {second.id}, f"Sets of the removed session remain!"
+    count = db_session.scalar(select(func.count()).select_from(SetEntry))
+    assert count == len(const.SAMPLE_WORKOUT_DATA["sets"]), f"Unexpected {count} sets"
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_remove_only_by_primary_key(
+    create_user_model: tuple[User, dict],
+    exercises: list[Exercise],
+    db_session: Session,
+):
+    """
+    Test that a removal cannot delete more than one record.
+
+    Requirements:
+        - A user and the sample exercises exist.
+
+    Steps:
+        1. Log two sessions.
+        2. Remove by user, by a list of IDs and by ID with an extra filter.
+
+    Pass criteria:
+        - Every removal not selecting a single primary key raises ValueError.
+        - The sessions and their sets are kept.
+    """
+    user, _ = create_user_model
+    obj_in = WorkoutSessionCreate(**const.SAMPLE_WORKOUT_DATA)
+    first = workout_crud.create_with_sets(db_session, obj_in=obj_in, user_id=user.id)
+    second = workout_crud.create_with_sets(db_session, obj_in=obj_in, user_id=user.id)
+
+    for filters in (
+        {"user_id": user.id},
+        {"id": [first.id, second.id]},
+        {"id": first.id, "user_id": user.id},
+    ):
+        LOG.debug(f"Removing by {filters}")
+        with pytest.raises(ValueError):
+            workout_crud.remove(db_session, **filters)
+    session_ids = set(db_session.scalars(select(SetEntry.session_id)))
+    assert session_ids == {first.id, second.id}, f"Sets were deleted: {session_ids}"
+
+
+def test_month_partitions(db_session: Session):
+    """
+    Test the month arithmetic of the partitions and their creation on SQLite.
+
+    Requirements:
+        - Database session available.
+
+    Steps:
+        1. Add months across year boundaries.
+        2. Create partitions on the SQLite test database.
+
+    Pass criteria:
+        - Months wrap around years in both directions.
+        - Nothing is created on databases without partitioning.
+    """
+    assert add_months(date(2026, 11, 17), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 31), -1) == date(2025, 12, 1)
+    assert add_months(date(2026, 10, 1), 0) == date(2026, 10, 1)
+    created = create_month_partitions(
+        db_session.connection(), SetEntry.__tablename__, date(2026, 10, 1), 3
+    )
+    assert created == [], f"Partitions created on SQLite: {created}"
+
+
+def _weeks(db_session: Session) -> list[tuple]:
+    rows = db_session.scalars(select(WeeklyRollup).order_by(WeeklyRollup.week))
+    return [(row.week, row.sessions, row.sets, row.reps, row.volume) for row in rows]
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_rollups_follow_writes(
+    create_user_model: tuple[User, dict],
+    exercises: list[Exercise],
+    db_session: Session,
+):
+    """
+    Test that the weekly rollups are maintained by every write.
+
+    Requirements:
+        - A user and the sample exercises exist.
+
+    Steps:
+        1. Log the sample session and a session in the following week.
+        2. Append a set to the first session.
+        3. Delete the second session.
+
+    Pass criteria:
+        - The rollups hold the totals of the logged sets after every step.
+        - Weeks without any training left are removed.
+        - The consistency check finds no mismatch.
+    """
+    user, _ = create_user_model
+    first = workout_crud.create_with_sets(
+        db_session,
+        obj_in=WorkoutSessionCreate(**const.SAMPLE_WORKOUT_DATA),
+        user_id=user.id,
+    )
+    second = workout_crud.create_with_sets(
+        db_session,
+        obj_in=WorkoutSessionCreate(
+            started_at=datetime(2026, 10, 12, 7),
+            sets=[{"exercise_id": 2, "reps": 10, "weight": 0}],
+        ),
+        user_id=user.id,
+    )
+    monday, next_monday = date(2026, 10, 5), date(2026, 10, 12)
+    assert _weeks(db_session) == [
+        (monday, 1, 3, 18, 5 * 100 + 5 * 105 + 8 * 140),
+        (next_monday, 1, 1, 10, 0),
+    ], f"Unexpected rollups: {_weeks(db_session)}"
+
+    workout_crud.add_sets(
+        db_session,
+        db_obj=first,
+        sets=[SetEntryCreate(exercise_id=1, reps=1, weight=120)],
+    )
+    assert _weeks(db_session)[0] == (monday, 1, 4, 19, 2265.0), _weeks(db_session)
+    bench = db_session.get(WeeklyExerciseRollup, (user.id, monday, 1))
+    assert (bench.sets, bench.reps, bench.volume) == (3, 11, 1145.0), bench
+
+    workout_crud.remove(db_session, id=second.id)
+    LOG.debug(f"Rollups: {_weeks(db_session)}")
+    assert [week for week, *_ in _weeks(db_session)] == [monday], _weeks(db_session)
+    assert db_session.get(WeeklyExerciseRollup, (user.id, next_monday, 2)) is None
+    assert check_rollups(db_session) == [], "Rollups differ from the history!"
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_rebuild_and_check_rollups(
+    create_user_model: tuple[User, dict],
+    exercises: list[Exercise],
+    db_session: Session,
+):
+    """
+    Test the consistency check and the rebuild of the rollups.
+
+    Requirements:
+        - A user and the sample exercises exist.
+
+    Steps:
+        1. Log the sample session and corrupt its rollups.
+        2. Check the rollups, rebuild them and check them again.
+
+    Pass criteria:
+        - The check reports the corrupted and the missing rows.
+        - The rebuild restores totals matching the history.
+    """
+    user, _ = create_user_model
+    workout_crud.create_with_sets(
+        db_session,
+        obj_in=WorkoutSessionCreate(**const.SAMPLE_WORKOUT_DATA),
+        user_id=user.id,
+    )
+    expected = _weeks(db_session)
+    db_session.execute(update(WeeklyRollup).values(sets=WeeklyRollup.sets + 1))
+    db_session.execute(
+        WeeklyExerciseRollup.__table__.delete().where(
+            WeeklyExerciseRollup.exercise_id == 3
+        )
+    )
+    db_session.commit()
+
+    mismatches = check_rollups(db_session)
+    LOG.debug(f"Mismatches: {mismatches}")
+    assert {(item.table, item.actual is None) for item in mismatches} == {
+        ("weeklyrollup", False),
+        ("weeklyexerciserollup", True),
+    }, f"Unexpected mismatches: {mismatches}"
+
+    assert rebuild_rollups(db_session, batch_size=1) == 1, "Unexpected user count"
+    assert _weeks(db_session) == expected, f"Rebuilt rollups: {_weeks(db_session)}"
+    assert check_rollups(db_session) == [], "Rebuilt rollups differ from history!"
+    assert week_start(datetime(2026, 10, 11, 23, 59)) == date(2026, 10, 5)
+
+
+def _records(db_session: Session) -> dict[int, tuple]:
+    db_session.expire_all()
+    return {
+        row.exercise_id: (row.best_weight, row.best_weight_reps, row.best_reps)
+        for row in db_session.scalars(select(PersonalRecord))
+    }
+
+
+def test_one_rep_max_estimates():
+    """
+    Test the vectorized one-rep maximum estimates.
+
+    Requirements:
+        - None.
+
+    Steps:
+        1. Estimate the maxima of sets of 0, 1, 10 and 40 reps.
+
+    Pass criteria:
+        - A single rep is its own maximum, sets without reps estimate 0.
+        - Brzycki's formula is not applied beyond 36 reps.
+    """
+    weight = np.array([100.0, 100.0, 100.0, 100.0])
+    reps = np.array([0, 1, 10, 40])
+    assert np.allclose(
+        epley_1rm(weight, reps), [0, 100, 100 * (1 + 10 / 30), 100 * (1 + 40 / 30)]
+    )
+    assert np.allclose(brzycki_1rm(weight, reps), [0, 100, 100 * 36 / 27, 0])
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_personal_records_follow_writes(
+    create_user_model: tuple[User, dict],
+    exercises: list[Exercise],
+    db_session: Session,
+):
+    """
+    Test that the personal records are raised by logged sets and lowered by deletions.
+
+    Requirements:
+        - A user and the sample exercises exist.
+
+    Steps:
+        1. Log the sample session, then a session with heavier and lighter sets.
+        2. Delete the second session.
+        3. Rebuild the records from the history.
+
+    Pass criteria:
+        - Records only ever improve while logging, reps at equal weight are kept at their best.
+        - Deleting the session restores the records of the remaining history.
+        - The rebuild yields the same records.
+    """
+    user, _ = create_user_model
+    workout_crud.create_with_sets(
+        db_session,
+        obj_in=WorkoutSessionCreate(**const.SAMPLE_WORKOUT_DATA),
+        user_id=user.id,
+    )
+    before = _records(db_session)
+    assert before == {1: (105.0, 5, 5), 3: (140.0, 8, 8)}, f"Records: {before}"
+
+    second = workout_crud.create_with_sets(
+        db_session,
+        obj_in=WorkoutSessionCreate(
+            sets=[
+                {"exercise_id": 1, "reps": 7, "weight": 105},
+                {"exercise_id": 1, "reps": 12, "weight": 60},
+                {"exercise_id": 3, "reps": 1, "weight": 130},
+            ]
+        ),
+        user_id=user.id,
+    )
+    after = _records(db_session)
+    LOG.debug(f"Records: {after}")
+    assert after == {1: (105.0, 7, 12), 3: (140.0, 8, 8)}, f"Records: {after}"
+    record = db_session.get(PersonalRecord, (user.id, 1))
+    assert record.epley_1rm == pytest.approx(105 * (1 + 7 / 30)), record.epley_1rm
+    assert record.brzycki_1rm == pytest.approx(105 * 36 / 30), record.brzycki_1rm
+
+    workout_crud.remove(db_session, id=second.id)
+    assert _records(db_session) == before, "Records were not lowered by the deletion!"
+
+    db_session.execute(PersonalRecord.__table__.delete())
+    db_session.commit()
+    assert rebuild_records(db_session) == 2, "Unexpected number of rebuilt records"
+    assert _records(db_session) == before, "Rebuilt records differ!"
+
+
+def test_lttb_downsampling():
+    """
+    Test the Largest-Triangle-Three-Buckets downsampling.
+
+    Requirements:
+        - None.
+
+    Steps:
+        1. Downsample a noisy series of 10000 points with one spike to 100 points.
+        2. Downsample a series shorter than the requested number of points.
+
+    Pass criteria:
+        - Exactly 100 ascending indices are kept, including the first, the last
+          and the spike.
+        - A short series is kept whole.
+    """
+    x = np.arange(10_000)
+    y = np.sin(x / 500) + np.random.default_rng(0).normal(0, 0.05, x.size)
+    y[4321] = 10
+    kept = lttb(x, y, 100)
+    LOG.debug(f"Kept indices: {kept}")
+    assert kept.size == 100, kept.size
+    assert (kept[0], kept[-1]) == (0, 9_999), kept
+    assert (np.diff(kept) > 0).all(), "Indices are not ascending!"
+    assert 4321 in kept, "The spike was dropped!"
+    assert lttb(x[:50], y[:50], 100).tolist() == list(range(50))
+
+
+def test_progress_series():
+    """
+    Test computing daily progress series from a history.
+
+    Requirements:
+        - None.
+
+    Steps:
+        1. Compute every metric over two training days, one set without reps.
+        2. Downsample a history of 1000 days to 50 points.
+
+    Pass criteria:
+        - Days reduce to their best weight, most reps, volume and best estimate.
+        - The downsampled series has 50 points, the first and last days included.
+    """
+    rows = [
+        (datetime(2026, 10, 5, 18), 5, 100.0),
+        (datetime(2026, 10, 5, 19), 3, 110.0),
+        (datetime(2026, 10, 5, 20), 0, 200.0),
+        (datetime(2026, 10, 7, 9), 8, 90.0),
+    ]
+    expected = {
+        ProgressMetric.WEIGHT: [110.0, 90.0],
+        ProgressMetric.REPS: [5.0, 8.0],
+        ProgressMetric.VOLUME: [830.0, 720.0],
+        ProgressMetric.E1RM: [110 * (1 + 3 / 30), 90 * (1 + 8 / 30)],
+    }
+    for metric, values in expected.items():
+        series = progress_series(rows, metric, 100)
+        LOG.debug(f"{metric.value} series: {series}")
+        assert series["days"] == 2, series
+        assert [point["day"] for point in series["points"]] == [
+            date(2026, 10, 5),
+            date(2026, 10, 7),
+        ]
+        assert [point["value"] for point in series["points"]] == pytest.approx(values)
+
+    start = datetime(2024, 1, 1, 12)
+    history = [(start + timedelta(days=day), 5, 100.0 + day % 7) for day in range(1000)]
+    series = progress_series(history, ProgressMetric.WEIGHT, 50)
+    assert (series["days"], len(series["points"])) == (1000, 50), series["days"]
+    assert series["points"][0]["day"] == date(2024, 1, 1)
+    assert series["points"][-1]["day"] == date(2026, 9, 26)
+    assert progress_series([], ProgressMetric.WEIGHT, 50) == {"days": 0, "points": []}
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_history_versions_follow_writes(
+    create_user_model: tuple[User, dict],
+    exercises: list[Exercise],
+    db_session: Session,
+):
+    """
+    Test that set writes move the histories they touch to a new version.
+
+    Requirements:
+        - A user and the sample exercises exist.
+
+    Steps:
+        1. Log the sample session and append a set of one exercise.
+        2. Delete the session.
+
+    Pass criteria:
+        - Each write bumps the version of the exercises it touched once.
+    """
+    user, _ = create_user_model
+
+    def versions() -> dict[int, int]:
+        rows = db_session.execute(
+            select(HistoryVersion.exercise_id, HistoryVersion.version).where(
+                HistoryVersion.user_id == user.id
+            )
+        )
+        return dict(rows.all())
+
+    session = workout_crud.create_with_sets(
+        db_session,
+        obj_in=WorkoutSessionCreate(**const.SAMPLE_WORKOUT_DATA),
+        user_id=user.id,
+    )
+    assert versions() == {1: 1, 3: 1}, versions()
+    workout_crud.add_sets(
+        db_session,
+        db_obj=session,
+        sets=[SetEntryCreate(exercise_id=3, reps=1, weight=150)],
+    )
+    assert versions() == {1: 1, 3: 2}, versions()
+    workout_crud.remove(db_session, id=session.id)
+    LOG.debug(f"Versions: {versions()}")
+    assert versions() == {1: 2, 3: 3}, versions()
+
+
+def test_ranked_index():
+    """
+    Test the ranked index of a leaderboard.
+
+    Requirements:
+        - None.
+
+    Steps:
+        1. Score four members, two of them equally, then raise one and remove one.
+        2. Read the ranks and pages of the index.
+        3. Apply random updates to an index of small chunks.
+
+    Pass criteria:
+        - Members are ranked by descending score, ties by ascending member.
+        - Updated members move, removed and unknown members have no rank.
+        - Ranks and pages across chunks match a sorted reference.
+    """
+    index = RankedIndex()
+    for member, score in ((1, 100.0), (2, 120.0), (3, 100.0), (4, 80.0)):
+        index.set(member, score)
+    assert index.top(0, 10) == [
+        Standing(1, 2, 120.0),
+        Standing(2, 1, 100.0),
+        Standing(3, 3, 100.0),
+        Standing(4, 4, 80.0),
+    ], index.top(0, 10)
+    index.set(4, 130.0)
+    index.set(1, 0)
+    LOG.debug(f"Ranking: {index.top(0, 10)}")
+    assert len(index) == 3, len(index)
+    assert index.rank(4) == Standing(1, 4, 130.0)
+    assert index.rank(3) == Standing(3, 3, 100.0)
+    assert index.rank(1) is None and index.rank(5) is None
+    assert index.top(1, 1) == [Standing(2, 2, 120.0)]
+    assert index.top(5, 10) == []
+
+    rng = np.random.default_rng(0)
+    index, scores = RankedIndex(chunk_size=4), {}
+    index.load({member: float(member % 7) for member in range(50)})
+    scores.update({member: float(member % 7) for member in range(1, 50) if member % 7})
+    for member, score in zip(rng.integers(0, 80, 500), rng.integers(-3, 20, 500)):
+        index.set(int(member), float(score))
+        scores[int(member)] = float(score)
+        if score <= 0:
+            del scores[int(member)]
+    ranking = sorted(scores, key=lambda member: (-scores[member], member))
+    assert [standing.member for standing in index.top(0, 100)] == ranking
+    assert all(
+        [standing.member for standing in index.top(skip, 3)] == ranking[skip : skip + 3]
+        for skip in range(len(ranking) + 1)
+    )
+    assert all(
+        index.rank(member).rank == rank for rank, member in enumerate(ranking, 1)
+    )
+
+
+def _log_this_week(db: Session, user_id: int, sets: list[dict]) -> int:
+    started_at = datetime.combine(week_start(date.today()), datetime.min.time())
+    session = workout_crud.create_with_sets(
+        db,
+        obj_in=WorkoutSessionCreate(started_at=started_at, sets=sets),
+        user_id=user_id,
+    )
+    return session.id
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+def test_leaderboards_follow_writes(
+    create_user_model: tuple[User, dict],
+    exercises: list[Exercise],
+    db_session: Session,
+):
+    """
+    Test that the leaderboards follow the logged sets in every process.
+
+    Requirements:
+        - Two users and the sample exercises exist.
+
+    Steps:
+        1. Both users log squats this week, the first one also benches.
+        2. Delete the heavier squat session of the second user.
+        3. Synchronize an empty store standing for another worker from the table.
+        4. Rebuild the checkpoints from the records and rollups.
+
+    Pass criteria:
+        - The store of this process is updated on commit, weekly boards sum the volume
+          per exercise and per category.
+        - The deletion lowers the scores of the second user.
+        - The other store and the rebuilt checkpoints hold the same rankings.
+    """
+    user, _ = create_user_model
+    other = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[1])
+    week = week_start(date.today())
+    _log_this_week(
+        db_session,
+        user.id,
+        [
+            {"exercise_id": 3, "reps": 5, "weight": 140},
+            {"exercise_id": 1, "reps": 5, "weight": 100},
+        ],
+    )
+    _log_this_week(db_session, other.id, [{"exercise_id": 3, "reps": 3, "weight": 120}])
+    heavy = _log_this_week(
+        db_session, other.id, [{"exercise_id": 3, "reps": 1, "weight": 160}]
+    )
+
+    lifts = lift_board(3)
+    squat_volume = volume_board("exercise", 3, week)
+    legs_volume = volume_board("category", 3, week)
+    assert leaderboards.top(lifts, 0, 10) == (
+        [Standing(1, other.id, 160.0), Standing(2, user.id, 140.0)],
+        2,
+    ), leaderboards.top(lifts, 0, 10)
+    assert leaderboards.rank(squat_volume, other.id) == (
+        Standing(2, other.id, 520.0),
+        2,
+    )
+    assert leaderboards.rank(legs_volume, user.id) == (Standing(1, user.id, 700.0), 2)
+    assert leaderboards.top(volume_board("category", 1, week), 0, 10)[1] == 1
+
+    workout_crud.remove(db_session, id=heavy)
+    LOG.debug(f"Leaderboard stats: {leaderboards.stats()}")
+    assert leaderboards.rank(lifts, other.id) == (Standing(2, other.id, 120.0), 2)
+    assert leaderboards.rank(squat_volume, other.id) == (
+        Standing(2, other.id, 360.0),
+        2,
+    )
+
+    boards = (lifts, squat_volume, legs_volume, lift_board(1))
+    expected = {board: leaderboards.top(board, 0, 10) for board in boards}
+    worker = Leaderboards(sync_interval=60)
+    sync_leaderboards(db_session, store=worker)
+    assert {board: worker.top(board, 0, 10) for board in boards} == expected
+
+    db_session.execute(LeaderboardEntry.__table__.delete())
+    db_session.commit()
+    assert rebuild_leaderboards(db_session) == 9, "Unexpected number of scores"
+    rebuilt = Leaderboards(sync_interval=60)
+    sync_leaderboards(db_session, store=rebuilt)
+    assert {board: rebuilt.top(board, 0, 10) for board in boards} == expected
+
+
+def test_exercise_neighbors():
+    """
+    Test the top-k similar exercises computed from the sparse training history.
+
+    Requirements:
+        - None.
+
+    Steps:
+        1. Count the co-occurrences of exercises trained by the same users, at once
+           and in blocks of a single exercise.
+        2. Keep the best targets of candidate pairs, with duplicates and ties.
+        3. Compute 2 neighbors of 4 exercises in 2 categories, one never trained.
+
+    Pass criteria:
+        - Blocks do not change the counts, both orders of every pair are counted.
+        - Duplicates keep their best score, ties go to the popular target.
+        - Scores are the cosine plus the category bonus, the untrained exercise is
+          completed with the popular exercises of its category.
+    """
+    users = np.array([1, 1, 2, 2, 2, 3])
+    items = np.array([0, 1, 0, 1, 2, 2])
+    counts = [
+        np.concatenate(column).tolist()
+        for column in zip(*cooccurrence(users, items, 4))
+    ]
+    LOG.debug(f"Co-occurrences: {counts}")
+    assert counts == [[0, 0, 1, 1, 2, 2], [1, 2, 0, 2, 0, 1], [2, 1, 2, 1, 1, 1]]
+    blocks = list(cooccurrence(users, items, 4, max_pairs=1))
+    assert len(blocks) == 3
+    assert [np.concatenate(column).tolist() for column in zip(*blocks)] == counts
+
+    kept = top_k(
+        np.array([0, 0, 0, 0, 1]),
+        np.array([1, 2, 2, 3, 0]),
+        np.array([0.5, 0.2, 0.9, 0.5, 0.3]),
+        2,
+        tie_breaker=np.array([0, 1, 0, 5]),
+    )
+    assert [a.tolist() for a in kept] == [
+        [0, 0, 1],
+        [0, 1, 0],
+        [2, 3, 0],
+        [0.9, 0.5, 0.3],
+    ]
+
+    source, rank, target, score = exercise_neighbors(
+        np.array([1, 2, 3, 4]),
+        np.array([1, 1, 2, 2]),
+        np.array([1, 1, 2, 2, 2, 3]),
+        np.array([1, 2, 1, 2, 3, 3]),
+        k=2,
+        category_weight=0.1,
+    )
+    assert source.tolist() == [1, 1, 2, 2, 3, 3, 4]
+    assert rank.tolist() == [0, 1, 0, 1, 0, 1, 0]
+    assert target.tolist() == [2, 3, 1, 3, 1, 2, 3]
+    assert score.tolist() == pytest.approx([1.1, 0.5, 1.1, 0.5, 0.5, 0.5, 0.1])
@@ -0,0 +1,508 @@
+import logging
+from datetime import date, datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker
+from sqlalchemy.orm import Session
+
+from app.core import settings
+from app.crud import workout_session as workout_crud
+from app.crud.recommendations import build_recommendations
+from app.crud.training import week_start
+from app.models import Exercise, User
+from app.schemas import WorkoutSessionCreate
+from app.tests import const
+from app.tests.utils import add_model_to_db
+
+
+LOG = logging.getLogger(__name__)
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_log_workout_session(exercises: list[Exercise], client: TestClient):
+    """
+    Test logging a whole session and reading it back.
+
+    Requirements:
+        - The current user is logged in.
+        - The sample exercises exist.
+
+    Steps:
+        1. Send a POST request with the sample session and its sets.
+        2. Get the session and list the sessions of the user.
+        3. Update the notes, then send null notes and an update without notes.
+
+    Pass criteria:
+        - The session is returned with its sets in time order.
+        - The session is listed for its user.
+        - Null notes are rejected, omitted notes are kept.
+    """
+    response = client.post(const.WORKOUT_URL, json=const.SAMPLE_WORKOUT_DATA)
+    LOG.debug(f"Created session: {response.text}")
+    assert response.status_code == 200, response.text
+    created = response.json()
+    assert created["started_at"] == "2026-10-05T18:00:00", created
+    assert [item["performed_at"] for item in created["sets"]] == [
+        "2026-10-05T18:00:00",
+        "2026-10-05T18:00:00",
+        "2026-10-05T18:10:00",
+    ], created["sets"]
+
+    response = client.get(f"{const.WORKOUT_URL}/{created['id']}")
+    assert response.status_code == 200, response.text
+    assert response.json() == created, "Read session differs from the created one!"
+    response = client.get(const.WORKOUT_URL)
+    assert [item["id"] for item in response.json()] == [created["id"]], response.text
+
+    url = f"{const.WORKOUT_URL}/{created['id']}"
+    response = client.put(url, json={"notes": "heavy day"})
+    assert response.status_code == 200, response.text
+    response = client.put(url, json={"notes": None})
+    assert response.status_code == 422, response.text
+    response = client.put(url, json={"ended_at": "2026-10-05T19:00:00"})
+    assert response.status_code == 200, response.text
+    assert response.json()["notes"] == "heavy day", response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_log_sets(exercises: list[Exercise], client: TestClient):
+    """
+    Test appending sets to a session and reading the history of an exercise.
+
+    Requirements:
+        - The current user is logged in.
+        - The sample exercises exist.
+
+    Steps:
+        1. Log a session without sets.
+        2. Append sets, once with an unknown exercise.
+        3. Read the set history of one exercise and delete the session.
+
+    Pass criteria:
+        - Unknown exercises are rejected.
+        - The history only holds the sets of the exercise, in time order.
+        - Deleted sessions are no longer found.
+    """
+    session = client.post(const.WORKOUT_URL, json={"notes": "legs"}).json()
+    sets_url = f"{const.WORKOUT_URL}/{session['id']}/sets"
+    response = client.post(sets_url, json=[{"exercise_id": 999, "reps": 5}])
+    assert response.status_code == 400, response.text
+
+    response = client.post(
+        sets_url,
+        json=[
+            {"exercise_id": 3, "reps": 5, "weight": 120},
+            {"exercise_id": 3, "reps": 3, "weight": 130},
+            {"exercise_id": 1, "reps": 10, "weight": 60},
+        ],
+    )
+    assert response.status_code == 200, response.text
+    assert len(response.json()) == 3, response.text
+
+    response = client.get(
+        f"{const.WORKOUT_URL}/sets", params={"exercise_id": 3, "limit": 1}
+    )
+    assert response.status_code == 200, response.text
+    assert [item["weight"] for item in response.json()] == [120], response.text
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(
+        f"{const.WORKOUT_URL}/sets", params={"exercise_id": 3, "cursor": cursor}
+    )
+    assert [item["weight"] for item in response.json()] == [130], response.text
+
+    response = client.delete(f"{const.WORKOUT_URL}/{session['id']}")
+    assert response.status_code == 200, response.text
+    response = client.get(f"{const.WORKOUT_URL}/{session['id']}")
+    assert response.status_code == 404, response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_workout_session_of_other_user(
+    exercises: list[Exercise], db_session: Session, client: TestClient
+):
+    """
+    Test that the sessions of other users are not disclosed.
+
+    Requirements:
+        - The current user is logged in.
+        - Another user logged a session.
+
+    Steps:
+        1. Get, update and delete the session of the other user.
+        2. List the sessions of the current user.
+
+    Pass criteria:
+        - Every request answers 404, the listing is empty.
+    """
+    other = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[1])
+    session = workout_crud.create_with_sets(
+        db_session,
+        obj_in=WorkoutSessionCreate(**const.SAMPLE_WORKOUT_DATA),
+        user_id=other.id,
+    )
+    url = f"{const.WORKOUT_URL}/{session.id}"
+    assert client.get(url).status_code == 404
+    assert client.put(url, json={"notes": "mine"}).status_code == 404
+    assert client.delete(url).status_code == 404
+    assert (
+        client.post(f"{url}/sets", json=[{"exercise_id": 1, "reps": 1}]).status_code
+        == 404
+    )
+    assert client.get(const.WORKOUT_URL).json() == []
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_training_rollups(exercises: list[Exercise], client: TestClient):
+    """
+    Test the weekly and per-category training totals.
+
+    Requirements:
+        - The current user is logged in.
+        - The sample exercises exist.
+
+    Steps:
+        1. Log a session this week and one 20 weeks ago.
+        2. Read the weekly and the category totals of the last 12 weeks.
+
+    Pass criteria:
+        - Only the recent week is returned, with its session count.
+        - Category totals group the sets by the category of their exercise.
+    """
+    this_week = week_start(date.today())
+    started_at = datetime.combine(this_week, datetime.min.time())
+    sets = [
+        {"exercise_id": 1, "reps": 5, "weight": 100},
+        {"exercise_id": 1, "reps": 5, "weight": 100},
+        {"exercise_id": 3, "reps": 3, "weight": 150},
+    ]
+    for start in (started_at, started_at - timedelta(weeks=20)):
+        response = client.post(
+            const.WORKOUT_URL, json={"started_at": start.isoformat(), "sets": sets}
+        )
+        assert response.status_code == 200, response.text
+
+    response = client.get(f"{const.TRAINING_URL}/weekly")
+    LOG.debug(f"Weekly totals: {response.text}")
+    assert response.status_code == 200, response.text
+    assert response.json() == [
+        {
+            "week": this_week.isoformat(),
+            "sessions": 1,
+            "sets": 3,
+            "reps": 13,
+            "volume": 1450.0,
+        }
+    ], response.text
+
+    response = client.get(f"{const.TRAINING_URL}/categories", params={"weeks": 52})
+    assert response.status_code == 200, response.text
+    totals = [(item["category_id"], item["sets"]) for item in response.json()]
+    assert totals == [(1, 2), (3, 1), (1, 2), (3, 1)], f"Unexpected totals: {totals}"
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_personal_records(exercises: list[Exercise], client: TestClient):
+    """
+    Test reading the personal records of the current user.
+
+    Requirements:
+        - The current user is logged in.
+        - The sample exercises exist.
+
+    Steps:
+        1. Log the sample session and append a heavier set.
+        2. Read the records.
+
+    Pass criteria:
+        - One record per trained exercise, raised by the appended set.
+    """
+    session = client.post(const.WORKOUT_URL, json=const.SAMPLE_WORKOUT_DATA).json()
+    client.post(
+        f"{const.WORKOUT_URL}/{session['id']}/sets",
+        json=[{"exercise_id": 3, "reps": 2, "weight": 160}],
+    )
+    response = client.get(const.RECORDS_URL)
+    LOG.debug(f"Records: {response.text}")
+    assert response.status_code == 200, response.text
+    records = {item["exercise_id"]: item for item in response.json()}
+    assert sorted(records) == [1, 3], f"Unexpected records: {records}"
+    assert (records[3]["best_weight"], records[3]["best_weight_reps"]) == (160, 2)
+    assert records[3]["best_reps"] == 8, records[3]
+    # 8 x 140 estimates a higher maximum than 2 x 160
+    assert records[3]["epley_1rm"] == pytest.approx(140 * (1 + 8 / 30)), records[3]
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_progress(exercises: list[Exercise], client: TestClient):
+    """
+    Test reading the downsampled progress series of an exercise.
+
+    Requirements:
+        - The current user is logged in.
+        - The sample exercises exist.
+
+    Steps:
+        1. Log the sample session and read the weight series of an exercise twice,
+           the second time with the entity tag of the first response.
+        2. Append a heavier set on a later day and read the series again.
+        3. Request fewer than 3 points.
+
+    Pass criteria:
+        - Sets reduce to their best weight per day, unchanged series answer 304.
+        - The write invalidates the cached series.
+        - Too few points are rejected.
+    """
+    session = client.post(const.WORKOUT_URL, json=const.SAMPLE_WORKOUT_DATA).json()
+    url = f"{const.PROGRESS_URL}/1"
+    response = client.get(url, params={"metric": "weight"})
+    LOG.debug(f"Progress: {response.text}")
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "exercise_id": 1,
+        "metric": "weight",
+        "days": 1,
+        "points": [{"day": "2026-10-05", "value": 105.0}],
+    }, response.text
+    etag = response.headers["etag"]
+    response = client.get(
+        url, params={"metric": "weight"}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304, response.text
+
+    client.post(
+        f"{const.WORKOUT_URL}/{session['id']}/sets",
+        json=[
+            {
+                "exercise_id": 1,
+                "reps": 3,
+                "weight": 110,
+                "performed_at": "2026-10-07T10:00:00Z",
+            }
+        ],
+    )
+    response = client.get(
+        url, params={"metric": "weight"}, headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200, response.text
+    points = [(point["day"], point["value"]) for point in response.json()["points"]]
+    assert points == [("2026-10-05", 105.0), ("2026-10-07", 110.0)], points
+
+    response = client.get(url, params={"points": 2})
+    assert response.status_code == 422, response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_leaderboards(
+    exercises: list[Exercise], client: TestClient, db_session: Session
+):
+    """
+    Test reading leaderboards and the position of the current user.
+
+    Requirements:
+        - The current user is logged in.
+        - The sample exercises exist.
+
+    Steps:
+        1. Log squats this week for the current user and a heavier one for another user.
+        2. Read the lift leaderboard page by page and the position of the current user.
+        3. Read the weekly category volume leaderboard of this and of a forgotten week.
+
+    Pass criteria:
+        - Users are ranked by score with their names.
+        - The weekly board sums the volume of the week, old weeks are not found.
+    """
+    other = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[1])
+    started_at = datetime.combine(week_start(date.today()), datetime.min.time())
+    workout_crud.create_with_sets(
+        db_session,
+        obj_in=WorkoutSessionCreate(
+            started_at=started_at, sets=[{"exercise_id": 3, "reps": 1, "weight": 180}]
+        ),
+        user_id=other.id,
+    )
+    response = client.post(
+        const.WORKOUT_URL,
+        json={
+            "started_at": started_at.isoformat(),
+            "sets": [{"exercise_id": 3, "reps": 5, "weight": 150}],
+        },
+    )
+    assert response.status_code == 200, response.text
+
+    url = f"{const.LEADERBOARD_URL}/exercises/3/lifts"
+    response = client.get(url, params={"limit": 1})
+    LOG.debug(f"Leaderboard: {response.text}")
+    assert response.status_code == 200, response.text
+    assert response.json() == {
+        "total": 2,
+        "standings": [
+            {
+                "rank": 1,
+                "user_id": other.id,
+                "first_name": "mike",
+                "last_name": "testified",
+                "score": 180.0,
+            }
+        ],
+    }, response.text
+    response = client.get(url, params={"skip": 1})
+    assert [item["rank"] for item in response.json()["standings"]] == [2]
+    response = client.get(f"{url}/me")
+    assert response.json() == {"total": 2, "rank": 2, "score": 150.0}, response.text
+    response = client.get(f"{const.LEADERBOARD_URL}/exercises/1/lifts/me")
+    assert response.json() == {"total": 0, "rank": None, "score": None}
+
+    url = f"{const.LEADERBOARD_URL}/categories/3/volume"
+    response = client.get(url, params={"week": date.today().isoformat()})
+    scores = [item["score"] for item in response.json()["standings"]]
+    assert scores == [750.0, 180.0], response.text
+    response = client.get(url, params={"week": "2020-01-06"})
+    assert response.status_code == 404, response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("override_get_current_user")
+def test_read_recommendations(
+    exercises: list[Exercise], client: TestClient, db_session: Session
+):
+    """
+    Test reading the similar exercises and the recommendations of the current user.
+
+    Requirements:
+        - The current user is logged in.
+        - The sample exercises exist.
+
+    Steps:
+        1. Read the recommendations before any training.
+        2. Log squats for the current user, squats and bench press for another user.
+        3. Build the neighbors and read the similar exercises and recommendations.
+        4. Log bench press for the current user before the recent weeks.
+
+    Pass criteria:
+        - Users without recent training get no recommendations.
+        - Exercises trained by the same users are similar, with their cosine score.
+        - The current user is recommended the bench press but not the squats.
+        - Exercises trained before the recent weeks are no longer recommended.
+    """
+    response = client.get(f"{const.USER_ME_URL}/recommendations")
+    assert response.status_code == 200, response.text
+    assert response.json() == []
+
+    other = add_model_to_db(db_session, User, const.SAMPLE_USER_DATA[1])
+    started_at = datetime.combine(week_start(date.today()), datetime.min.time())
+    workout_crud.create_with_sets(
+        db_session,
+        obj_in=WorkoutSessionCreate(
+            started_at=started_at,
+            sets=[
+                {"exercise_id": 1, "reps": 5, "weight": 80},
+                {"exercise_id": 3, "reps": 5, "weight": 120},
+            ],
+        ),
+        user_id=other.id,
+    )
+    response = client.post(
+        const.WORKOUT_URL,
+        json={
+            "started_at": started_at.isoformat(),
+            "sets": [{"exercise_id": 3, "reps": 5, "weight": 150}],
+        },
+    )
+    assert response.status_code == 200, response.text
+    assert build_recommendations(db_session, neighbors=5) == 2
+
+    response = client.get(f"{const.EXERCISE_URL}/1/similar")
+    LOG.debug(f"Similar exercises: {response.text}")
+    assert response.status_code == 200, response.text
+    similar = response.json()
+    assert [item["id"] for item in similar] == [3]
+    assert similar[0]["category"]["id"] == 3
+    assert similar[0]["score"] == pytest.approx(2**-0.5)
+    response = client.get(f"{const.EXERCISE_URL}/2/similar")
+    assert response.json() == []
+    response = client.get(f"{const.EXERCISE_URL}/1/similar", params={"limit": 100})
+    assert response.status_code == 422, response.text
+
+    response = client.get(f"{const.USER_ME_URL}/recommendations")
+    LOG.debug(f"Recommendations: {response.text}")
+    recommended = response.json()
+    assert [item["id"] for item in recommended] == [1]
+    assert recommended[0]["score"] == pytest.approx(2**-0.5)
+
+    long_ago = started_at - timedelta(weeks=settings.RECOMMENDATION_HISTORY_WEEKS)
+    response = client.post(
+        const.WORKOUT_URL,
+        json={
+            "started_at": long_ago.isoformat(),
+            "sets": [{"exercise_id": 1, "reps": 5, "weight": 100}],
+        },
+    )
+    assert response.status_code == 200, response.text
+    response = client.get(f"{const.USER_ME_URL}/recommendations")
+    assert response.json() == [], response.text
+
+
+@pytest.mark.parametrize("create_user_model", const.SAMPLE_USER_DATA[:1], indirect=True)
+@pytest.mark.usefixtures("get_current_superuser")
+def test_delete_logged_exercise(
+    exercises: list[Exercise],
+    client: TestClient,
+    db_session: Session,
+    async_db_sessionmaker: async_sessionmaker,
+):
+    """
+    Test that an exercise referenced by logged sets cannot be deleted until they are.
+
+    Requirements:
+        - The current user is a logged in superuser.
+        - The sample exercises exist.
+        - Foreign keys are enforced like on Postgres.
+
+    Steps:
+        1. Log a set of the first exercise.
+        2. Delete the first exercise, then an exercise that was never logged.
+        3. Delete the session of the set, then the first exercise again.
+
+    Pass criteria:
+        - The logged exercise is rejected with 400 and kept.
+        - The other exercise is deleted.
+        - The first exercise is deleted once its sets are gone.
+    """
+    engine = async_db_sessionmaker.kw["bind"].sync_engine
+
+    def _enforce_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    event.listen(engine, "connect", _enforce_foreign_keys)
+    try:
+        response = client.post(
+            const.WORKOUT_URL,
+            json={"sets": [{"exercise_id": 1, "reps": 5, "weight": 100}]},
+        )
+        assert response.status_code == 200, response.text
+        session_id = response.json()["id"]
+
+        response = client.delete(f"{const.EXERCISE_URL}/1")
+        LOG.debug(f"Delete logged exercise: {response.text}")
+        assert response.status_code == 400, response.text
+        assert response.json() == {"detail": "The exercise has logged sets."}
+        assert client.get(f"{const.EXERCISE_URL}/1").status_code == 200
+
+        response = client.delete(f"{const.EXERCISE_URL}/2")
+        assert response.status_code == 200, response.text
+
+        response = client.delete(f"{const.WORKOUT_URL}/{session_id}")
+        assert response.status_code == 200, response.text
+        response = client.delete(f"{const.EXERCISE_URL}/1")
+        assert response.status_code == 200, response.text
+    finally:
+        event.remove(engine, "connect", _enforce_foreign_keys)
@@ -0,0 +1,60 @@
+"""
+Throughput of the bulk catalog import.
+
+Generates a CSV file of ``--exercises`` exercises spread over ``--categories``
+categories, imports it into the given database and imports it again, which
+updates every row. For Postgres, point ``--url`` at an empty migrated database
+to measure the ``COPY`` path.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_catalog_import [--url sqlite:///import.db] [--exercises 100000]
+"""
+import argparse
+import csv
+import io
+import os
+import tempfile
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app.core.database import Base
+from app.core.export import ExportFormat
+from app.crud.catalog_import import import_catalog
+
+
+def make_csv(exercises: int, categories: int) -> str:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(("name", "description", "category"))
+    writer.writerows(
+        (f"exercise {i}", f"description of exercise {i}", f"category {i % categories}")
+        for i in range(exercises)
+    )
+    return buffer.getvalue()
+
+
+def main(url: str, exercises: int, categories: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    content = make_csv(exercises, categories)
+    for label in ("insert", "update"):
+        with Session(engine) as db:
+            stream = io.StringIO(content, newline="")
+            report = import_catalog(db, stream, ExportFormat.CSV)
+        print(
+            f"{label}: {report.imported} rows in {report.seconds:.2f} s"
+            f"  ({report.rows_per_second:,.0f} rows/s, {report.failed} failed)"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--url",
+        default=f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'import.db')}",
+    )
+    parser.add_argument("--exercises", type=int, default=100_000)
+    parser.add_argument("--categories", type=int, default=50)
+    args = parser.parse_args()
+    main(args.url, args.exercises, args.categories)
@@ -0,0 +1,100 @@
+"""
+Bytes on the wire and CPU cost per request of response compression.
+
+Serves a 100 user page and a 500 exercise catalog page behind
+``CompressionMiddleware``, once compressed per request and once from a
+precompressed cache entry, and reports the body size and the CPU time per
+request for every content coding.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_compression [--requests 500]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from fastapi import FastAPI, Request, Response
+
+from app.core.cache import CachedBody
+from app.core.compression import ENCODINGS, CompressionMiddleware, compressed_variants
+from app.core.http_cache import json_response, make_etag
+
+
+USERS = json.dumps(
+    [
+        {
+            "id": i,
+            "email": f"user{i}@example.com",
+            "first_name": f"first{i}",
+            "last_name": f"last{i}",
+            "is_active": True,
+            "is_superuser": False,
+            "create_date": "2026-10-18T12:00:00",
+        }
+        for i in range(100)
+    ]
+).encode()
+CATALOG = json.dumps(
+    [
+        {
+            "id": i,
+            "name": f"exercise {i}",
+            "description": f"how to perform exercise {i} with good form " * 3,
+            "category_id": i % 6,
+            "category": {"id": i % 6, "name": f"category {i % 6}"},
+        }
+        for i in range(500)
+    ]
+).encode()
+PAYLOADS = {"users": USERS, "catalog": CATALOG}
+CACHED = {
+    name: CachedBody(body, make_etag(body), {}, compressed_variants(body))
+    for name, body in PAYLOADS.items()
+}
+
+bench_app = FastAPI()
+bench_app.add_middleware(CompressionMiddleware)
+
+
+@bench_app.get("/dynamic/{name}")
+def dynamic(name: str) -> Response:
+    return Response(PAYLOADS[name], media_type="application/json")
+
+
+@bench_app.get("/cached/{name}")
+def cached(name: str, request: Request) -> Response:
+    return json_response(request, CACHED[name])
+
+
+async def measure(path: str, encoding: str, requests: int) -> tuple[int, float]:
+    transport = httpx.ASGITransport(app=bench_app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        started = time.process_time()
+        for _ in range(requests):
+            async with client.stream(
+                "GET", path, headers={"Accept-Encoding": encoding}
+            ) as response:
+                size = len(b"".join([chunk async for chunk in response.aiter_raw()]))
+        return size, (time.process_time() - started) / requests
+
+
+async def main(requests: int) -> None:
+    for name in PAYLOADS:
+        for mode in ("dynamic", "cached"):
+            for encoding in ("identity", *ENCODINGS):
+                size, cpu = await measure(f"/{mode}/{name}", encoding, requests)
+                print(
+                    f"{name:>8} {mode:>8} {encoding:>9}: {size:8d} bytes"
+                    f"  {cpu * 1000:7.3f} ms CPU/request"
+                )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
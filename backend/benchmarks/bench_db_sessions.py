@@ -0,0 +1,79 @@
+"""
+Side-by-side load test of the sync (threadpool) and async database paths.
+
+Both routes run the same user lookup, one through ``SessionLocal`` in a ``def``
+endpoint and one through ``AsyncSessionLocal`` in an ``async def`` endpoint.
+Requires the database configured by the POSTGRES_* environment variables.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_db_sessions [--requests 2000] [--concurrency 200]
+"""
+import argparse
+import asyncio
+import time
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core import deps
+
+
+bench_app = FastAPI()
+
+
+@bench_app.get("/sync")
+def sync_lookup(db: Session = Depends(deps.get_db)) -> dict:
+    return {"found": crud.user.get(db, id=1) is not None}
+
+
+@bench_app.get("/async")
+async def async_lookup(db: AsyncSession = Depends(deps.get_async_db)) -> dict:
+    return {"found": await crud.async_user.get(db, id=1) is not None}
+
+
+async def run_load(path: str, requests: int, concurrency: int) -> list[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    transport = httpx.ASGITransport(app=bench_app)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+
+        async def _one():
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(_one() for _ in range(requests)))
+    return latencies
+
+
+def report(name: str, latencies: list[float], elapsed: float) -> None:
+    latencies.sort()
+    p50 = latencies[len(latencies) // 2] * 1000
+    p99 = latencies[int(len(latencies) * 0.99) - 1] * 1000
+    print(
+        f"{name:>5}: {len(latencies) / elapsed:8.1f} req/s"
+        f"  p50 {p50:7.2f} ms  p99 {p99:7.2f} ms"
+    )
+
+
+async def main(requests: int, concurrency: int) -> None:
+    for name in ("sync", "async"):
+        await run_load(f"/{name}", min(requests, 50), concurrency)  # warm up pools
+        started = time.perf_counter()
+        latencies = await run_load(f"/{name}", requests, concurrency)
+        report(name, latencies, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
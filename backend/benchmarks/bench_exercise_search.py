@@ -0,0 +1,84 @@
+"""
+Latency of the exercise search on a large synthetic catalog.
+
+Creates the schema and ``--exercises`` exercises in the given database, then
+times ``CRUDExercise.search`` for a set of exact, prefix and misspelled queries.
+For Postgres, point ``--url`` at an empty database migrated with Alembic so
+that the search indexes exist.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_exercise_search [--url sqlite:///search.db] [--exercises 100000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.database import Base
+
+WORDS = (
+    "bench press squat deadlift row curl raise fly pull push lunge dip "
+    "incline decline barbell dumbbell cable machine kettlebell band overhead "
+    "front back side single arm leg seated standing lying hammer reverse"
+).split()
+QUERIES = ("bench press", "dumbbell curl", "kettleb", "barbel row", "sqaut")
+
+
+def seed(db: Session, exercises: int) -> None:
+    rng = random.Random(0)
+    # a realistic vocabulary, so that a term matches a fraction of the catalog
+    vocabulary = WORDS + [
+        "".join(rng.choices("abcdefghijklmnopqrstuvwxyz", k=7)) for _ in range(5000)
+    ]
+    categories = crud.category.create_many(
+        db, objs_in=[{"name": f"category {i}"} for i in range(20)]
+    )
+    crud.exercise.create_many(
+        db,
+        objs_in=(
+            {
+                "name": f"{' '.join(rng.sample(WORDS, 3))} {i}",
+                "description": " ".join(rng.choices(vocabulary, k=20)),
+                "category_id": categories[i % len(categories)].id,
+            }
+            for i in range(exercises)
+        ),
+    )
+
+
+def main(url: str, exercises: int, repeat: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        started = time.perf_counter()
+        seed(db, exercises)
+        print(f"seeded {exercises} exercises in {time.perf_counter() - started:.1f} s")
+        for query in QUERIES:
+            latencies = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                found = crud.exercise.search(db, query=query, limit=20)
+                latencies.append(time.perf_counter() - started)
+            latencies.sort()
+            print(
+                f"{query!r:>16}: {len(found):3d} results"
+                f"  p50 {latencies[len(latencies) // 2] * 1000:7.2f} ms"
+                f"  max {latencies[-1] * 1000:7.2f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--url",
+        default=f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'search.db')}",
+    )
+    parser.add_argument("--exercises", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+    main(args.url, args.exercises, args.repeat)
@@ -0,0 +1,68 @@
+"""
+Microbenchmark of the response serialization of ``UserInDB`` lists.
+
+Compares the previous path (pydantic JSON-mode dump rendered by the stdlib
+``json`` in ``JSONResponse``), ``jsonable_encoder`` followed by ``json``, and the
+orjson based ``FastJSONResponse`` used by the app, for 100 and 10,000 users.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_json [--repeat 20]
+"""
+import argparse
+import timeit
+from datetime import datetime
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from app.core.responses import FastJSONResponse
+from app.schemas import User
+
+
+ADAPTER = TypeAdapter(list[User])
+
+
+def make_users(count: int) -> list[User]:
+    return [
+        User(
+            id=i,
+            email=f"user{i}@example.com",
+            first_name=f"first{i}",
+            last_name=f"last{i}",
+            create_date=datetime(2026, 10, 18, 12, 0, i % 60),
+        )
+        for i in range(count)
+    ]
+
+
+def stdlib_response(users: list[User]) -> bytes:
+    return JSONResponse(ADAPTER.dump_python(users, mode="json")).body
+
+
+def jsonable_response(users: list[User]) -> bytes:
+    return JSONResponse(jsonable_encoder(users)).body
+
+
+def fast_response(users: list[User]) -> bytes:
+    return FastJSONResponse(ADAPTER.dump_python(users, mode="json")).body
+
+
+def main(repeat: int) -> None:
+    for count in (100, 10_000):
+        users = make_users(count)
+        number = max(1, 10_000 // count)
+        for render in (jsonable_response, stdlib_response, fast_response):
+            best = min(
+                timeit.repeat(lambda: render(users), number=number, repeat=repeat)
+            )
+            print(
+                f"{count:>6} users {render.__name__:>18}: {best / number * 1000:8.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    main(args.repeat)
@@ -0,0 +1,47 @@
+"""
+Microbenchmark of the ranked index behind the leaderboards.
+
+Loads an index with 10,000 to 1,000,000 members as on the first read of the
+checkpoint table, then measures score updates, "my position" lookups and top-100
+pages.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_leaderboard [--operations 10000]
+"""
+import argparse
+import random
+import time
+
+from app.core.leaderboard import RankedIndex
+
+
+def measure(label: str, operations: int, operation) -> None:
+    started = time.perf_counter()
+    for _ in range(operations):
+        operation()
+    elapsed = time.perf_counter() - started
+    print(f"    {label:>8}: {elapsed / operations * 1e6:8.2f} us")
+
+
+def main(operations: int) -> None:
+    rng = random.Random(0)
+    for members in (10_000, 100_000, 1_000_000):
+        index = RankedIndex()
+        scores = {member: rng.uniform(20, 300) for member in range(members)}
+        started = time.perf_counter()
+        index.load(scores)
+        print(f"{members:>9} members, loaded in {time.perf_counter() - started:.2f}s")
+        measure(
+            "update",
+            operations,
+            lambda: index.set(rng.randrange(members), rng.uniform(20, 300)),
+        )
+        measure("rank", operations, lambda: index.rank(rng.randrange(members)))
+        measure("top 100", operations, lambda: index.top(rng.randrange(1000), 100))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--operations", type=int, default=10_000)
+    args = parser.parse_args()
+    main(args.operations)
@@ -0,0 +1,56 @@
+"""
+Microbenchmark of the progress series computation for growing histories.
+
+Computes the downsampled Epley series of 1,000 to 1,000,000 sets (ten sets per
+training day) and reports the time and the serialized payload size, which stays
+bounded by the requested number of points.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_progress [--points 200] [--repeat 5]
+"""
+import argparse
+import random
+import timeit
+from datetime import datetime, timedelta
+
+from pydantic import TypeAdapter
+
+from app.crud.progress import progress_series
+from app.schemas import ProgressMetric, ProgressSeries
+
+
+ADAPTER = TypeAdapter(ProgressSeries)
+
+
+def make_history(count: int) -> list[tuple[datetime, int, float]]:
+    rng = random.Random(0)
+    start = datetime(2000, 1, 1, 18)
+    return [
+        (start + timedelta(days=i // 10, minutes=i % 10), rng.randint(1, 12), 100.0)
+        for i in range(count)
+    ]
+
+
+def render(history: list, points: int) -> bytes:
+    series = progress_series(history, ProgressMetric.E1RM, points)
+    return ADAPTER.dump_json(
+        ProgressSeries(exercise_id=1, metric=ProgressMetric.E1RM, **series)
+    )
+
+
+def main(points: int, repeat: int) -> None:
+    for count in (1_000, 10_000, 100_000, 1_000_000):
+        history = make_history(count)
+        best = min(
+            timeit.repeat(lambda: render(history, points), number=1, repeat=repeat)
+        )
+        size = len(render(history, points))
+        print(f"{count:>9} sets: {best * 1000:8.2f} ms, {size:>6} bytes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--points", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    main(args.points, args.repeat)
@@ -0,0 +1,64 @@
+"""
+Benchmark of the offline nearest-neighbor computation of the exercise catalog.
+
+Builds synthetic catalogs of 10,000 and 100,000 exercises in 100 categories with
+a Zipf-like popularity, each user training ``--per-user`` exercises mostly from
+a few favourite categories, and reports the time to compute the neighbors of
+every exercise and the number of stored rows.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_recommendations [--neighbors 20] [--per-user 30]
+"""
+import argparse
+import time
+
+import numpy as np
+
+from app.crud.recommendations import exercise_neighbors
+
+CATEGORIES = 100
+
+
+def make_history(
+    exercises: int, users: int, per_user: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    exercise_ids = np.arange(1, exercises + 1)
+    category_ids = rng.integers(CATEGORIES, size=exercises)
+    popularity = 1 / np.arange(1, exercises + 1) ** 1.1
+    by_category = [np.flatnonzero(category_ids == c) for c in range(CATEGORIES)]
+    user_ids, trained_ids = [], []
+    for user_id in range(users):
+        favourites = rng.choice(CATEGORIES, size=3, replace=False)
+        pool = np.concatenate([by_category[c] for c in favourites])
+        weights = popularity[pool] / popularity[pool].sum()
+        size = min(per_user, pool.size)
+        chosen = rng.choice(pool, size=size, replace=False, p=weights)
+        user_ids.append(np.full(size, user_id))
+        trained_ids.append(exercise_ids[chosen])
+    return (
+        exercise_ids,
+        category_ids,
+        np.concatenate(user_ids),
+        np.concatenate(trained_ids),
+    )
+
+
+def main(neighbors: int, per_user: int) -> None:
+    for exercises, users in ((10_000, 20_000), (100_000, 100_000)):
+        history = make_history(exercises, users, per_user)
+        started = time.perf_counter()
+        source, *_ = exercise_neighbors(*history, k=neighbors)
+        elapsed = time.perf_counter() - started
+        print(
+            f"{exercises:>7} exercises, {history[2].size:>8} trained pairs: "
+            f"{elapsed:7.2f} s, {source.size:>8} neighbors"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--neighbors", type=int, default=20)
+    parser.add_argument("--per-user", type=int, default=30)
+    args = parser.parse_args()
+    main(args.neighbors, args.per_user)
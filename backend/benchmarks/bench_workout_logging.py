@@ -0,0 +1,80 @@
+"""
+Throughput of logging whole workout sessions.
+
+Creates a user and a small catalog in the given database, then logs
+``--sessions`` sessions of ``--sets`` sets each, one transaction per session as
+the endpoint does. For Postgres, point ``--url`` at an empty migrated database
+so that the set table is partitioned.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_workout_logging [--url sqlite:///workouts.db] [--sessions 1000]
+"""
+import argparse
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from app import crud
+from app.core.database import Base
+from app.models import Category, Exercise, User
+from app.schemas import WorkoutSessionCreate
+
+
+def seed(db: Session, exercises: int) -> tuple[int, list[int]]:
+    user = User(email="bench@example.com", first_name="b", last_name="b", password="")
+    category = Category(name="bench")
+    category.exercises = [
+        Exercise(name=f"exercise {i}", description="") for i in range(exercises)
+    ]
+    db.add_all([user, category])
+    db.commit()
+    return user.id, [exercise.id for exercise in category.exercises]
+
+
+def main(url: str, sessions: int, sets: int) -> None:
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    rng = random.Random(0)
+    with Session(engine) as db:
+        user_id, exercise_ids = seed(db, 50)
+        started_at = datetime(2026, 1, 1)
+        payloads = [
+            WorkoutSessionCreate(
+                started_at=started_at + timedelta(days=i),
+                sets=[
+                    {
+                        "exercise_id": rng.choice(exercise_ids),
+                        "reps": rng.randint(1, 12),
+                        "weight": rng.randint(20, 200),
+                        "performed_at": started_at + timedelta(days=i, minutes=j),
+                    }
+                    for j in range(sets)
+                ],
+            )
+            for i in range(sessions)
+        ]
+        started = time.perf_counter()
+        for obj_in in payloads:
+            crud.workout_session.create_with_sets(db, obj_in=obj_in, user_id=user_id)
+        elapsed = time.perf_counter() - started
+    print(
+        f"{sessions} sessions of {sets} sets in {elapsed:.2f} s"
+        f"  ({sessions / elapsed:,.0f} sessions/s, {sessions * sets / elapsed:,.0f} sets/s)"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--url",
+        default=f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'workouts.db')}",
+    )
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--sets", type=int, default=20)
+    args = parser.parse_args()
+    main(args.url, args.sessions, args.sets)
@@ -0,0 +1,38 @@
+"""
+Precompute the most similar exercises of every exercise.
+
+Builds the sparse co-occurrence of the exercises trained by the same users and
+the category features of the catalog, keeps the ``--neighbors`` best of every
+exercise and replaces the stored neighbors in one transaction. Meant to run
+periodically, e.g. nightly.
+
+Usage (from the backend directory):
+    python build_recommendations.py [--neighbors 20]
+"""
+import argparse
+import logging
+import time
+
+from app.core import settings
+from app.core.database import SessionLocal
+from app.crud.recommendations import build_recommendations
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--neighbors", type=int, default=settings.RECOMMENDATION_NEIGHBORS
+    )
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        stored = build_recommendations(db, neighbors=args.neighbors)
+    logger.info("Stored %s neighbors in %.1fs", stored, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    main()
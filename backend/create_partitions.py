@@ -0,0 +1,35 @@
+"""
+Create the monthly partitions of the set table ahead of time.
+
+Creates the partitions of the current month and the following
+``DB_PARTITION_MONTHS_AHEAD`` months that do not exist yet. Runs on start after
+the migrations; sets of months without a partition land in the default one.
+
+Usage (from the backend directory):
+    python create_partitions.py
+"""
+import logging
+from datetime import date
+
+from app.core import settings
+from app.core.database import engine
+from app.core.partitions import create_month_partitions
+from app.models import SetEntry
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    with engine.begin() as connection:
+        created = create_month_partitions(
+            connection,
+            SetEntry.__tablename__,
+            date.today(),
+            settings.DB_PARTITION_MONTHS_AHEAD + 1,
+        )
+    logger.info("Created %s partitions of %s", len(created), SetEntry.__tablename__)
+
+
+if __name__ == "__main__":
+    main()
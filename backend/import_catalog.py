@@ -0,0 +1,47 @@
+"""
+Import exercises and their categories from a CSV or NDJSON file.
+
+CSV files need a ``name,description,category`` header, NDJSON files one object
+with the same keys per line. The format is taken from the file extension unless
+``--format`` is given.
+
+Usage (from the backend directory):
+    python import_catalog.py exercises.csv [--format csv|ndjson]
+"""
+import argparse
+import logging
+
+from app.core.database import SessionLocal
+from app.core.export import ExportFormat
+from app.crud.catalog_import import import_catalog
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path")
+    parser.add_argument("--format", choices=[item.value for item in ExportFormat])
+    args = parser.parse_args()
+    if args.format is None:
+        is_ndjson = args.path.endswith((".ndjson", ".jsonl"))
+        args.format = "ndjson" if is_ndjson else "csv"
+    import_format = ExportFormat(args.format)
+
+    with open(args.path, encoding="utf-8", newline="") as stream, SessionLocal() as db:
+        report = import_catalog(db, stream, import_format)
+    logger.info(
+        "Imported %s of %s rows in %.2fs (%.0f rows/s), %s failed",
+        report.imported,
+        report.rows,
+        report.seconds,
+        report.rows_per_second,
+        report.failed,
+    )
+    for error in report.errors:
+        logger.warning("Line %s: %s", error.line, error.error)
+
+
+if __name__ == "__main__":
+    main()
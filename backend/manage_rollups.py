@@ -0,0 +1,52 @@
+"""
+Rebuild or check the weekly training rollups.
+
+``rebuild`` recomputes the rollups from the logged sets and sessions, e.g. after
+a backfill, ``check`` compares them with the history and exits with status 1 on
+any mismatch. Both work on all users unless ``--user`` is given.
+
+Usage (from the backend directory):
+    python manage_rollups.py {rebuild,check} [--user ID ...] [--batch-size 1000]
+"""
+import argparse
+import logging
+import sys
+
+from app.core.database import SessionLocal
+from app.crud.training import ROLLUP_BATCH_SIZE, check_rollups, rebuild_rollups
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("command", choices=["rebuild", "check"])
+    parser.add_argument("--user", type=int, action="append", dest="user_ids")
+    parser.add_argument("--batch-size", type=int, default=ROLLUP_BATCH_SIZE)
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        if args.command == "rebuild":
+            rebuilt = rebuild_rollups(
+                db, user_ids=args.user_ids, batch_size=args.batch_size
+            )
+            logger.info("Rebuilt the rollups of %s users", rebuilt)
+            return 0
+        mismatches = check_rollups(
+            db, user_ids=args.user_ids, batch_size=args.batch_size
+        )
+    for mismatch in mismatches:
+        logger.warning(
+            "%s %s: expected %s, found %s",
+            mismatch.table,
+            mismatch.key,
+            mismatch.expected,
+            mismatch.actual,
+        )
+    logger.info("Found %s mismatching rollup rows", len(mismatches))
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+"""
+Rebuild the leaderboard checkpoints from the records and weekly rollups.
+
+Recomputes the scores of all users, or of the ``--user`` ones, in batches of
+users, e.g. after the migration creating the table or a rebuild of the records.
+Running workers pick the new scores up on their next synchronization.
+
+Usage (from the backend directory):
+    python rebuild_leaderboards.py [--user ID ...] [--batch-size 1000]
+"""
+import argparse
+import logging
+import time
+
+from app.core.database import SessionLocal
+from app.crud.leaderboard import LEADERBOARD_BATCH_SIZE, rebuild_leaderboards
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--user", type=int, action="append", dest="user_ids")
+    parser.add_argument("--batch-size", type=int, default=LEADERBOARD_BATCH_SIZE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        rebuilt = rebuild_leaderboards(
+            db, user_ids=args.user_ids, batch_size=args.batch_size
+        )
+    logger.info(
+        "Rebuilt %s leaderboard scores in %.1fs", rebuilt, time.perf_counter() - started
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Rebuild the personal records from the logged sets.
+
+Recomputes the records of all users, or of the ``--user`` ones, in batches of
+users, e.g. after a backfill of the set history.
+
+Usage (from the backend directory):
+    python rebuild_records.py [--user ID ...] [--batch-size 100]
+"""
+import argparse
+import logging
+import time
+
+from app.core.database import SessionLocal
+from app.crud.records import RECORDS_BATCH_SIZE, rebuild_records
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--user", type=int, action="append", dest="user_ids")
+    parser.add_argument("--batch-size", type=int, default=RECORDS_BATCH_SIZE)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        rebuilt = rebuild_records(db, user_ids=args.user_ids, batch_size=args.batch_size)
+    logger.info(
+        "Rebuilt %s records in %.1fs", rebuilt, time.perf_counter() - started
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,9 @@ python wait_for_db.py
 # Run migrations
 alembic upgrade head
 
+# Create upcoming partitions
+python create_partitions.py
+
 # Run uvicorn server
 if [ "$DEV" = "true" ]; then
     uvicorn app.main:app --host $HOST --port 8000 --reload